@@ -0,0 +1,88 @@
+"""
+Бенчмарк JSON-кодеков: сквозная стоимость одного запроса через HttpxAsyncClient.
+
+Сервер подменён httpx.MockTransport, поэтому в замер попадает только работа клиента:
+сериализация тела, логирование, декодирование и pydantic-валидация ответа.
+Для каждого установленного кодека (см. available_codecs) и размера коллекции
+выполняется GET /posts (валидация списка Post) и POST /posts (dict-payload).
+
+Запуск:
+    python -m benchmarks.codec
+    python -m benchmarks.codec --sizes 10 1000 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from src.async_api_client.codec import available_codecs, get_codec
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.models.posts import Post
+
+from .common import format_table
+
+CONFIG = APIConfig(host="bench.local")
+
+
+def build_transport(size: int) -> httpx.MockTransport:
+    listing = json.dumps([
+        {"id": i, "userId": i % 10 + 1, "title": f"title {i}", "body": "lorem ipsum " * 20}
+        for i in range(size)
+    ]).encode()
+    created = json.dumps({"id": 101, "userId": 1, "title": "t", "body": "b"}).encode()
+    headers = {"Content-Type": "application/json"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, content=created, headers=headers)
+        return httpx.Response(200, content=listing, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+async def run_case(codec_name: str, size: int, requests: int) -> tuple[float, float]:
+    """Среднее время GET и POST в миллисекундах."""
+
+    session = httpx.AsyncClient(base_url=CONFIG.base_url, transport=build_transport(size))
+    client = HttpxAsyncClient(CONFIG, session=session, codec=get_codec(codec_name), validate_request=False)
+    payload = {"title": "t", "body": "lorem ipsum " * 20, "userId": 1}
+
+    async with session:
+        await client.get("/posts", response_model=Post)
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/posts", response_model=Post)
+        get_ms = (time.perf_counter() - start) * 1000 / requests
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.post("/posts", json=payload, response_model=Post)
+        post_ms = (time.perf_counter() - start) * 1000 / requests
+
+    return get_ms, post_ms
+
+
+async def main_async(sizes: list[int], requests: int) -> None:
+    rows = []
+    for size in sizes:
+        for codec_name in available_codecs():
+            get_ms, post_ms = await run_case(codec_name, size, requests)
+            rows.append((size, codec_name, get_ms, post_ms))
+    print(format_table(("items", "codec", "GET, ms/req", "POST, ms/req"), rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 5_000])
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.sizes, args.requests))
+
+
+if __name__ == "__main__":
+    main()
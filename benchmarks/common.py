@@ -0,0 +1,57 @@
+"""Общие утилиты для бенчмарков: замер времени и вывод таблиц."""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Результат замера: время одного вызова в миллисекундах."""
+
+    median_ms: float
+    min_ms: float
+    stdev_ms: float
+    runs: int
+
+
+def measure(fn: Callable[[], object], repeat: int = 7, number: int = 1, warmup: int = 1) -> Timing:
+    """
+    Замерить fn: `repeat` серий по `number` вызовов, после `warmup` прогревочных вызовов.
+
+    Время в результате — на один вызов.
+    """
+
+    for _ in range(warmup):
+        fn()
+
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+
+    return Timing(
+        median_ms=statistics.median(samples),
+        min_ms=min(samples),
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        runs=repeat * number,
+    )
+
+
+def format_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
+    """Простая текстовая таблица с выравниванием по ширине колонок."""
+
+    cells = [[str(h) for h in headers]] + [[_cell(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = [" | ".join(c.ljust(w) for c, w in zip(row, widths)) for row in cells]
+    lines.insert(1, "-+-".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def _cell(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
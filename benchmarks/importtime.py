@@ -0,0 +1,95 @@
+"""
+Бенчмарк времени импорта: холодный `python -X importtime` в отдельном процессе.
+
+Каждый прогон — новый интерпретатор (без кэша модулей в памяти; .pyc на диске
+используются, как в обычном запуске pytest/xdist-воркера). Выводит медиану
+суммарного времени импорта целевого модуля и самые тяжёлые модули.
+
+Запуск:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --module src.async_api_client.client --runs 15
+    python -m benchmarks.importtime --save benchmarks/results/importtime.json
+    python -m benchmarks.importtime --compare benchmarks/results/importtime.json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from .common import format_table
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# import time:  self [us] | cumulative | imported package
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def run_once(module: str) -> dict[str, tuple[int, int]]:
+    """{модуль: (self_us, cumulative_us)} для одного холодного импорта."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def measure(module: str, runs: int) -> dict:
+    samples = [run_once(module) for _ in range(runs)]
+    total_ms = statistics.median(s[module][1] for s in samples) / 1000
+
+    modules = set().union(*samples)
+    per_module = {
+        name: statistics.median(s.get(name, (0, 0))[1] for s in samples) / 1000
+        for name in modules
+    }
+    return {
+        "module": module,
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "total_ms": round(total_ms, 2),
+        "modules_imported": statistics.median(len(s) for s in samples),
+        "cumulative_ms": dict(sorted(per_module.items(), key=lambda kv: -kv[1])),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="src.async_api_client")
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", type=Path, help="сохранить результат в JSON")
+    parser.add_argument("--compare", type=Path, help="сравнить с сохранённым результатом")
+    args = parser.parse_args()
+
+    result = measure(args.module, args.runs)
+
+    print(f"{result['module']}: {result['total_ms']:.1f} ms (median of {args.runs}), "
+          f"{result['modules_imported']:.0f} modules")
+    top = list(result["cumulative_ms"].items())[:args.top]
+    print(format_table(("module", "cumulative, ms"), top))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        delta = result["total_ms"] - baseline["total_ms"]
+        print(f"\nbaseline {baseline['total_ms']:.1f} ms → now {result['total_ms']:.1f} ms ({delta:+.1f} ms)")
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
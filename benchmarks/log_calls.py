@@ -0,0 +1,105 @@
+"""
+Бенчмарк стоимости вызова логгера для utils.logger: прямая запись против очереди.
+
+Логгер async_api_client настраивается configure_logging с файловым обработчиком
+(и, с --console, выводом в stdout, перенаправленным в файл) в трёх режимах:
+  • off   — форматирование и запись в вызывающем потоке (как на event loop сейчас);
+  • drop  — очередь + фоновый поток, при переполнении запись отбрасывается;
+  • block — очередь + фоновый поток, при переполнении вызов ждёт места.
+
+Для каждого режима — задержка одного вызова log.info (p50/p99/max), общее время
+вызовов, время дописывания очереди (shutdown_logging) и число отброшенных записей.
+Сообщение похоже на строку RequestLogger: метод, путь и тело ~--body байт.
+
+Запуск:
+    python -m benchmarks.log_calls
+    python -m benchmarks.log_calls --calls 50000 --queue-size 1000 --console
+"""
+
+import argparse
+import contextlib
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.async_api_client.metrics import LatencyHistogram
+from utils.logger import configure_logging, dropped_records, shutdown_logging
+
+from .common import format_table
+
+MODES = ("off", "drop", "block")
+
+
+def run_mode(mode: str, calls: int, body: int, queue_size: int, console: bool, logs_dir: Path) -> dict:
+    payload = "x" * body
+    histogram = LatencyHistogram()
+    stdout = (logs_dir / f"console-{mode}.txt").open("w", encoding="utf-8")
+    with contextlib.redirect_stdout(stdout):
+        configure_logging(
+            level="INFO",
+            log_file=f"bench-{mode}",
+            logs_dir=logs_dir,
+            use_console=console,
+            force=True,
+            queue_mode=mode,
+            queue_size=queue_size,
+        )
+        log = logging.getLogger("async_api_client")
+        log.info("warm-up")
+
+        started = time.perf_counter()
+        for index in range(calls):
+            start = time.perf_counter()
+            log.info("→ %s %s [%d] body=%s", "GET", "/posts/1", index, payload)
+            histogram.record(time.perf_counter() - start)
+        calls_ms = (time.perf_counter() - started) * 1000
+
+        dropped = dropped_records()
+        drain_start = time.perf_counter()
+        shutdown_logging()
+        drain_ms = (time.perf_counter() - drain_start) * 1000
+        for handler in log.handlers:
+            handler.close()
+    stdout.close()
+
+    return {
+        "mode": mode,
+        "calls": calls,
+        "p50_us": histogram.percentile(50) * 1e6,
+        "p99_us": histogram.percentile(99) * 1e6,
+        "max_us": histogram.max * 1e6,
+        "calls_ms": calls_ms,
+        "drain_ms": drain_ms,
+        "dropped": dropped,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--body", type=int, default=512, help="байт тела в сообщении")
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--console", action="store_true", help="ещё и StreamHandler в stdout (в файл)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            run_mode(mode, args.calls, args.body, args.queue_size, args.console, Path(tmp))
+            for mode in args.modes
+        ]
+
+    print(format_table(
+        ("mode", "calls", "p50, us", "p99, us", "max, us", "calls, ms", "drain, ms", "dropped"),
+        [
+            (r["mode"], r["calls"], r["p50_us"], r["p99_us"], r["max_us"], r["calls_ms"], r["drain_ms"], r["dropped"])
+            for r in results
+        ],
+    ))
+    print(f"\nqueue_size={args.queue_size} body={args.body}B console={args.console} python={sys.version.split()[0]}")
+
+
+if __name__ == "__main__":
+    main()
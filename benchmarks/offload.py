@@ -0,0 +1,125 @@
+"""
+Бенчмарк блокировки event loop при обработке больших ответов.
+
+Пока HttpxAsyncClient получает и валидирует крупный JSON-ответ (MockTransport),
+фоновая корутина-«пульс» каждые --tick мс замеряет, насколько позже запланированного
+она просыпается. Сравниваются режимы:
+  • loop    — всё на event loop (offload_threshold=None);
+  • thread  — декодирование/валидация в ThreadPoolExecutor;
+  • process — в ProcessPoolExecutor.
+
+Запуск:
+    python -m benchmarks.offload
+    python -m benchmarks.offload --megabytes 50 --rounds 3
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import time
+
+import httpx
+
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.models.posts import Post
+from src.async_api_client.offload import get_executor, shutdown_executors
+
+from .common import format_table
+
+CONFIG = APIConfig(host="bench.local")
+MODES = {
+    "loop": dataclasses.replace(CONFIG, offload_threshold=None),
+    "thread": dataclasses.replace(CONFIG, offload_threshold=1024 * 1024, offload_executor="thread"),
+    "process": dataclasses.replace(CONFIG, offload_threshold=1024 * 1024, offload_executor="process"),
+}
+
+
+def build_body(megabytes: float) -> bytes:
+    item = {"id": 0, "userId": 1, "title": "title", "body": "lorem ipsum " * 20}
+    count = int(megabytes * 1024 * 1024 / len(json.dumps(item)))
+    return json.dumps([{**item, "id": i} for i in range(count)]).encode()
+
+
+class LoopLagProbe:
+    """Пульс на event loop: копит задержки пробуждения относительно расписания."""
+
+    def __init__(self, tick: float):
+        self._tick = tick
+        self.lags: list[float] = []
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self._tick
+            await asyncio.sleep(self._tick)
+            self.lags.append(max(0.0, time.perf_counter() - expected))
+
+    def __enter__(self) -> "LoopLagProbe":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._task.cancel()
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.lags, default=0.0) * 1000
+
+    @property
+    def blocked_ms(self) -> float:
+        """Суммарное время, на которое loop «залипал» дольше одного тика."""
+        return sum(lag for lag in self.lags if lag > self._tick) * 1000
+
+
+async def run_mode(config: APIConfig, body: bytes, rounds: int, tick: float) -> tuple[float, float, float]:
+    headers = {"Content-Type": "application/json"}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body, headers=headers))
+    session = httpx.AsyncClient(base_url=config.base_url, transport=transport)
+    client = HttpxAsyncClient(config, session=session)
+
+    if config.offload_threshold is not None:
+        # Пул поднимается один раз за процесс — не включаем старт воркеров в замер
+        await asyncio.get_running_loop().run_in_executor(
+            get_executor(config.offload_executor, config.offload_max_workers), time.sleep, 0,
+        )
+
+    async with session:
+        wall = 0.0
+        with LoopLagProbe(tick) as probe:
+            for _ in range(rounds):
+                # Даём пульсу уснуть, чтобы блокировка пришлась на его ожидание
+                await asyncio.sleep(tick * 3)
+                start = time.perf_counter()
+                await client.get("/posts", response_model=Post)
+                wall += time.perf_counter() - start
+            await asyncio.sleep(tick * 3)
+        wall_ms = wall * 1000 / rounds
+
+    return wall_ms, probe.max_ms, probe.blocked_ms / rounds
+
+
+async def main_async(megabytes: float, rounds: int, tick: float) -> None:
+    body = build_body(megabytes)
+    rows = []
+    for mode, config in MODES.items():
+        wall_ms, max_lag_ms, blocked_ms = await run_mode(config, body, rounds, tick)
+        rows.append((mode, wall_ms, max_lag_ms, blocked_ms))
+    shutdown_executors()
+
+    print(f"response: {len(body) / 1024 / 1024:.1f} MB, rounds: {rounds}, tick: {tick * 1000:.0f} ms")
+    print(format_table(("mode", "request, ms", "max loop lag, ms", "blocked per request, ms"), rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=float, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--tick", type=float, default=0.001, help="период пульса, сек")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.megabytes, args.rounds, args.tick))
+
+
+if __name__ == "__main__":
+    main()
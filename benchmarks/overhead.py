@@ -0,0 +1,298 @@
+"""
+Бенчмарк накладных расходов HttpxAsyncClient.request поверх «голого» httpx.
+
+Сервер подменён httpx.MockTransport — в замер попадает только работа клиента.
+Конфигурации:
+  • raw     — session.request + response.json(), без клиента;
+  • full    — HttpxAsyncClient со всеми слоями;
+  • -<слой> — full без одного слоя; разница с full — цена слоя.
+
+Слои (отключаются подменой на время замера):
+  request_id — uuid4 на запрос;          payload    — validators.prepare_payload;
+  auth       — BearerAuth.apply;          allure     — allure.step и вложения;
+  logger     — RequestLogger целиком;     curl       — to_curl для вложения;
+  redirects  — RedirectTracker (запросы идут через 302);
+  validators — проверка статуса и тела ответа Pydantic-моделью.
+
+Для каждого размера тела (элементов в ответе GET /posts и ~100 байт на элемент
+в теле POST) и уровня конкурентности считаются задержка на запрос (p50/p99)
+и запросы в секунду.
+
+Запуск:
+    python -m benchmarks.overhead
+    python -m benchmarks.overhead --sizes 1 100 --concurrency 1 32 --requests 500
+    python -m benchmarks.overhead --save benchmarks/results/overhead.json
+    python -m benchmarks.overhead --compare benchmarks/results/overhead.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional, Sequence
+from unittest import mock
+
+import httpx
+
+from src.async_api_client import http_client as http_client_module
+from src.async_api_client import request_logger as request_logger_module
+from src.async_api_client import validators
+from src.async_api_client.auth import BearerAuth, NoAuth
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.metrics import LatencyHistogram
+from src.async_api_client.models.posts import Post, PostCreate
+from utils.logger import configure_logging
+
+from .common import format_table
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CONFIG = APIConfig(host="bench.local")
+
+LAYERS = ("request_id", "payload", "auth", "allure", "logger", "curl", "redirects", "validators")
+
+
+def build_transport(size: int) -> httpx.MockTransport:
+    listing = json.dumps([
+        {"id": i, "userId": i % 10 + 1, "title": f"title {i}", "body": "lorem ipsum " * 8}
+        for i in range(size)
+    ]).encode()
+    created = json.dumps({"id": 101, "userId": 1, "title": "t", "body": "b"}).encode()
+    headers = {"Content-Type": "application/json"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/r/"):
+            return httpx.Response(302, headers={"Location": request.url.path[2:]})
+        if request.method == "POST":
+            return httpx.Response(201, content=created, headers=headers)
+        return httpx.Response(200, content=listing, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+class _NullRequestLogger:
+    max_body_size = CONFIG.max_log_body
+
+    def log_request(self, *args: Any) -> None:
+        pass
+
+    def log_response(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def log_failure(self, *args: Any) -> None:
+        pass
+
+
+_NO_ALLURE = SimpleNamespace(
+    step=lambda title: nullcontext(),
+    attach=lambda *args, **kwargs: None,
+    attachment_type=request_logger_module.allure.attachment_type,
+)
+
+
+@contextmanager
+def layers_disabled(client: HttpxAsyncClient, disabled: Sequence[str]) -> Iterator[None]:
+    """Отключить слои клиента (см. LAYERS) на время блока."""
+
+    unknown = set(disabled) - set(LAYERS)
+    if unknown:
+        raise ValueError(f"Unknown layers: {sorted(unknown)}")
+
+    with ExitStack() as stack:
+        def patch(target: Any, name: str, value: Any) -> None:
+            stack.enter_context(mock.patch.object(target, name, value))
+
+        if "request_id" in disabled:
+            fixed = SimpleNamespace(hex="0" * 32)
+            patch(http_client_module, "uuid", SimpleNamespace(uuid4=lambda: fixed))
+        if "payload" in disabled:
+            patch(validators, "prepare_payload", lambda kwargs, **_: kwargs)
+        if "auth" in disabled:
+            patch(client, "_auth", NoAuth())
+        if "allure" in disabled:
+            patch(http_client_module, "allure", _NO_ALLURE)
+            patch(request_logger_module, "allure", _NO_ALLURE)
+        if "logger" in disabled:
+            patch(client, "_req_logger", _NullRequestLogger())
+        if "curl" in disabled:
+            patch(request_logger_module, "to_curl", lambda *args, **kwargs: "")
+        if "redirects" in disabled:
+            patch(http_client_module, "RedirectTracker", SimpleNamespace(track=lambda *args: None))
+        if "validators" in disabled:
+            patch(client, "_validate_status", False)
+            patch(client, "_validate_response", False)
+            patch(client, "_validate_request", False)
+        yield
+
+
+async def _drive(call, requests: int, concurrency: int) -> dict[str, float]:
+    histogram = LatencyHistogram()
+    # Общий счётчик, как в timing.measure: ровно requests замеров при любой concurrency
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            await call()
+            histogram.record(time.perf_counter() - start)
+
+    await call()  # прогрев: импорт моделей, кэши адаптеров
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    wall = time.perf_counter() - started
+    return {
+        "requests": histogram.count,
+        "rps": round(histogram.count / wall, 1),
+        "mean_us": round(histogram.mean * 1e6, 1),
+        "p50_us": round(histogram.percentile(50) * 1e6, 1),
+        "p99_us": round(histogram.percentile(99) * 1e6, 1),
+    }
+
+
+async def run_case(
+        workload: str, size: int, concurrency: int, requests: int, disabled: Sequence[str] = (), raw: bool = False,
+) -> dict[str, Any]:
+    """Один замер: workload "get" | "post" | "redirect"."""
+
+    session = httpx.AsyncClient(base_url=CONFIG.base_url, transport=build_transport(size), follow_redirects=True)
+    client = HttpxAsyncClient(CONFIG, auth=BearerAuth("bench-token"), session=session)
+    payload = {"title": "t", "body": "x" * (100 * size), "userId": 1}
+    path = "/r/posts" if workload == "redirect" else "/posts"
+
+    if raw:
+        async def call():
+            if workload == "post":
+                response = await session.post(path, json=payload)
+            else:
+                response = await session.get(path)
+            return response.json()
+    elif workload == "post":
+        async def call():
+            return await client.post(path, request_model=PostCreate, json=payload, response_model=Post)
+    else:
+        async def call():
+            return await client.get(path, response_model=Post)
+
+    async with session:
+        with layers_disabled(client, () if raw else disabled):
+            result = await _drive(call, requests, concurrency)
+
+    name = "raw" if raw else ("full" if not disabled else "-" + ",".join(disabled))
+    return {"workload": workload, "config": name, "size": size, "concurrency": concurrency, **result}
+
+
+async def run_matrix(
+        sizes: Sequence[int],
+        concurrency: Sequence[int],
+        requests: int,
+        workloads: Sequence[str] = ("get", "post"),
+        layers: Sequence[str] = LAYERS,
+) -> list[dict[str, Any]]:
+    results = []
+    for workload in workloads:
+        for size in sizes:
+            for level in concurrency:
+                results.append(await run_case(workload, size, level, requests, raw=True))
+                results.append(await run_case(workload, size, level, requests))
+                for layer in layers:
+                    if layer == "redirects" and workload != "redirect":
+                        continue
+                    results.append(await run_case(workload, size, level, requests, disabled=(layer,)))
+    return results
+
+
+def _key(row: dict[str, Any]) -> tuple:
+    return row["workload"], row["size"], row["concurrency"], row["config"]
+
+
+def with_layer_costs(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Добавить к строкам delta_vs_full_us — разницу медиан с full на запрос
+    (отрицательная — без слоя быстрее на столько). Медиана устойчивее среднего к паузам GC.
+    """
+
+    full = {_key(r)[:3]: r["p50_us"] for r in results if r["config"] == "full"}
+    return [{**r, "delta_vs_full_us": round(r["p50_us"] - full[_key(r)[:3]], 1)} for r in results]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    rows = [
+        (r["workload"], r["size"], r["concurrency"], r["config"], r["rps"], r["p50_us"], r["p99_us"],
+         f"{r['delta_vs_full_us']:+.1f}")
+        for r in results
+    ]
+    return format_table(("workload", "size", "conc", "config", "req/s", "p50, us", "p99, us", "vs full, us"), rows)
+
+
+def format_comparison(results: list[dict[str, Any]], baseline: dict[str, Any]) -> str:
+    before = {_key(r): r for r in baseline["results"]}
+    rows = []
+    for r in results:
+        old = before.get(_key(r))
+        if old is None:
+            continue
+        change = (r["p50_us"] / old["p50_us"] - 1) * 100 if old["p50_us"] else 0.0
+        rows.append((r["workload"], r["size"], r["concurrency"], r["config"], old["p50_us"], r["p50_us"],
+                     f"{change:+.1f}%"))
+    header = f"baseline {baseline['meta'].get('commit') or '?'} ({baseline['meta']['timestamp']})"
+    return header + "\n" + format_table(
+        ("workload", "size", "conc", "config", "p50 before, us", "p50 now, us", "change"), rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 32])
+    parser.add_argument("--requests", type=int, default=1000, help="запросов на замер")
+    parser.add_argument("--workloads", nargs="+", choices=("get", "post", "redirect"), default=["get", "post"])
+    parser.add_argument("--layers", nargs="+", choices=LAYERS, default=list(LAYERS))
+    parser.add_argument("--log-level", default="INFO", help="уровень логов клиента (пишутся в logs/benchmark.log)")
+    parser.add_argument("--save", type=Path, help="сохранить результат в JSON")
+    parser.add_argument("--compare", type=Path, help="сравнить с сохранённым результатом")
+    args = parser.parse_args()
+
+    configure_logging(level=args.log_level, log_file="benchmark", use_console=False)
+    results = with_layer_costs(asyncio.run(
+        run_matrix(args.sizes, args.concurrency, args.requests, args.workloads, args.layers),
+    ))
+    print(format_results(results))
+
+    if args.compare:
+        print()
+        print(format_comparison(results, json.loads(args.compare.read_text())))
+
+    if args.save:
+        document = {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "requests": args.requests,
+                "log_level": args.log_level,
+            },
+            "results": results,
+        }
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Бенчмарк сериализации тела запроса: dict-путь против однопроходного dump_json.
+
+Сравнивает на bulk-create payload'ах (список PostCreate):
+  • legacy — model_dump → dict → httpx json= (json.dumps) + mask_body/str для лога;
+  • bytes  — prepare_payload (dump_json сразу в bytes) → httpx content= + mask_json_bytes.
+
+Запуск:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --sizes 1000 50000 --repeat 5
+"""
+
+import argparse
+
+import httpx
+
+from src.async_api_client.helpers.functions import mask_body, mask_json_bytes, truncate
+from src.async_api_client.models.posts import PostCreate
+from src.async_api_client.validators import prepare_payload
+
+from .common import format_table, measure
+
+URL = "https://api.example.com/posts"
+MAX_LOG_BODY = 4096
+
+
+def build_payload(size: int) -> list[PostCreate]:
+    return [
+        PostCreate(title=f"title {i}", body="lorem ipsum " * 20, userId=i % 10 + 1)
+        for i in range(size)
+    ]
+
+
+def legacy_path(payload: list[PostCreate]) -> httpx.Request:
+    body = [item.model_dump(by_alias=True, exclude_none=True) for item in payload]
+    truncate(str(mask_body(body)), MAX_LOG_BODY)
+    return httpx.Request("POST", URL, json=body)
+
+
+def bytes_path(payload: list[PostCreate]) -> httpx.Request:
+    kwargs = prepare_payload({"json": payload}, request_model=None, validate=False)
+    mask_json_bytes(kwargs["content"], MAX_LOG_BODY)
+    return httpx.Request("POST", URL, content=kwargs["content"], headers=kwargs["headers"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        payload = build_payload(size)
+        legacy = measure(lambda: legacy_path(payload), repeat=args.repeat)
+        fast = measure(lambda: bytes_path(payload), repeat=args.repeat)
+        rows.append((size, legacy.median_ms, fast.median_ms, legacy.median_ms / fast.median_ms))
+
+    print(format_table(("items", "legacy, ms", "bytes, ms", "speedup"), rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import time
+
 import allure
 import httpx
 import pytest
@@ -6,10 +8,22 @@ import pytest_asyncio
 from src.async_api_client.config import APIConfig, WebUIConfig
 from src.async_api_client.auth import SessionLoginAuth
 from src.async_api_client.client import AsyncAPIClient
-
-from utils.logger import configure_logging
+from src.async_api_client.cassette import CassetteTransport
+from src.async_api_client.testing import (
+    MOCK_CONFIG,
+    MockAPI,
+    MockServerConfig,
+    add_session_fault_counts,
+    format_fault_counts,
+    session_fault_counts,
+)
+
+from utils.log_merge import find_logs, merge_logs
+from utils.logger import DEFAULT_LOGS_DIR, configure_logging, shutdown_logging
 from utils.environment import ConfigEnv
 
+pytest_plugins = ["pytester", "utils.perf_baseline", "utils.loop_lag", "utils.profiling", "utils.memory_leaks", "utils.request_log"]
+
 config_env = ConfigEnv()
 
 
@@ -20,14 +34,83 @@ def pytest_addoption(parser):
         default=None,
         help="Base API URL (overrides API_BASE_URL from environment)",
     )
+    parser.addoption(
+        "--cassette-mode",
+        action="store",
+        default="off",
+        choices=("off", "record", "replay", "new_episodes"),
+        help="Record/replay HTTP traffic of the shared session through a cassette",
+    )
+    parser.addoption(
+        "--cassette-path",
+        action="store",
+        default="tests/cassettes/session.jsonl",
+        help="Cassette file for --cassette-mode",
+    )
+    parser.addoption(
+        "--log-queue",
+        action="store",
+        default="off",
+        choices=("off", "drop", "block"),
+        help="Write logs from a background thread through a bounded queue (drop/block on overflow)",
+    )
+    parser.addoption(
+        "--log-merge",
+        action="store_true",
+        default=False,
+        help="After an xdist run merge per-worker logs into logs/tests_cycle-merged.log",
+    )
 
 
 def pytest_configure(config):
+    if config.getoption("cassette_mode") in ("record", "new_episodes") and config.getoption("numprocesses", None):
+        raise pytest.UsageError("--cassette-mode record/new_episodes writes one file; run it without -n")
+
     base_url = config.getoption("base_url") or config_env.get("API_BASE_URL", required=True)
     config.base_url = base_url
 
     level = config.getoption("log_level") or "INFO"
-    configure_logging(level=level)
+    configure_logging(level=level, queue_mode=config.getoption("log_queue"))
+    # Начало прогона (у контроллера — до старта воркеров): граница слияния логов
+    config.log_started = time.time()
+
+
+def pytest_unconfigure(config):
+    shutdown_logging()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    # После teardown сессионных фикстур: дописать очередь логов. Воркер xdist сообщает
+    # контроллеру о завершении только после этого хука, так что его файл уже полон к слиянию
+    shutdown_logging()
+    if hasattr(config, "workerinput"):
+        # Счётчики сбоев — в процессе воркера; сводку печатает контроллер
+        config.workeroutput["fault_counts"] = session_fault_counts()
+        return
+    if not config.getoption("log_merge"):
+        return
+    output = DEFAULT_LOGS_DIR / "tests_cycle-merged.log"
+    paths = find_logs(DEFAULT_LOGS_DIR, "tests_cycle", since=config.log_started)
+    with output.open("wb") as fh:
+        config.merged_log = (merge_logs(paths, fh, since=config.log_started), len(paths), output)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    add_session_fault_counts(getattr(node, "workeroutput", {}).get("fault_counts", {}))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    counts = session_fault_counts()
+    if counts:
+        terminalreporter.write_sep("-", "fault injection")
+        terminalreporter.write_line(format_fault_counts(counts))
+    merged = getattr(config, "merged_log", None)
+    if merged:
+        terminalreporter.write_sep("-", "merged log")
+        terminalreporter.write_line("{} records from {} files -> {}".format(*merged))
 
 
 @pytest.fixture(scope="session")
@@ -46,13 +129,19 @@ def web_ui_config(request) -> WebUIConfig:
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
 @allure.title("Create HTTP session for API client")
-async def http_session(api_config):
+async def http_session(request, api_config):
+    mode = request.config.getoption("cassette_mode")
+    transport = None
+    if mode != "off":
+        transport = CassetteTransport(request.config.getoption("cassette_path"), mode=mode)
+
     async with httpx.AsyncClient(
             base_url=api_config.base_url,
             timeout=api_config.timeout,
             verify=api_config.verify_ssl,
             follow_redirects=api_config.follow_redirects,
             headers=api_config.default_headers,
+            transport=transport,
     ) as session:
         yield session
 
@@ -83,3 +172,26 @@ async def api_client_with_auth_session(api_config, http_session, session_auth):
             session=http_session,
     ) as client:
         yield client
+
+
+@pytest.fixture
+def mock_api(request) -> MockAPI:
+    """
+    In-process mock JSONPlaceholder. Параметры — через маркер:
+        @pytest.mark.mock_api(latency=Latency("fixed", 0.01), error_rate=0.1)
+    """
+
+    marker = request.node.get_closest_marker("mock_api")
+    config = MockServerConfig(**marker.kwargs) if marker else MockServerConfig()
+    return MockAPI(config)
+
+
+@pytest_asyncio.fixture
+async def mock_api_client(mock_api):
+    async with AsyncAPIClient(
+            MOCK_CONFIG,
+            transport=httpx.ASGITransport(app=mock_api),
+            validate_request=False,
+            validate_response=False,
+    ) as client:
+        yield client
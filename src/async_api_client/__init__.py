@@ -1,43 +1,130 @@
-from .client import AsyncAPIClient
-from .config import APIConfig, WebUIConfig, BaseHTTPConfig
-
-from .auth import (
-    AsyncAuthStrategy,
-    NoAuth,
-    BearerAuth,
-    APIKeyAuth,
-    SessionLoginAuth,
-    RefreshableTokenAuth,
-)
-
-from .redirects import (
-    RedirectChain,
-    RedirectHop,
-)
-
-from .exceptions import APIError, APITimeoutError, StatusAssertionError
-
-from .models.base import (
-    ErrorResponse,
-    UnauthorizedError,
-    ForbiddenError,
-    NotFoundError,
-    ValidationErrorResponse,
-    ServerError,
-)
-
-from .http_client import AsyncHTTPClient, HttpxAsyncClient
-
-from .constants import DEFAULT_ERROR_MODELS
+"""
+Асинхронный HTTP-клиент для тестирования REST API.
+
+Публичные имена импортируются лениво (PEP 562): `import src.async_api_client`
+не тянет httpx, pydantic, allure и все подмодули, пока имя не запрошено.
+Это ускоряет старт каждого процесса pytest и xdist-воркера.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import AsyncAPIClient
+    from .config import APIConfig, WebUIConfig, BaseHTTPConfig, ValidationSampling
+
+    from .auth import (
+        AsyncAuthStrategy,
+        NoAuth,
+        BearerAuth,
+        APIKeyAuth,
+        SessionLoginAuth,
+        RefreshableTokenAuth,
+    )
+
+    from .redirects import (
+        RedirectChain,
+        RedirectHop,
+    )
+
+    from .results import APIResult
+
+    from .pagination import (
+        PaginationStrategy,
+        OffsetPagination,
+        CursorPagination,
+        LinkHeaderPagination,
+    )
+
+    from .exceptions import APIError, APITimeoutError, StatusAssertionError
+
+    from .models.base import (
+        ErrorResponse,
+        UnauthorizedError,
+        ForbiddenError,
+        NotFoundError,
+        ValidationErrorResponse,
+        ServerError,
+    )
+
+    from .http_client import AsyncHTTPClient, HttpxAsyncClient
+    from .codec import JSONCodec, StdlibJSONCodec, OrjsonCodec, get_codec
+    from .cassette import CassetteTransport, CassetteMissError
+
+    from .constants import DEFAULT_ERROR_MODELS
+
+# Подмодуль → имена, которые он экспортирует на уровень пакета
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".client": ("AsyncAPIClient",),
+    ".config": (
+        "APIConfig",
+        "WebUIConfig",
+        "BaseHTTPConfig",
+        "ValidationSampling",
+    ),
+    ".auth": (
+        "AsyncAuthStrategy",
+        "NoAuth",
+        "BearerAuth",
+        "APIKeyAuth",
+        "SessionLoginAuth",
+        "RefreshableTokenAuth",
+    ),
+    ".redirects": (
+        "RedirectChain",
+        "RedirectHop",
+    ),
+    ".results": ("APIResult",),
+    ".pagination": (
+        "PaginationStrategy",
+        "OffsetPagination",
+        "CursorPagination",
+        "LinkHeaderPagination",
+    ),
+    ".exceptions": (
+        "APIError",
+        "APITimeoutError",
+        "StatusAssertionError",
+    ),
+    ".models.base": (
+        "ErrorResponse",
+        "UnauthorizedError",
+        "ForbiddenError",
+        "NotFoundError",
+        "ValidationErrorResponse",
+        "ServerError",
+    ),
+    ".http_client": (
+        "AsyncHTTPClient",
+        "HttpxAsyncClient",
+    ),
+    ".codec": (
+        "JSONCodec",
+        "StdlibJSONCodec",
+        "OrjsonCodec",
+        "get_codec",
+    ),
+    ".cassette": (
+        "CassetteTransport",
+        "CassetteMissError",
+    ),
+    ".constants": ("DEFAULT_ERROR_MODELS",),
+}
+
+_EXPORT_MODULES: dict[str, str] = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
 
 __all__ = [
     # Главное
     "AsyncAPIClient",
+    "APIResult",
 
     # Конфиги
     "APIConfig",
     "WebUIConfig",
     "BaseHTTPConfig",
+    "ValidationSampling",
 
     # Аутентификация
     "AsyncAuthStrategy",
@@ -60,6 +147,12 @@ __all__ = [
     "ValidationErrorResponse",
     "ServerError",
 
+    # Пагинация
+    "PaginationStrategy",
+    "OffsetPagination",
+    "CursorPagination",
+    "LinkHeaderPagination",
+
     # Редиректы
     "RedirectChain",
     "RedirectHop",
@@ -70,7 +163,30 @@ __all__ = [
     # Транспорт (продвинутое)
     "AsyncHTTPClient",
     "HttpxAsyncClient",
+
+    # JSON-кодеки
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "get_codec",
+
+    # Тестовые транспорты
+    "CassetteTransport",
+    "CassetteMissError",
 ]
 
 
-__version__ = "0.2.0"
\ No newline at end of file
+__version__ = "0.2.0"
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # следующие обращения — без __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,10 +1,18 @@
-from typing import Any
+from typing import Any, Optional, Protocol
 
 import allure
 from httpx import Response
 from .http_client import StatusCode
 
 from .redirects import RedirectChain
+from .timing import LatencyStats
+from .validators import SampleReport
+
+
+class SoftAssertions(Protocol):
+    """Приёмник мягких проверок — utils.assertions.AssertionAggregator."""
+
+    def run_check(self, check: Any) -> None: ...
 
 
 def assert_status_code(response: Response, expected: StatusCode) -> None:
@@ -29,11 +37,58 @@ def assert_field_equals(obj: Any, field: str, expected: Any) -> None:
 
 
 def assert_response_time_below(response: Response, ms: float) -> None:
+    """Один замер — шум; для SLO используйте measure() и assert_p95_below()."""
     with allure.step(f"Response time below {ms}ms"):
         elapsed_ms = response.elapsed.total_seconds() * 1000
         assert elapsed_ms < ms, f"Took {elapsed_ms:.1f}ms, expected < {ms}ms"
 
 
+class PercentileBelowCheck:
+    """Проверка «q-й перцентиль серии ниже порога» (протокол AssertionCheck агрегатора)."""
+
+    def __init__(self, stats: LatencyStats, q: float, ms: float) -> None:
+        self._stats = stats
+        self._q = q
+        self._ms = ms
+
+    def check(self) -> Optional[str]:
+        actual = self._stats.percentile(self._q)
+        if actual < self._ms:
+            return None
+        return f"{self._stats.name}: p{self._q:g} {actual:.1f}ms, expected < {self._ms}ms ({self._stats})"
+
+
+def assert_percentile_below(
+        stats: LatencyStats, q: float, ms: float, soft: Optional[SoftAssertions] = None,
+) -> None:
+    """
+    Проверить перцентиль серии measure().
+
+    :param soft: AssertionAggregator — ошибка копится в нём, а не бросается сразу
+                 (несколько SLO в одном тесте)
+    """
+
+    check = PercentileBelowCheck(stats, q, ms)
+    with allure.step(f"{stats.name}: p{q:g} below {ms}ms"):
+        if soft is not None:
+            soft.run_check(check)
+            return
+        error = check.check()
+        assert error is None, error
+
+
+def assert_p50_below(stats: LatencyStats, ms: float, soft: Optional[SoftAssertions] = None) -> None:
+    assert_percentile_below(stats, 50, ms, soft)
+
+
+def assert_p95_below(stats: LatencyStats, ms: float, soft: Optional[SoftAssertions] = None) -> None:
+    assert_percentile_below(stats, 95, ms, soft)
+
+
+def assert_p99_below(stats: LatencyStats, ms: float, soft: Optional[SoftAssertions] = None) -> None:
+    assert_percentile_below(stats, 99, ms, soft)
+
+
 def get_redirect_chain(response: Response) -> RedirectChain:
     """Достать цепочку редиректов из ответа (всегда есть, может быть пустой)."""
     chain = response.extensions.get("redirects")
@@ -42,6 +97,11 @@ def get_redirect_chain(response: Response) -> RedirectChain:
     return chain
 
 
+def get_validation_sample(response: Response) -> Optional[SampleReport]:
+    """Какие индексы коллекции проверены при validate_response="sample" (None — выборки не было)."""
+    return response.extensions.get("validation_sample")
+
+
 def assert_no_redirects(response: Response) -> None:
     chain = get_redirect_chain(response)
     with allure.step("No redirects occurred"):
@@ -0,0 +1,326 @@
+"""
+Запись и воспроизведение HTTP-обменов (кассеты) на уровне httpx-транспорта.
+
+Кассета — JSONL-файл: одна строка на эпизод (запрос + ответ), рядом —
+индекс `<имя>.idx.json` {ключ запроса: [смещения строк в файле]}.
+При воспроизведении читается только индекс, а эпизод — одним seek по смещению,
+так что поиск ответа — O(1) на запрос независимо от размера кассеты.
+
+Режимы:
+  • "record"       — все запросы идут на сервер, кассета перезаписывается;
+  • "replay"       — только кассета; незаписанный запрос → CassetteMissError;
+  • "new_episodes" — записанное воспроизводится, новое — запрашивается и дописывается.
+
+Ключ запроса — метод, URL с отсортированными query-параметрами и хэш тела.
+Заголовки в ключ не входят (X-TRACE-ID уникален на каждый запрос).
+Чувствительные заголовки (SENSITIVE_HEADERS) и поля JSON- и form-тел (SENSITIVE_BODY_KEYS)
+маскируются при записи — в кассету секреты не попадают. Тело запроса другого типа
+(multipart, текст, бинарное) не записывается вовсе — только его размер: для ключа
+используется хэш исходного тела, а само оно воспроизведению не нужно.
+
+Запись (record / new_episodes) — из одного процесса: несколько транспортов на один
+файл (воркеры pytest-xdist) стирали бы и дописывали один и тот же файл и индекс;
+conftest.py поэтому не допускает --cassette-mode record/new_episodes с -n.
+
+    transport = CassetteTransport("tests/cassettes/posts.jsonl", mode="replay")
+    async with AsyncAPIClient(config, transport=transport) as client:
+        await client.posts.get(1)
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterable, Literal, Optional, Union
+
+import httpx
+
+from .helpers.functions import mask_body, mask_form_bytes, mask_headers
+
+logger = logging.getLogger("async_api_client")
+
+CassetteMode = Literal["record", "replay", "new_episodes"]
+
+# Латентность воспроизведения: None — без задержки, число — фиксированная (сек),
+# "recorded" — как при записи
+ReplayLatency = Union[None, float, Literal["recorded"]]
+
+# Заголовки ответа, которые теряют смысл после декодирования тела при записи
+_DROP_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_INDEX_VERSION = 1
+
+
+class CassetteMissError(httpx.TransportError):
+    """В режиме replay запрос не найден в кассете."""
+
+
+def request_key(request: httpx.Request, ignore_params: Iterable[str] = (), match_body: bool = True) -> str:
+    """
+    Нормализованный ключ запроса: метод, URL без игнорируемых параметров
+    (остальные отсортированы) и sha1 тела. JSON-тело канонизируется —
+    порядок ключей и пробелы на ключ не влияют.
+    """
+
+    ignored = set(ignore_params)
+    params = sorted((k, v) for k, v in request.url.params.multi_items() if k not in ignored)
+    url = request.url.copy_with(query=None, fragment=None)
+    parts = [request.method.upper(), str(url), "&".join(f"{k}={v}" for k, v in params)]
+    if match_body:
+        parts.append(hashlib.sha1(_canonical_body(request)).hexdigest())
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _canonical_body(request: httpx.Request) -> bytes:
+    content = request.content
+    if not content or "json" not in request.headers.get("content-type", ""):
+        return content
+    try:
+        return json.dumps(json.loads(content), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except ValueError:
+        return content
+
+
+def _mask_body_bytes(content: bytes, headers: httpx.Headers) -> Optional[str]:
+    """JSON или форма с замаскированными секретами; None — тело не маскируется."""
+
+    content_type = headers.get("content-type", "").lower()
+    if "json" in content_type:
+        try:
+            masked = mask_body(json.loads(content))
+        except ValueError:
+            return None
+        return json.dumps(masked, ensure_ascii=False, separators=(",", ":"))
+    if "x-www-form-urlencoded" in content_type:
+        return mask_form_bytes(content)
+    return None
+
+
+def _encode_request_body(content: bytes, headers: httpx.Headers) -> dict[str, Any]:
+    """Тело запроса для записи: JSON и формы — с маскировкой, прочее — только размер."""
+
+    if not content:
+        return {"body": ""}
+    masked = _mask_body_bytes(content, headers)
+    if masked is None:
+        return {"body": "", "omitted_bytes": len(content)}
+    return {"body": masked}
+
+
+def _encode_body(content: bytes, headers: httpx.Headers) -> dict[str, str]:
+    """Тело ответа для записи: JSON и формы — с маскировкой секретов, текст — как есть, бинарное — base64."""
+
+    masked = _mask_body_bytes(content, headers)
+    if masked is not None:
+        return {"body": masked}
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(content).decode("ascii"), "encoding": "base64"}
+
+
+def _decode_body(episode: dict[str, Any]) -> bytes:
+    if episode.get("encoding") == "base64":
+        return base64.b64decode(episode["body"])
+    return episode["body"].encode("utf-8")
+
+
+class Cassette:
+    """
+    Файл кассеты с ленивым индексом.
+
+    Индекс читается при первом обращении. Если его нет или он не соответствует
+    размеру файла (процесс упал до сохранения) — перестраивается одним проходом по файлу.
+    Повторяющиеся одинаковые запросы воспроизводятся в порядке записи;
+    когда записи кончаются — повторяется последняя.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx.json")
+        self._index: Optional[dict[str, list[int]]] = None
+        self._played: dict[str, int] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._load_index().values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load_index()
+
+    def find(self, key: str) -> Optional[dict[str, Any]]:
+        """Следующий эпизод для ключа или None."""
+
+        offsets = self._load_index().get(key)
+        if not offsets:
+            return None
+        played = self._played.get(key, 0)
+        self._played[key] = played + 1
+        with self.path.open("rb") as fh:
+            fh.seek(offsets[min(played, len(offsets) - 1)])
+            return json.loads(fh.readline())
+
+    def append(self, key: str, episode: dict[str, Any]) -> None:
+        index = self._load_index()
+        line = json.dumps(episode, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as fh:
+            offset = fh.tell()
+            fh.write(line)
+        index.setdefault(key, []).append(offset)
+        # Только что записанный эпизод не должен «воспроизводиться» повторно этим же прогоном
+        self._played[key] = len(index[key])
+        self._dirty = True
+
+    def erase(self) -> None:
+        """Очистить кассету перед перезаписью (режим record)."""
+
+        self.path.unlink(missing_ok=True)
+        self.index_path.unlink(missing_ok=True)
+        self._index = {}
+        self._played.clear()
+        self._dirty = False
+
+    def save_index(self) -> None:
+        if not self._dirty or self._index is None:
+            return
+        payload = {"version": _INDEX_VERSION, "size": self.path.stat().st_size, "keys": self._index}
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+        self._dirty = False
+
+    def _load_index(self) -> dict[str, list[int]]:
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def _read_index(self) -> dict[str, list[int]]:
+        if not self.path.exists():
+            return {}
+        size = self.path.stat().st_size
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if payload.get("version") == _INDEX_VERSION and payload.get("size") == size:
+                return payload["keys"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        logger.info("Cassette index for %s is missing or stale, rebuilding", self.path)
+        index: dict[str, list[int]] = {}
+        with self.path.open("rb") as fh:
+            offset = 0
+            for line in fh:
+                if line.strip():
+                    index.setdefault(json.loads(line)["key"], []).append(offset)
+                offset += len(line)
+        self._dirty = True
+        return index
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """
+    httpx-транспорт с записью/воспроизведением через кассету.
+
+    :param path: путь к файлу кассеты (.jsonl)
+    :param mode: "record" | "replay" | "new_episodes"
+    :param transport: реальный транспорт для записи (по умолчанию httpx.AsyncHTTPTransport)
+    :param latency: задержка при воспроизведении — None, секунды или "recorded"
+    :param ignore_params: query-параметры, не влияющие на ключ (nonce, timestamp, ...)
+    :param match_body: учитывать ли тело запроса в ключе
+    """
+
+    def __init__(
+            self,
+            path: Union[str, Path],
+            mode: CassetteMode = "new_episodes",
+            transport: Optional[httpx.AsyncBaseTransport] = None,
+            latency: ReplayLatency = None,
+            ignore_params: Iterable[str] = (),
+            match_body: bool = True,
+    ):
+        if mode not in ("record", "replay", "new_episodes"):
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected record / replay / new_episodes")
+        self.cassette = Cassette(path)
+        self.mode = mode
+        self._transport = transport
+        self._latency = latency
+        self._ignore_params = tuple(ignore_params)
+        self._match_body = match_body
+        self.hits = 0
+        self.misses = 0
+
+        if mode == "record":
+            self.cassette.erase()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        key = request_key(request, self._ignore_params, self._match_body)
+
+        if self.mode != "record":
+            episode = self.cassette.find(key)
+            if episode is not None:
+                self.hits += 1
+                return await self._replay(request, episode)
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded episode for {request.method} {request.url} in {self.cassette.path}",
+                    request=request,
+                )
+
+        self.misses += 1
+        return await self._record(key, request)
+
+    async def _replay(self, request: httpx.Request, episode: dict[str, Any]) -> httpx.Response:
+        delay = episode.get("elapsed", 0.0) if self._latency == "recorded" else self._latency
+        if delay:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            episode["status"],
+            headers=episode["headers"],
+            content=_decode_body(episode),
+            request=request,
+        )
+
+    async def _record(self, key: str, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        upstream = await self._real_transport().handle_async_request(request)
+        try:
+            # aread() отдаёт уже декодированное тело (gzip/br сняты)
+            content = await upstream.aread()
+        finally:
+            await upstream.aclose()
+        elapsed = loop.time() - started
+
+        headers = httpx.Headers([
+            (name, value) for name, value in upstream.headers.multi_items()
+            if name.lower() not in _DROP_RESPONSE_HEADERS
+        ])
+        self.cassette.append(key, {
+            "key": key,
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                "headers": mask_headers(dict(request.headers)),
+                **_encode_request_body(request.content, request.headers),
+            },
+            "status": upstream.status_code,
+            "headers": mask_headers(dict(headers)),
+            "elapsed": round(elapsed, 6),
+            **_encode_body(content, headers),
+        })
+        return httpx.Response(upstream.status_code, headers=headers, content=content, request=request)
+
+    def _real_transport(self) -> httpx.AsyncBaseTransport:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        return self._transport
+
+    async def aclose(self) -> None:
+        self.cassette.save_index()
+        if self._transport is not None:
+            await self._transport.aclose()
@@ -0,0 +1,59 @@
+"""Реестр созданных в тесте ресурсов для удаления одним параллельным проходом."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .endpoints.bulk import BulkMixin, BulkResult
+
+logger = logging.getLogger("async_api_client")
+
+
+class CleanupRegistry:
+    """
+    Собирает идентификаторы ресурсов по endpoint'ам и удаляет их через delete_many.
+
+    AsyncAPIClient держит один реестр и вызывает sweep() при закрытии,
+    так что teardown фикстуры удаляет всё созданное за тест разом.
+
+    :param concurrency: параллелизм удаления внутри одного endpoint'а
+    """
+
+    def __init__(self, concurrency: int = 10):
+        self._concurrency = concurrency
+        self._pending: dict[int, tuple["BulkMixin", list[Any]]] = {}
+
+    def register(self, endpoint: "BulkMixin", resource_id: Any) -> None:
+        _, ids = self._pending.setdefault(id(endpoint), (endpoint, []))
+        ids.append(resource_id)
+
+    @property
+    def pending(self) -> int:
+        return sum(len(ids) for _, ids in self._pending.values())
+
+    async def sweep(self) -> list["BulkResult"]:
+        """
+        Удалить всё зарегистрированное. Ошибки удаления логируются, а не поднимаются —
+        teardown не должен маскировать результат теста.
+        """
+
+        groups = list(self._pending.values())
+        self._pending.clear()
+        if not groups:
+            return []
+
+        results = await asyncio.gather(*(
+            endpoint.delete_many(ids, concurrency=self._concurrency)
+            for endpoint, ids in groups
+        ))
+
+        for (endpoint, _), result in zip(groups, results):
+            for failure in result.failed:
+                logger.warning(
+                    "Cleanup: failed to delete %s %r: %s",
+                    type(endpoint).__name__, failure.item, failure.error,
+                )
+        return list(results)
@@ -1,15 +1,59 @@
 from __future__ import annotations
 
-from typing import Optional, Type
+import importlib
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
 
-from httpx import AsyncClient
+from httpx import AsyncBaseTransport, AsyncClient
 from pydantic import BaseModel
 
 from .config import APIConfig
 from .auth import AsyncAuthStrategy
+from .cleanup import CleanupRegistry
 from .http_client import AsyncHTTPClient, HttpxAsyncClient
+from .types import ValidateMode
 
-from .endpoints.posts import PostsEndpoint
+if TYPE_CHECKING:
+    from .endpoints.base import BaseEndpoint
+    from .endpoints.posts import PostsEndpoint
+
+EndpointSpec = Union[str, Type["BaseEndpoint"]]
+
+
+def _resolve_endpoint(spec: EndpointSpec) -> Type["BaseEndpoint"]:
+    """
+    Класс endpoint'а по спецификации из ENDPOINTS.
+
+    Строка вида "module:Class" импортируется при первом обращении;
+    относительный модуль (".endpoints.posts") считается от пакета клиента.
+    """
+
+    if not isinstance(spec, str):
+        return spec
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"Endpoint spec must look like 'module:Class', got {spec!r}")
+    return getattr(importlib.import_module(module, __package__), name)
+
+
+class _LazyEndpoint:
+    """
+    Дескриптор endpoint'а: класс импортируется, а экземпляр создаётся при первом
+    обращении к атрибуту и кэшируется в __dict__ клиента (дальше дескриптор не вызывается).
+    """
+
+    def __init__(self, spec: EndpointSpec):
+        self._spec = spec
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Optional["AsyncAPIClient"], owner: type) -> Any:
+        if instance is None:
+            return self
+        endpoint = _resolve_endpoint(self._spec)(instance._http, instance)
+        instance.__dict__[self._name] = endpoint
+        return endpoint
 
 
 class AsyncAPIClient:
@@ -27,18 +71,29 @@ class AsyncAPIClient:
             await client.users.list()
 
     Атрибуты:
-    - ENDPOINTS: маппинг имён -> классы endpoint'ов (Type[BaseEndpoint]).
-      Элементы этого словаря преобразуются в атрибуты экземпляра при инициализации.
-    - users: статическая аннотация для IDE; реальный атрибут создаётся динамически.
+    - ENDPOINTS: маппинг имён -> классы endpoint'ов (Type[BaseEndpoint]) или строки
+      "module:Class". Элементы словаря становятся ленивыми атрибутами: модуль
+      endpoint'а импортируется, а экземпляр создаётся при первом обращении.
+      Подклассы могут переопределить ENDPOINTS — атрибуты пересобираются автоматически.
+    - posts: статическая аннотация для IDE; реальный атрибут создаётся динамически.
+    - typed_results: если True, методы endpoint'ов возвращают APIResult
+      (провалидированная модель, статус, заголовки, тайминг) вместо httpx.Response.
+    - cleanup: реестр ресурсов на удаление (см. BulkMixin.create_many(register_cleanup=True));
+      при cleanup_on_close=True всё зарегистрированное удаляется в aclose одним проходом.
     """
 
-    ENDPOINTS = {
-        "posts": PostsEndpoint,
+    ENDPOINTS: dict[str, EndpointSpec] = {
+        "posts": ".endpoints.posts:PostsEndpoint",
     }
 
-    # Аннотации для IDE и автодополнения. Реальные атрибуты создаются динамически в _register_endpoints.
+    # Аннотации для IDE и автодополнения. Реальные атрибуты — ленивые дескрипторы (_register_endpoints).
     posts: PostsEndpoint
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "ENDPOINTS" in cls.__dict__:
+            cls._register_endpoints()
+
     def __init__(
             self,
             config: APIConfig,
@@ -47,9 +102,15 @@ class AsyncAPIClient:
             http_client: Optional[AsyncHTTPClient] = None,
             error_models: Optional[dict[int, Type[BaseModel]]] = None,
             validate_request: bool = True,
-            validate_response: bool = True,
+            validate_response: ValidateMode = True,
             validate_status: bool = True,
+            typed_results: bool = False,
+            cleanup_on_close: bool = True,
+            transport: Optional[AsyncBaseTransport] = None,
     ):
+        self.typed_results = typed_results
+        self.cleanup = CleanupRegistry()
+        self._cleanup_on_close = cleanup_on_close
         self._http: AsyncHTTPClient = http_client or HttpxAsyncClient(
             config,
             auth=auth,
@@ -58,30 +119,26 @@ class AsyncAPIClient:
             validate_request=validate_request,
             validate_response=validate_response,
             validate_status=validate_status,
+            transport=transport,
         )
 
-        try:
-            self._register_endpoints()
-        except Exception:
-            await_close = self._http.aclose()
-            del await_close
-            raise
-
-    def _register_endpoints(self) -> None:
+    @classmethod
+    def _register_endpoints(cls) -> None:
         """
-        Регистрирует конечные точки (endpoints) как атрибуты клиента.
+        Регистрирует конечные точки (endpoints) как ленивые атрибуты класса.
 
-        Для каждой пары (name, EndpointClass) в словаре `ENDPOINTS` создаётся
-        экземпляр класса конечной точки и присваивается в `self` под именем `name`.
-        Конструктор класса конечной точки ожидается в виде:
+        Для каждой пары (name, spec) в словаре `ENDPOINTS` на классе ставится
+        дескриптор: при первом обращении `client.<name>` класс endpoint'а
+        импортируется и создаётся его экземпляр:
             EndpointClass(http_client: AsyncHTTPClient, client: AsyncAPIClient)
 
-        После выполнения метода к клиенту можно обращаться через атрибуты,
-        например: `client.users`.
+        Экземпляр кэшируется в клиенте — повторные обращения возвращают тот же объект.
         """
 
-        for name, cls in self.ENDPOINTS.items():
-            setattr(self, name, cls(self._http, self))
+        for name, spec in cls.ENDPOINTS.items():
+            descriptor = _LazyEndpoint(spec)
+            descriptor.__set_name__(cls, name)
+            setattr(cls, name, descriptor)
 
     async def __aenter__(self) -> "AsyncAPIClient":
         return self
@@ -90,4 +147,11 @@ class AsyncAPIClient:
         await self.aclose()
 
     async def aclose(self) -> None:
-        await self._http.aclose()
+        try:
+            if self._cleanup_on_close:
+                await self.cleanup.sweep()
+        finally:
+            await self._http.aclose()
+
+
+AsyncAPIClient._register_endpoints()
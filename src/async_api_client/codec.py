@@ -0,0 +1,136 @@
+"""
+JSON-кодеки для HTTP-клиента.
+
+Кодек отвечает за сериализацию тел запросов и разбор тел ответов.
+По умолчанию — stdlib json; быстрый бэкенд (orjson) — явным выбором.
+
+    codec = get_codec("json")      # stdlib (по умолчанию)
+    codec = get_codec("auto")      # orjson, если доступен, иначе json
+    data = codec.dumps({"a": 1})   # → bytes
+    obj = codec.loads(data)        # ValueError при невалидном JSON
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+from httpx import Response
+
+try:
+    import orjson
+except ImportError:  # опциональная зависимость
+    orjson = None
+
+# Ключ в response.extensions, под которым кэшируется разобранное тело
+DECODED_JSON_KEY = "decoded_json"
+
+
+class JSONCodec(ABC):
+    """
+    Абстрактный JSON-кодек.
+
+    `dumps` возвращает UTF-8 байты, `loads` принимает bytes/str и при
+    невалидном JSON поднимает ValueError (или его наследника).
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes: ...
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} name={self.name!r}>"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Кодек на стандартном модуле json — всегда доступен."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Кодек на orjson. Требует `pip install orjson`.
+
+    Строже stdlib: целые больше 64 бит и NaN/Infinity в ответе — ошибка
+    разбора (ValueError), stdlib json их принимает.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+# Порядок предпочтения для режима "auto"
+_AUTO_ORDER = ("orjson", "json")
+
+
+def get_codec(name: str = "json") -> JSONCodec:
+    """
+    Кодек по имени.
+
+    :param name: "auto" — самый быстрый из установленных; иначе ключ из CODECS
+    :raises ValueError: неизвестное имя
+    :raises ImportError: бэкенд явно запрошен, но не установлен
+    """
+
+    if name == "auto":
+        for candidate in _AUTO_ORDER:
+            try:
+                return CODECS[candidate]()
+            except ImportError:
+                continue
+
+    try:
+        codec_cls = CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected 'auto' or one of {sorted(CODECS)}") from None
+    return codec_cls()
+
+
+def available_codecs() -> list[str]:
+    """Имена кодеков, бэкенды которых установлены в окружении."""
+
+    names = []
+    for name, codec_cls in CODECS.items():
+        try:
+            codec_cls()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def decode_response(response: Response, codec: JSONCodec) -> Any:
+    """
+    Разобрать JSON-тело ответа один раз за его жизнь.
+
+    Результат кэшируется в response.extensions — повторные вызовы
+    (логгер, валидатор, тест) не декодируют тело заново.
+    """
+
+    if DECODED_JSON_KEY not in response.extensions:
+        response.extensions[DECODED_JSON_KEY] = codec.loads(response.content)
+    return response.extensions[DECODED_JSON_KEY]
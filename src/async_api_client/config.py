@@ -4,6 +4,26 @@ from dataclasses import dataclass, field
 from typing import Literal, Optional
 
 
+@dataclass(frozen=True)
+class ValidationSampling:
+    """
+    Параметры выборочной валидации коллекций (validate_response="sample").
+
+    Проверяются первые `head` элементов, последние `tail` и `random`
+    элементов из середины, выбранных детерминированно по `seed`.
+    Если коллекция не больше head + tail + random — проверяется целиком.
+    """
+
+    head: int = 100
+    tail: int = 100
+    random: int = 300
+    seed: int = 0
+
+    def __post_init__(self):
+        if min(self.head, self.tail, self.random) < 0:
+            raise ValueError(f"sampling sizes must be non-negative, got {self!r}")
+
+
 @dataclass(frozen=True)
 class BaseHTTPConfig:
     """
@@ -23,6 +43,12 @@ class BaseHTTPConfig:
     max_keepalive_connections: int = 20
     request_trace_id_header: str = "X-TRACE-ID"
     max_log_body: int = 4096
+    validation_sampling: ValidationSampling = field(default_factory=ValidationSampling)
+    json_codec: str = "json"
+    # Ответы крупнее offload_threshold байт декодируются/валидируются вне event loop (None — никогда)
+    offload_threshold: Optional[int] = None
+    offload_executor: Literal["thread", "process"] = "thread"
+    offload_max_workers: Optional[int] = None
 
     def __post_init__(self):
         if self.host.startswith(("http://", "https://")):
@@ -1,9 +1,44 @@
-"""Эндпоинты по ресурсам API."""
+"""Эндпоинты по ресурсам API. Классы импортируются лениво — по первому обращению."""
 
-from .base import BaseEndpoint
-from .posts import PostsEndpoint
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseEndpoint
+    from .bulk import BulkMixin, BulkResult, BulkItemResult
+    from .posts import PostsEndpoint
+
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".base": ("BaseEndpoint",),
+    ".bulk": (
+        "BulkMixin",
+        "BulkResult",
+        "BulkItemResult",
+    ),
+    ".posts": ("PostsEndpoint",),
+}
+
+_EXPORT_MODULES: dict[str, str] = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "BaseEndpoint",
+    "BulkMixin",
+    "BulkResult",
+    "BulkItemResult",
     "PostsEndpoint",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
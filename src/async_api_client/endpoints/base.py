@@ -1,7 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Type, Union
+
+from httpx import Response
+from pydantic import BaseModel
 
 from ..http_client import AsyncHTTPClient
+from ..pagination import PaginationStrategy, paginate
+from ..results import APIResult
 
 if TYPE_CHECKING:
     from ..client import AsyncAPIClient
@@ -10,4 +15,42 @@ if TYPE_CHECKING:
 class BaseEndpoint:
     def __init__(self, http: AsyncHTTPClient, client: "AsyncAPIClient"):
         self._http = http
-        self._client = client
\ No newline at end of file
+        self._client = client
+
+    def _result(
+            self,
+            response: Response,
+            model: Optional[Type[BaseModel]] = None,
+            many: bool = False,
+    ) -> Union[Response, APIResult]:
+        """
+        Вернуть ответ в форме, выбранной клиентом: сырой httpx.Response
+        или APIResult с лениво разобранной моделью (typed_results=True).
+        """
+
+        if not getattr(self._client, "typed_results", False):
+            return response
+        return APIResult(response, model=model, many=many, decode=self._http.json)
+
+    def paginate(
+            self,
+            path: str,
+            strategy: PaginationStrategy,
+            params: Optional[dict[str, Any]] = None,
+            item_model: Optional[Type[BaseModel]] = None,
+            prefetch: int = 0,
+            max_pages: Optional[int] = None,
+            **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Элементы коллекции по всем страницам — асинхронный генератор.
+
+        См. pagination.paginate: prefetch > 0 запрашивает следующие страницы
+        параллельно (для стратегий с supports_prefetch).
+        """
+
+        return paginate(
+            self._http, path, strategy,
+            params=params, item_model=item_model, prefetch=prefetch, max_pages=max_pages,
+            **kwargs,
+        )
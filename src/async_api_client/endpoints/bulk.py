@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generic, Iterable, Optional, TypeVar
+
+from httpx import Response
+
+from ..exceptions import APIError
+from ..results import APIResult
+
+if TYPE_CHECKING:
+    from ..cleanup import CleanupRegistry
+
+logger = logging.getLogger("async_api_client")
+
+T = TypeVar("T")
+
+DEFAULT_BULK_CONCURRENCY = 10
+
+
+@dataclass(frozen=True)
+class BulkItemResult(Generic[T]):
+    """Итог операции над одним элементом: value при успехе, error при ошибке."""
+
+    item: Any
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResult(Generic[T]):
+    """Результаты bulk-операции в порядке входных элементов."""
+
+    def __init__(self, items: list[BulkItemResult[T]]):
+        self._items = items
+
+    @property
+    def items(self) -> list[BulkItemResult[T]]:
+        return list(self._items)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult[T]]:
+        return [r for r in self._items if r.ok]
+
+    @property
+    def failed(self) -> list[BulkItemResult[T]]:
+        return [r for r in self._items if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self._items)
+
+    @property
+    def values(self) -> list[T]:
+        """Значения успешных операций."""
+        return [r.value for r in self._items if r.ok]
+
+    def raise_for_errors(self) -> None:
+        """Поднять первую ошибку, если хоть одна операция не удалась."""
+
+        failed = self.failed
+        if failed:
+            raise AssertionError(
+                f"{len(failed)} of {len(self._items)} bulk operations failed; "
+                f"first: {failed[0].item!r} → {type(failed[0].error).__name__}: {failed[0].error}"
+            ) from failed[0].error
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"<BulkResult ok={len(self.succeeded)} failed={len(self.failed)}>"
+
+
+async def run_bulk(
+        operation: Callable[[Any], Awaitable[T]],
+        items: Iterable[Any],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> BulkResult[T]:
+    """
+    Выполнить operation для каждого элемента с ограничением параллелизма.
+
+    Ошибка одного элемента (APIError или AssertionError) не прерывает остальные —
+    она попадает в BulkItemResult. Прочие исключения (TypeError в вызове и т.п.) —
+    ошибки программы, а не элемента: они пробрасываются.
+    """
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(item: Any) -> BulkItemResult[T]:
+        async with semaphore:
+            try:
+                return BulkItemResult(item=item, value=await operation(item))
+            except (APIError, AssertionError) as exc:
+                return BulkItemResult(item=item, error=exc)
+
+    return BulkResult(list(await asyncio.gather(*(run_one(item) for item in items))))
+
+
+class BulkMixin:
+    """
+    Bulk-операции для CRUD-endpoint'а с методами get(id), create(payload), delete(id).
+
+    Каждый элемент идёт через обычный метод endpoint'а — с той же валидацией
+    статуса и моделей. Созданные ресурсы можно зарегистрировать на удаление:
+    AsyncAPIClient удалит их одним параллельным проходом при закрытии.
+
+        class UsersEndpoint(BulkMixin, BaseEndpoint):
+            ...
+    """
+
+    # Поле идентификатора в теле ответа create()
+    ID_FIELD = "id"
+
+    async def get_many(
+            self,
+            ids: Iterable[Any],
+            concurrency: int = DEFAULT_BULK_CONCURRENCY,
+            **kwargs: Any,
+    ) -> BulkResult:
+        return await run_bulk(lambda resource_id: self.get(resource_id, **kwargs), ids, concurrency)
+
+    async def create_many(
+            self,
+            payloads: Iterable[Any],
+            concurrency: int = DEFAULT_BULK_CONCURRENCY,
+            register_cleanup: bool = False,
+            **kwargs: Any,
+    ) -> BulkResult:
+        """
+        :param register_cleanup: зарегистрировать созданные ресурсы на удаление при закрытии клиента
+        """
+
+        async def create(payload: Any) -> Any:
+            value = await self.create(payload, **kwargs)
+            if register_cleanup:
+                self._cleanup_registry().register(self, self.extract_id(value))
+            return value
+
+        return await run_bulk(create, payloads, concurrency)
+
+    async def delete_many(
+            self,
+            ids: Iterable[Any],
+            concurrency: int = DEFAULT_BULK_CONCURRENCY,
+            **kwargs: Any,
+    ) -> BulkResult:
+        return await run_bulk(lambda resource_id: self.delete(resource_id, **kwargs), ids, concurrency)
+
+    def extract_id(self, value: Any) -> Any:
+        """Идентификатор созданного ресурса из результата create() (Response или APIResult)."""
+
+        response = value.response if isinstance(value, APIResult) else value
+        if not isinstance(response, Response):
+            raise TypeError(f"Cannot extract id from {type(value).__name__}")
+        return self._http.json(response)[self.ID_FIELD]
+
+    def _cleanup_registry(self) -> "CleanupRegistry":
+        return self._client.cleanup
@@ -1,56 +1,89 @@
-from typing import Optional, Union, Any
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional, Union, Any
 
 from httpx import Response
 
 from .base import BaseEndpoint
+from .bulk import BulkMixin
 from http import HTTPStatus
 from ..http_client import StatusCode
+from ..pagination import OffsetPagination
+from ..results import APIResult
+
+from src.async_api_client.models.posts import Comment, Post, PostCreate
 
-from src.async_api_client.models.posts import Post, PostCreate
 
+class PostsEndpoint(BulkMixin, BaseEndpoint):
+    """
+    /posts. Bulk-операции (get_many, create_many, delete_many) — из BulkMixin.
+    """
 
-class PostsEndpoint(BaseEndpoint):
     PATH = "/posts"
 
     async def list(
             self,
             user_id: Optional[int] = None,
             expected_status: StatusCode = HTTPStatus.OK,
-    ) -> Response:
+            **kwargs: Any,
+    ) -> Union[Response, APIResult[list[Post]]]:
         params = {"userId": user_id} if user_id is not None else None
-        return await self._http.get(
+        model = Post if expected_status == HTTPStatus.OK else None
+        response = await self._http.get(
             self.PATH,
             params=params,
             expected_status=expected_status,
+            response_model=model,
+            **kwargs,
+        )
+        return self._result(response, model, many=True)
+
+    def iterate(
+            self,
+            user_id: Optional[int] = None,
+            page_size: int = 20,
+            prefetch: int = 2,
+            **kwargs: Any,
+    ) -> AsyncIterator[Post]:
+        """Все посты постранично (JSONPlaceholder: _page/_limit + X-Total-Count)."""
+
+        params = {"userId": user_id} if user_id is not None else None
+        strategy = OffsetPagination(limit=page_size, page_param="_page", limit_param="_limit")
+        return self.paginate(
+            self.PATH, strategy, params=params, item_model=Post, prefetch=prefetch, **kwargs,
         )
 
     async def get(
             self,
             post_id: int,
             expected_status: StatusCode = HTTPStatus.OK,
-    ) -> Response:
-        model = Post if expected_status == HTTPStatus.OK else None
-        return await self._http.get(
+            **kwargs: Any,
+    ) -> Union[Response, APIResult[Post]]:
+        model = kwargs.pop("response_model", Post if expected_status == HTTPStatus.OK else None)
+        kwargs.setdefault("validate_response", False)
+        response = await self._http.get(
             f"{self.PATH}/{post_id}",
             expected_status=expected_status,
             response_model=model,
-            validate_response=False,
+            **kwargs,
         )
+        return self._result(response, model)
 
     async def create(
             self,
             payload: Union[PostCreate, dict],
             expected_status: StatusCode = HTTPStatus.CREATED,
             **kwargs: Any,
-    ) -> Response:
+    ) -> Union[Response, APIResult[Post]]:
         model = Post if expected_status == HTTPStatus.CREATED else None
-        return await self._http.post(
+        response = await self._http.post(
             self.PATH,
             json=payload,
             expected_status=expected_status,
             response_model=model,
             **kwargs,
         )
+        return self._result(response, model)
 
     async def update(
             self,
@@ -58,13 +91,14 @@ class PostsEndpoint(BaseEndpoint):
             payload: dict,
             expected_status: StatusCode = HTTPStatus.OK,
             **kwargs: Any,
-    ) -> Response:
-        return await self._http.put(
+    ) -> Union[Response, APIResult]:
+        response = await self._http.put(
             f"{self.PATH}/{post_id}",
             json=payload,
             expected_status=expected_status,
             **kwargs,
         )
+        return self._result(response)
 
     async def patch(
             self,
@@ -72,32 +106,39 @@ class PostsEndpoint(BaseEndpoint):
             payload: dict,
             expected_status: StatusCode = HTTPStatus.OK,
             **kwargs: Any,
-    ) -> Response:
-        return await self._http.patch(
+    ) -> Union[Response, APIResult]:
+        response = await self._http.patch(
             f"{self.PATH}/{post_id}",
             json=payload,
             expected_status=expected_status,
             **kwargs,
         )
+        return self._result(response)
 
     async def delete(
             self,
             post_id: int,
             expected_status: StatusCode = HTTPStatus.OK,  # ← у JSONPlaceholder именно HTTPStatus.OK, не 204
-    ) -> Response:
-        return await self._http.delete(
+            **kwargs: Any,
+    ) -> Union[Response, APIResult]:
+        response = await self._http.delete(
             f"{self.PATH}/{post_id}",
             expected_status=expected_status,
+            **kwargs,
         )
+        return self._result(response)
 
     async def comments(
             self,
             post_id: int,
             expected_status: StatusCode = HTTPStatus.OK,
-    ) -> Response:
+    ) -> Union[Response, APIResult[list[Comment]]]:
         """Вложенный ресурс: /posts/{id}/comments"""
 
-        return await self._http.get(
+        model = Comment if expected_status == HTTPStatus.OK else None
+        response = await self._http.get(
             f"{self.PATH}/{post_id}/comments",
             expected_status=expected_status,
+            response_model=model,
         )
+        return self._result(response, model, many=True)
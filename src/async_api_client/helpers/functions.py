@@ -1,6 +1,59 @@
+import re
 from typing import Optional, Any
+from urllib.parse import parse_qsl, urlencode
 from ..constants import SENSITIVE_HEADERS, SENSITIVE_BODY_KEYS
 
+# "key": для чувствительных ключей; значение разбирается отдельно (_sensitive_value_end)
+_SENSITIVE_JSON_KEY = re.compile(
+    r'"(?:%s)"\s*:\s*' % "|".join(re.escape(key) for key in sorted(SENSITIVE_BODY_KEYS)),
+    re.IGNORECASE,
+)
+# Скалярное значение. Строка может быть оборвана обрезкой, поэтому закрывающая кавычка опциональна.
+_JSON_SCALAR = re.compile(r'"(?:[^"\\]|\\.)*"?|[^\s,}\]{\[][^\s,}\]]*')
+
+
+def _sensitive_value_end(text: str, start: int) -> Optional[int]:
+    """Конец значения, начинающегося в start: скаляр или сбалансированный объект/массив (до конца при обрезке)."""
+
+    if start >= len(text):
+        return None
+    if text[start] not in "{[":
+        scalar = _JSON_SCALAR.match(text, start)
+        return scalar.end() if scalar else None
+
+    depth = 0
+    index = start
+    while index < len(text):
+        char = text[index]
+        if char == '"':
+            string = _JSON_SCALAR.match(text, index)
+            index = string.end()
+            continue
+        if char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(text)
+
+
+def _mask_sensitive_json(text: str) -> str:
+    parts = []
+    position = 0
+    for match in _SENSITIVE_JSON_KEY.finditer(text):
+        if match.start() < position:
+            continue  # ключ внутри уже замаскированного значения
+        end = _sensitive_value_end(text, match.end())
+        if end is None:
+            continue
+        parts.append(text[position:match.end()])
+        parts.append('"***"')
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
 
 def mask_headers(headers: dict, mask_sensitive_values: bool = True) -> dict:
     """Маскирует чувствительные значения в headers"""
@@ -25,6 +78,30 @@ def mask_body(payload: Any) -> Any:
     return payload
 
 
+def mask_json_bytes(content: bytes, limit: Optional[int] = None) -> str:
+    """
+    Маскирует чувствительные поля прямо в сериализованном JSON, не разбирая документ.
+
+    Декодируются только первые `limit` байт — для больших тел это дешевле,
+    чем json.loads + mask_body + str. Значение ключа из SENSITIVE_BODY_KEYS
+    заменяется на "***" целиком — скаляр, объект или массив (как в mask_body).
+    """
+
+    head = content if limit is None else content[:limit]
+    text = head.decode("utf-8", errors="replace")
+    masked = _mask_sensitive_json(text)
+    if limit is not None and len(content) > limit:
+        return f"{masked}... [truncated, {len(content)} bytes total]"
+    return masked
+
+
+def mask_form_bytes(content: bytes) -> str:
+    """Маскирует чувствительные поля тела application/x-www-form-urlencoded (как mask_body)."""
+
+    pairs = parse_qsl(content.decode("utf-8", errors="replace"), keep_blank_values=True)
+    return urlencode([(key, mask_body({key: value})[key]) for key, value in pairs], safe="*")
+
+
 def truncate(text: str, limit: Optional[int] = None) -> str:
     """
     Обрезает message(payload, response_body)
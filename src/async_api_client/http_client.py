@@ -11,12 +11,13 @@ from pydantic import BaseModel
 from http import HTTPStatus
 from src.async_api_client.redirects import RedirectTracker
 
-from . import validators
+from . import metrics, offload, validators
+from .codec import JSONCodec, decode_response, get_codec
 from .request_logger import RequestLogger
 
-from .config import APIConfig
+from .config import APIConfig, ValidationSampling
 from .auth import AsyncAuthStrategy, NoAuth
-from .types import StatusCode, ResponseModel, RequestModel
+from .types import StatusCode, ResponseModel, RequestModel, ValidateMode
 from .exceptions import (
     APITimeoutError,
     APITransportError
@@ -39,6 +40,10 @@ class AsyncHTTPClient(ABC):
     @abstractmethod
     async def aclose(self) -> None: ...
 
+    def json(self, response: Response) -> Any:
+        """Разобрать JSON-тело ответа. Реализации могут кэшировать результат или менять кодек."""
+        return response.json()
+
     async def __aenter__(self) -> "AsyncHTTPClient":
         return self
 
@@ -69,6 +74,12 @@ class HttpxAsyncClient(AsyncHTTPClient):
       • Если передан response_model — валидируем им.
       • Иначе — берём модель из error_models по status_code (401/403/404/422/5xx).
       • Если в реестре нет модели для статуса — пропускаем валидацию.
+      • validate_response="sample" — JSON-массивы проверяются выборочно
+        по config.validation_sampling (или validation_sampling на запрос).
+
+    JSON кодируется/декодируется через `codec` (по умолчанию — config.json_codec).
+    `transport` подменяет сетевой транспорт собственной сессии (кассеты, mock-сервер);
+    при переданной `session` не используется.
     """
 
     def __init__(
@@ -78,9 +89,11 @@ class HttpxAsyncClient(AsyncHTTPClient):
             session: Optional[AsyncClient] = None,
             error_models: Optional[dict[int, Type[BaseModel]]] = None,
             validate_request: bool = True,
-            validate_response: bool = True,
+            validate_response: ValidateMode = True,
             validate_status: bool = True,
-            logger: Optional[RequestLogger] = None
+            logger: Optional[RequestLogger] = None,
+            codec: Optional[JSONCodec] = None,
+            transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self._config = config
         self._auth = auth or NoAuth()
@@ -89,6 +102,7 @@ class HttpxAsyncClient(AsyncHTTPClient):
         self._validate_request = validate_request
         self._validate_response = validate_response
         self._validate_status = validate_status
+        self._codec = codec or get_codec(config.json_codec)
 
         self._request_id_header = config.request_trace_id_header
         self._max_log_body = config.max_log_body
@@ -96,13 +110,21 @@ class HttpxAsyncClient(AsyncHTTPClient):
         self._req_logger = logger or RequestLogger(max_body_size=config.max_log_body)
 
         if session is None:
-            session = self._build_session()
+            session = self._build_session(transport)
         self._session = session
 
     @property
     def session(self) -> AsyncClient:
         return self._session
 
+    @property
+    def codec(self) -> JSONCodec:
+        return self._codec
+
+    def json(self, response: Response) -> Any:
+        """Тело ответа через кодек клиента; повторно не декодирует, если валидатор уже разобрал."""
+        return decode_response(response, self._codec)
+
     async def request(
             self,
             method: str,
@@ -111,9 +133,10 @@ class HttpxAsyncClient(AsyncHTTPClient):
             response_model: ResponseModel = None,
             request_model: RequestModel = None,
             validate_request: Optional[bool] = None,
-            validate_response: Optional[bool] = None,
+            validate_response: Optional[ValidateMode] = None,
             validate_status: Optional[bool] = None,
             follow_redirects: Optional[bool] = None,
+            validation_sampling: Optional[ValidationSampling] = None,
             **kwargs: Any,
     ) -> Response:
         method = method.upper()
@@ -127,6 +150,7 @@ class HttpxAsyncClient(AsyncHTTPClient):
             kwargs,
             request_model=request_model,
             validate=do_validate_req,
+            codec=self._codec,
         )
 
         raw_headers = kwargs.pop("headers", {}) or {}
@@ -148,23 +172,64 @@ class HttpxAsyncClient(AsyncHTTPClient):
                 self._req_logger.log_failure(request_id, method, path, start, exc)
                 raise APITransportError(f"Network error: {exc}") from exc
 
+            received = time.monotonic()
+            metrics.observe_request(method, response.request.url.path, received - start)
             if response.history:
                 response.extensions["redirects"] = RedirectTracker.track(response, request_id)
-            self._req_logger.log_response(request_id, response, start)
+
+            sampling = None
+            if do_validate_resp == "sample":
+                sampling = validation_sampling or self._config.validation_sampling
+
+            if not self._should_offload(response):
+                self._req_logger.log_response(request_id, response, start, end=received)
+
+                if do_validate_status:
+                    validators.assert_status(response, expected_status)
+
+                if do_validate_resp:
+                    validators.validate_body(
+                        response, response_model, self._error_models, sampling, codec=self._codec,
+                    )
+                return response
+
+            # Большой ответ: подготовка тела для логов и валидация — в пуле, Allure и лог — здесь
+            detached = await offload.run_in_pool(
+                self._config.offload_executor,
+                self._config.offload_max_workers,
+                offload.process_response,
+                response,
+                max_body=self._req_logger.max_body_size,
+                validate=bool(do_validate_resp),
+                response_model=response_model,
+                error_models=self._error_models,
+                sampling=sampling,
+                codec=self._codec,
+            )
+            self._req_logger.log_response(
+                request_id, response, start, end=received, rendered_body=detached.rendered_body,
+            )
 
             if do_validate_status:
                 validators.assert_status(response, expected_status)
 
-            if do_validate_resp:
-                validators.validate_body(response, response_model, self._error_models)
+            if detached.sample is not None:
+                response.extensions["validation_sample"] = detached.sample
+                validators.attach_sample_report(detached.sample)
+            if detached.error is not None:
+                raise detached.error
 
             return response
 
+    def _should_offload(self, response: Response) -> bool:
+        threshold = self._config.offload_threshold
+        return threshold is not None and len(response.content) >= threshold
+
     async def aclose(self) -> None:
         if self._owns_session:
             await self._session.aclose()
 
-    def _build_session(self) -> AsyncClient:
+    def _build_session(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> AsyncClient:
         limits = httpx.Limits(
             max_connections=self._config.max_connections,
             max_keepalive_connections=self._config.max_keepalive_connections,
@@ -176,4 +241,5 @@ class HttpxAsyncClient(AsyncHTTPClient):
             headers=self._config.default_headers,
             limits=limits,
             follow_redirects=self._config.follow_redirects,
+            transport=transport,
         )
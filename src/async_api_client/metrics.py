@@ -0,0 +1,222 @@
+"""
+Гистограмма задержек с ограниченной относительной погрешностью.
+
+Значения хранятся в микросекундах в лог-линейных корзинах (как в HdrHistogram):
+на каждую двоичную октаву — 2^(SUB_BITS-1) корзин, поэтому погрешность
+перцентиля не превышает ~1/2^(SUB_BITS-1) (≈0.8% при SUB_BITS=8) при любом
+диапазоне — от микросекунд до минут. Корзины хранятся разреженно, гистограммы
+складываются (merge) и сериализуются в JSON — их можно собирать с воркеров.
+
+    hist = LatencyHistogram()
+    hist.record(0.0123)             # секунды
+    hist.percentile(99)             # → секунды
+    total = LatencyHistogram.merged([a, b, c])
+
+RequestMetrics — гистограммы по endpoint'ам ("GET /posts/{id}"), которые
+HttpxAsyncClient пополняет на каждом ответе, пока активен collect_requests():
+
+    with collect_requests() as requests:
+        await client.posts.get(1)
+    requests.endpoints["GET /posts/{id}"].percentile(95)
+"""
+
+import re
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+SUB_BITS = 8
+_SUB_COUNT = 1 << SUB_BITS
+_HALF = _SUB_COUNT >> 1
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9)
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+def _bucket(value_us: int) -> int:
+    if value_us < _SUB_COUNT:
+        return value_us
+    shift = value_us.bit_length() - SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF + ((value_us >> shift) - _HALF)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """[нижняя, верхняя] граница корзины в микросекундах (включительно)."""
+
+    if index < _SUB_COUNT:
+        return index, index
+    shift = (index - _SUB_COUNT) // _HALF + 1
+    mantissa = (index - _SUB_COUNT) % _HALF + _HALF
+    low = mantissa << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Гистограмма задержек (секунды на входе и выходе, микросекунды внутри)."""
+
+    __slots__ = ("_counts", "count", "_sum_us", "_min_us", "_max_us")
+
+    def __init__(self):
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self._sum_us = 0
+        self._min_us: Optional[int] = None
+        self._max_us = 0
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        index = _bucket(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self._sum_us += value * count
+        if self._min_us is None or value < self._min_us:
+            self._min_us = value
+        if value > self._max_us:
+            self._max_us = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self._sum_us += other._sum_us
+        if other._min_us is not None and (self._min_us is None or other._min_us < self._min_us):
+            self._min_us = other._min_us
+        self._max_us = max(self._max_us, other._max_us)
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> "LatencyHistogram":
+        total = cls()
+        for histogram in histograms:
+            total.merge(histogram)
+        return total
+
+    @property
+    def min(self) -> float:
+        return (self._min_us or 0) / 1_000_000
+
+    @property
+    def max(self) -> float:
+        return self._max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self._sum_us / self.count / 1_000_000 if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Значение, не превышаемое q% замеров (верхняя граница корзины, не больше max)."""
+
+        if not self.count:
+            return 0.0
+        if not 0 <= q <= 100:
+            raise ValueError(f"percentile must be in [0, 100], got {q}")
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1], self._max_us) / 1_000_000
+        return self.max
+
+    def percentiles(self, qs: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        return {f"p{q:g}": self.percentile(q) for q in qs}
+
+    def summary(self, qs: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        """Сводка в миллисекундах — для отчётов."""
+
+        return {
+            "count": self.count,
+            "min_ms": round(self.min * 1000, 3),
+            "mean_ms": round(self.mean * 1000, 3),
+            **{f"{name}_ms": round(value * 1000, 3) for name, value in self.percentiles(qs).items()},
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "counts": {str(index): count for index, count in self._counts.items()},
+            "count": self.count,
+            "sum_us": self._sum_us,
+            "min_us": self._min_us,
+            "max_us": self._max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram._counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram._sum_us = data["sum_us"]
+        histogram._min_us = data["min_us"]
+        histogram._max_us = data["max_us"]
+        return histogram
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "<LatencyHistogram empty>"
+        return (
+            f"<LatencyHistogram n={self.count} p50={self.percentile(50) * 1000:.2f}ms "
+            f"p99={self.percentile(99) * 1000:.2f}ms max={self.max * 1000:.2f}ms>"
+        )
+
+
+def template_path(path: str) -> str:
+    """/posts/17/comments → /posts/{id}/comments (числа и UUID) — ключ endpoint'а в статистике."""
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+class RequestMetrics:
+    """Задержки ответов по endpoint'ам: {"METHOD /templated/path": LatencyHistogram}."""
+
+    def __init__(self):
+        self.endpoints: dict[str, LatencyHistogram] = {}
+
+    @property
+    def count(self) -> int:
+        return sum(histogram.count for histogram in self.endpoints.values())
+
+    def record(self, method: str, path: str, seconds: float) -> None:
+        key = f"{method} {template_path(path)}"
+        histogram = self.endpoints.get(key)
+        if histogram is None:
+            histogram = self.endpoints[key] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def merge(self, other: "RequestMetrics") -> "RequestMetrics":
+        for key, histogram in other.endpoints.items():
+            self.endpoints.setdefault(key, LatencyHistogram()).merge(histogram)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: histogram.to_dict() for key, histogram in self.endpoints.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RequestMetrics":
+        metrics = cls()
+        metrics.endpoints = {key: LatencyHistogram.from_dict(h) for key, h in data.items()}
+        return metrics
+
+
+# Активные сборщики; обычно ноль или один (на время теста), поэтому проверка почти бесплатна
+_collectors: list[RequestMetrics] = []
+
+
+@contextmanager
+def collect_requests() -> Iterator[RequestMetrics]:
+    """Собирать задержки всех ответов HttpxAsyncClient процесса на время блока."""
+
+    metrics = RequestMetrics()
+    _collectors.append(metrics)
+    try:
+        yield metrics
+    finally:
+        _collectors.remove(metrics)
+
+
+def observe_request(method: str, path: str, seconds: float) -> None:
+    """Вызывается транспортом на каждый ответ."""
+
+    for metrics in _collectors:
+        metrics.record(method, path, seconds)
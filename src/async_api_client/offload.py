@@ -0,0 +1,115 @@
+"""
+Вынос тяжёлой обработки больших ответов с event loop в пул потоков или процессов.
+
+Декодирование JSON, pydantic-валидация и подготовка тела для логов на 50 МБ
+ответе занимают сотни миллисекунд и блокируют все остальные корутины.
+Для ответов крупнее config.offload_threshold эта работа выполняется в пуле:
+
+  • "thread"  — ThreadPoolExecutor; тело, разобранное валидатором, остаётся
+                в кэше ответа (см. codec.decode_response);
+  • "process" — ProcessPoolExecutor; ответ передаётся в воркер через pickle,
+                кэш разобранного тела обратно не возвращается.
+
+Allure-вложения и записи в лог делаются уже на event loop — Allure
+привязывает вложения к текущему тесту по потоку.
+"""
+
+import asyncio
+import atexit
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Optional, Type
+
+from httpx import Response
+from pydantic import BaseModel
+
+from . import validators
+from .codec import JSONCodec
+from .config import ValidationSampling
+from .exceptions import ResponseValidationError
+from .request_logger import render_body
+from .types import ResponseModel
+
+OffloadExecutor = Literal["thread", "process"]
+
+_executors: dict[tuple[OffloadExecutor, Optional[int]], Executor] = {}
+
+
+@dataclass(frozen=True)
+class DetachedResult:
+    """Результат обработки ответа в пуле: тело для логов и итог валидации."""
+
+    rendered_body: tuple[str, Any]
+    sample: Optional[validators.SampleReport] = None
+    error: Optional[ResponseValidationError] = None
+
+
+def get_executor(kind: OffloadExecutor, max_workers: Optional[int] = None) -> Executor:
+    """Общий на процесс пул нужного типа; создаётся лениво при первом обращении."""
+
+    key = (kind, max_workers)
+    executor = _executors.get(key)
+    if executor is None:
+        if kind == "thread":
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-offload")
+        elif kind == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            raise ValueError(f"offload_executor must be 'thread' or 'process', got {kind!r}")
+        _executors[key] = executor
+    return executor
+
+
+async def run_in_pool(
+        kind: OffloadExecutor,
+        max_workers: Optional[int],
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(kind, max_workers),
+        functools.partial(fn, *args, **kwargs),
+    )
+
+
+def process_response(
+        response: Response,
+        max_body: int,
+        validate: bool,
+        response_model: ResponseModel,
+        error_models: dict[int, Type[BaseModel]],
+        sampling: Optional[ValidationSampling],
+        codec: JSONCodec,
+) -> DetachedResult:
+    """
+    Подготовить тело для логов и провалидировать ответ — выполняется в воркере.
+
+    Ошибка валидации не поднимается, а возвращается: транспорт сначала логирует
+    ответ и проверяет статус, и только потом поднимает её.
+    """
+
+    rendered = render_body(response, max_body)
+    if not validate:
+        return DetachedResult(rendered_body=rendered)
+
+    try:
+        validators.validate_body(response, response_model, error_models, sampling, codec=codec, attach=False)
+    except ResponseValidationError as exc:
+        return DetachedResult(rendered_body=rendered, error=exc)
+    return DetachedResult(rendered_body=rendered, sample=response.extensions.get("validation_sample"))
+
+
+def shutdown_executors() -> None:
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _executors.clear()
+
+
+atexit.register(shutdown_executors)
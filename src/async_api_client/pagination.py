@@ -0,0 +1,335 @@
+"""
+Постраничный обход коллекций.
+
+Стратегии пагинации:
+  • OffsetPagination     — page/limit или offset/limit; номера страниц известны заранее,
+                           поэтому следующие страницы можно запрашивать параллельно (prefetch);
+  • CursorPagination     — курсор следующей страницы в теле ответа;
+  • LinkHeaderPagination — URL следующей страницы в заголовке `Link: <...>; rel="next"`.
+
+Курсорная и Link-пагинация последовательны: адрес следующей страницы
+известен только из ответа на текущую, prefetch для них игнорируется.
+
+    async for post in client.posts.paginate("/posts", OffsetPagination(limit=50), prefetch=3):
+        ...
+
+Если цикл прерывается через break, незавершённые prefetch-запросы отменяются
+при закрытии генератора. Чтобы это случилось сразу, а не при сборке мусора,
+оборачивайте обход в `contextlib.aclosing(...)`.
+"""
+
+import asyncio
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional, Type
+
+from httpx import Response
+from pydantic import BaseModel, ValidationError
+
+from .exceptions import ResponseValidationError
+from .http_client import AsyncHTTPClient
+from .validators import model_adapter
+
+logger = logging.getLogger("async_api_client")
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Адрес одной страницы: путь (или абсолютный URL) и query-параметры."""
+
+    path: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+class PaginationStrategy(ABC):
+    """
+    Базовая стратегия пагинации.
+
+    :param items_field: путь до массива элементов в теле через точку ("data.items");
+                        None — тело ответа само является массивом
+    """
+
+    # Можно ли запрашивать страницы, не дожидаясь ответа на предыдущую.
+    # Такие стратегии реализуют page(), total_pages() и is_last() (см. OffsetPagination).
+    supports_prefetch: bool = False
+
+    def __init__(self, items_field: Optional[str] = None):
+        self._items_field = items_field
+
+    @abstractmethod
+    def first_page(self, path: str, params: dict[str, Any]) -> PageRequest: ...
+
+    @abstractmethod
+    def next_page(self, current: PageRequest, response: Response, body: Any) -> Optional[PageRequest]:
+        """Следующая страница по ответу на текущую; None — страниц больше нет."""
+
+    def extract_items(self, body: Any) -> list[Any]:
+        items = body
+        if self._items_field:
+            for key in self._items_field.split("."):
+                items = items.get(key) if isinstance(items, dict) else None
+        return list(items or [])
+
+
+class OffsetPagination(PaginationStrategy):
+    """
+    Пагинация номером страницы (page/limit) или смещением (offset/limit).
+
+    Последняя страница определяется по заголовку с общим количеством
+    (total_header, например X-Total-Count) или по неполной странице.
+
+    :param limit: размер страницы
+    :param page_param: имя параметра номера страницы (если offset_param не задан)
+    :param limit_param: имя параметра размера страницы
+    :param offset_param: имя параметра смещения; если задан — пагинация по offset
+    :param start: номер первой страницы (обычно 1 или 0)
+    :param total_header: заголовок с общим числом элементов
+    """
+
+    supports_prefetch = True
+
+    def __init__(
+            self,
+            limit: int = 100,
+            page_param: str = "page",
+            limit_param: str = "limit",
+            offset_param: Optional[str] = None,
+            start: int = 1,
+            total_header: Optional[str] = "X-Total-Count",
+            items_field: Optional[str] = None,
+    ):
+        super().__init__(items_field)
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+        self.limit = limit
+        self._page_param = page_param
+        self._limit_param = limit_param
+        self._offset_param = offset_param
+        self._start = start
+        self._total_header = total_header
+
+    def page(self, path: str, params: dict[str, Any], index: int) -> PageRequest:
+        """Страница с порядковым номером index (от 0)."""
+
+        if self._offset_param:
+            position = {self._offset_param: index * self.limit}
+        else:
+            position = {self._page_param: self._start + index}
+        return PageRequest(path, {**params, **position, self._limit_param: self.limit})
+
+    def first_page(self, path: str, params: dict[str, Any]) -> PageRequest:
+        return self.page(path, params, 0)
+
+    def next_page(self, current: PageRequest, response: Response, body: Any) -> Optional[PageRequest]:
+        if len(self.extract_items(body)) < self.limit:
+            return None
+        if self._offset_param:
+            index = current.params[self._offset_param] // self.limit + 1
+        else:
+            index = current.params[self._page_param] - self._start + 1
+        total = self.total_pages(response)
+        if total is not None and index >= total:
+            return None
+        base = {k: v for k, v in current.params.items() if k not in (self._page_param, self._offset_param)}
+        return self.page(current.path, base, index)
+
+    def total_pages(self, response: Response) -> Optional[int]:
+        """Число страниц по заголовку с общим количеством элементов (если сервер его отдаёт)."""
+
+        if not self._total_header:
+            return None
+        raw = response.headers.get(self._total_header)
+        try:
+            return math.ceil(int(raw) / self.limit)
+        except (TypeError, ValueError):
+            return None
+
+    def is_last(self, items: list[Any]) -> bool:
+        return len(items) < self.limit
+
+
+class CursorPagination(PaginationStrategy):
+    """
+    Пагинация курсором из тела ответа.
+
+    :param cursor_param: имя query-параметра курсора
+    :param next_cursor_field: путь до курсора следующей страницы в теле ("meta.next")
+    :param limit: размер страницы (None — не передавать)
+    :param limit_param: имя параметра размера страницы
+    """
+
+    def __init__(
+            self,
+            cursor_param: str = "cursor",
+            next_cursor_field: str = "next_cursor",
+            items_field: Optional[str] = "items",
+            limit: Optional[int] = None,
+            limit_param: str = "limit",
+    ):
+        super().__init__(items_field)
+        self._cursor_param = cursor_param
+        self._next_cursor_field = next_cursor_field
+        self._limit = limit
+        self._limit_param = limit_param
+
+    def first_page(self, path: str, params: dict[str, Any]) -> PageRequest:
+        if self._limit is not None:
+            params = {**params, self._limit_param: self._limit}
+        return PageRequest(path, params)
+
+    def next_page(self, current: PageRequest, response: Response, body: Any) -> Optional[PageRequest]:
+        cursor = body
+        for key in self._next_cursor_field.split("."):
+            cursor = cursor.get(key) if isinstance(cursor, dict) else None
+        if cursor in (None, "") or not self.extract_items(body):
+            return None
+        return PageRequest(current.path, {**current.params, self._cursor_param: cursor})
+
+
+class LinkHeaderPagination(PaginationStrategy):
+    """Пагинация по заголовку Link (RFC 8288): берётся URL с rel="next"."""
+
+    def __init__(self, rel: str = "next", items_field: Optional[str] = None):
+        super().__init__(items_field)
+        self._rel = rel
+
+    def first_page(self, path: str, params: dict[str, Any]) -> PageRequest:
+        return PageRequest(path, params)
+
+    def next_page(self, current: PageRequest, response: Response, body: Any) -> Optional[PageRequest]:
+        url = response.links.get(self._rel, {}).get("url")
+        if not url:
+            return None
+        # Параметры уже зашиты в URL из заголовка
+        return PageRequest(url)
+
+
+async def paginate(
+        http: AsyncHTTPClient,
+        path: str,
+        strategy: PaginationStrategy,
+        params: Optional[dict[str, Any]] = None,
+        item_model: Optional[Type[BaseModel]] = None,
+        prefetch: int = 0,
+        max_pages: Optional[int] = None,
+        **request_kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Асинхронный генератор элементов коллекции по всем страницам.
+
+    :param http: транспорт
+    :param path: путь коллекции
+    :param strategy: стратегия пагинации
+    :param params: общие query-параметры (фильтры)
+    :param item_model: Pydantic-модель элемента — элементы каждой страницы валидируются
+                       и отдаются моделями (несоответствие — ResponseValidationError
+                       с номером и URL страницы); None — отдаются как есть
+    :param prefetch: сколько следующих страниц запрашивать параллельно (только если
+                     strategy.supports_prefetch)
+    :param max_pages: не запрашивать больше указанного числа страниц
+    :param request_kwargs: прочие аргументы транспорта (expected_status, headers, ...)
+    """
+
+    # Элементы валидируются здесь, на уровне страницы; транспорту модель коллекции не нужна
+    request_kwargs.setdefault("validate_response", False)
+    params = dict(params or {})
+
+    if prefetch > 0 and strategy.supports_prefetch:
+        pages = _prefetched_pages(http, path, strategy, params, prefetch, max_pages, request_kwargs)
+    else:
+        if prefetch > 0:
+            logger.debug("%s does not support prefetch, fetching pages sequentially", type(strategy).__name__)
+        pages = _sequential_pages(http, path, strategy, params, max_pages, request_kwargs)
+
+    # aclosing — чтобы при break отменить prefetch-запросы сразу, а не при сборке мусора
+    async with aclosing(pages):
+        number = 0
+        async for response, body in pages:
+            number += 1
+            items = strategy.extract_items(body)
+            if item_model is not None:
+                try:
+                    items = model_adapter(item_model, many=True).validate_python(items)
+                except ValidationError as exc:
+                    raise ResponseValidationError(
+                        f"Page {number} of {path} ({response.request.url}) does not match "
+                        f"{item_model.__name__}:\n{exc}"
+                    ) from exc
+            for item in items:
+                yield item
+
+
+async def _sequential_pages(
+        http: AsyncHTTPClient,
+        path: str,
+        strategy: PaginationStrategy,
+        params: dict[str, Any],
+        max_pages: Optional[int],
+        request_kwargs: dict[str, Any],
+) -> AsyncIterator[tuple[Response, Any]]:
+    page: Optional[PageRequest] = strategy.first_page(path, params)
+    fetched = 0
+    while page is not None and (max_pages is None or fetched < max_pages):
+        response = await http.get(page.path, params=page.params or None, **request_kwargs)
+        fetched += 1
+        body = http.json(response)
+        yield response, body
+        page = strategy.next_page(page, response, body)
+
+
+async def _prefetched_pages(
+        http: AsyncHTTPClient,
+        path: str,
+        strategy: OffsetPagination,
+        params: dict[str, Any],
+        prefetch: int,
+        max_pages: Optional[int],
+        request_kwargs: dict[str, Any],
+) -> AsyncIterator[tuple[Response, Any]]:
+    """
+    Страницы по порядку, с `prefetch` запросами «наперёд».
+
+    Первая страница запрашивается одна: из неё берётся общее количество
+    (total_header), чтобы не запрашивать несуществующие страницы.
+    """
+
+    async def fetch(index: int) -> Response:
+        page = strategy.page(path, params, index)
+        return await http.get(page.path, params=page.params, **request_kwargs)
+
+    last_index = None if max_pages is None else max_pages - 1
+    pending: deque[tuple[int, asyncio.Task]] = deque()
+    next_index = 0
+
+    def schedule(window: int) -> None:
+        nonlocal next_index
+        while len(pending) < window and (last_index is None or next_index <= last_index):
+            pending.append((next_index, asyncio.ensure_future(fetch(next_index))))
+            next_index += 1
+
+    try:
+        schedule(1)
+        while pending:
+            _, task = pending.popleft()
+            response = await task
+            body = http.json(response)
+
+            total = strategy.total_pages(response)
+            if total is not None:
+                last_index = total - 1 if last_index is None else min(last_index, total - 1)
+                while pending and pending[-1][0] > last_index:
+                    pending.pop()[1].cancel()
+
+            yield response, body
+
+            if strategy.is_last(strategy.extract_items(body)):
+                return
+            schedule(prefetch + 1)
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
@@ -0,0 +1,292 @@
+"""
+Воспроизведение трафика из журнала запросов (request_log) через HttpxAsyncClient.
+
+Каждая запись журнала превращается обратно в запрос: метод, путь, строка
+запроса и тело (если журнал писался с capture_bodies / --request-log-bodies).
+Секреты в журнал не попадают: заголовки авторизации заново добавляет стратегия
+auth клиента, а замаскированные ("***") поля тела (JSON или формы) подставляются
+из secrets. Тела других типов журнал не хранит — такие запросы уходят без тела.
+
+Режимы:
+  • fast  — как можно быстрее, не больше concurrency запросов одновременно;
+  • timed — с исходными интервалами между запросами, ускоренными в speed раз
+    (открытая модель: запрос уходит по расписанию, не дожидаясь предыдущих).
+
+    client = HttpxAsyncClient(config, auth=BearerAuth(token))
+    report = await replay(client, iter_log(log_files(run_dir)), mode="timed", speed=2)
+    print(report.summary())
+
+Отчёт сравнивает статусы и задержки с исходными по endpoint'ам.
+
+    python -m src.async_api_client.replay --base-url http://127.0.0.1:8000 --mode timed --speed 4
+    python -m src.async_api_client.replay --base-url ... --run 20261018-224143 --path "/posts/{id}"
+    python -m src.async_api_client.replay --base-url https://stage.example.com/v2 --source-prefix /v1
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from .exceptions import APIError
+from .http_client import HttpxAsyncClient
+from .metrics import LatencyHistogram
+from .request_log_query import (
+    DEFAULT_DIR, Record, endpoint_key, iter_records, log_files, record_filter, resolve_run,
+)
+
+ReplayMode = Literal["fast", "timed"]
+MASK = "***"
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """Исходная запись и результат её повтора."""
+
+    record: Record
+    status: Optional[int]
+    ms: float
+    error: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint_key(self.record)
+
+    @property
+    def status_matches(self) -> bool:
+        return self.status == self.record.get("status")
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    mode: ReplayMode
+    speed: float
+    wall_seconds: float
+    results: tuple[ReplayResult, ...]
+
+    @property
+    def mismatches(self) -> list[ReplayResult]:
+        return [result for result in self.results if not result.status_matches]
+
+    def by_endpoint(self) -> dict[str, tuple[LatencyHistogram, LatencyHistogram, int, int]]:
+        """endpoint → (исходная гистограмма, гистограмма повтора, вызовы, расхождения статуса)."""
+
+        endpoints: dict[str, tuple[LatencyHistogram, LatencyHistogram, int, int]] = {}
+        for result in self.results:
+            original, replayed, count, mismatched = endpoints.get(
+                result.endpoint, (LatencyHistogram(), LatencyHistogram(), 0, 0),
+            )
+            original.record(result.record["ms"] / 1000)
+            replayed.record(result.ms / 1000)
+            endpoints[result.endpoint] = (original, replayed, count + 1, mismatched + (not result.status_matches))
+        return endpoints
+
+    def summary(self) -> str:
+        lines = [
+            f"replayed {len(self.results)} requests in {self.wall_seconds:.2f}s ({self.mode}"
+            + (f", x{self.speed:g}" if self.mode == "timed" else "") + f"), {len(self.mismatches)} status mismatches",
+            f"{'count':>7} {'status≠':>7} {'p50 was':>9} {'p50 now':>9} {'p95 was':>9} {'p95 now':>9}  endpoint",
+        ]
+        for key, (original, replayed, count, mismatched) in sorted(self.by_endpoint().items()):
+            lines.append(
+                f"{count:>7} {mismatched:>7} {original.percentile(50) * 1000:>9.1f} "
+                f"{replayed.percentile(50) * 1000:>9.1f} {original.percentile(95) * 1000:>9.1f} "
+                f"{replayed.percentile(95) * 1000:>9.1f}  {key}"
+            )
+        for result in self.mismatches[:20]:
+            now = result.status if result.status is not None else result.error
+            was = result.record.get("status") or result.record.get("error")
+            record = result.record
+            lines.append(f"  {record['method']} {record['url']}: {was} -> {now}  [{record.get('trace')}]")
+        return "\n".join(lines)
+
+
+def iter_log(files: Iterable[Path]) -> Iterator[Record]:
+    """Записи прогона в порядке старта: файлы каждого воркера подряд, воркеры — слиянием по ts."""
+
+    chains: dict[str, list[Path]] = {}
+    for path in sorted(files):
+        worker = path.name.split(".", 1)[0].rsplit("-", 1)[0]
+        chains.setdefault(worker, []).append(path)
+    streams = [(record for path in chain for record in iter_records(path)) for chain in chains.values()]
+    return heapq.merge(*streams, key=lambda record: record["ts"])
+
+
+def _inject(payload: Any, secrets: Mapping[str, Any]) -> Any:
+    if isinstance(payload, dict):
+        return {
+            key: (secrets[key] if value == MASK and key in secrets else _inject(value, secrets))
+            for key, value in payload.items()
+        }
+    if isinstance(payload, list):
+        return [_inject(value, secrets) for value in payload]
+    return payload
+
+
+def build_request(record: Record, secrets: Optional[Mapping[str, Any]] = None) -> dict[str, Any]:
+    """Аргументы HttpxAsyncClient.request для записи журнала."""
+
+    url = record["url"] + (f"?{record['query']}" if record.get("query") else "")
+    kwargs: dict[str, Any] = {"method": record["method"], "path": url}
+    body = record.get("body")
+    if body is not None:
+        content_type = record.get("content_type") or "application/octet-stream"
+        if "json" in content_type.lower() and secrets:
+            body = json.dumps(_inject(json.loads(body), secrets), ensure_ascii=False)
+        elif "x-www-form-urlencoded" in content_type.lower() and secrets:
+            pairs = parse_qsl(body, keep_blank_values=True)
+            body = urlencode([
+                (key, secrets[key] if value == MASK and key in secrets else value) for key, value in pairs
+            ])
+        kwargs["content"] = body.encode("utf-8")
+        kwargs["headers"] = {"Content-Type": content_type}
+    return kwargs
+
+
+def target_path(url: str, base_path: str, source_prefix: Optional[str] = None) -> str:
+    """
+    Путь записи на целевом сервере.
+
+    В журнале — полный путь URL, с prefix_path клиента, который писал журнал.
+    source_prefix=None — префикс записи тот же, что путь base_url цели; иначе
+    source_prefix отрезается и заменяется путём base_url (/v1/posts/1 → /v2/posts/1).
+    Путь вне префикса — ValueError, а не запрос по чужому адресу.
+    """
+
+    base = base_path.rstrip("/")
+    prefix = base if source_prefix is None else source_prefix.rstrip("/")
+    if prefix and url != prefix and not url.startswith(prefix + "/"):
+        raise ValueError(
+            f"Recorded path {url!r} is outside prefix {prefix!r}; pass source_prefix (--source-prefix) "
+            f"with the prefix the log was recorded under"
+        )
+    return base + url[len(prefix):]
+
+
+async def _send(
+        client: HttpxAsyncClient,
+        record: Record,
+        secrets: Optional[Mapping[str, Any]],
+        source_prefix: Optional[str],
+) -> ReplayResult:
+    kwargs = build_request(record, secrets)
+    base_url = client.session.base_url
+    query = kwargs["path"][len(record["url"]):]
+    kwargs["path"] = str(base_url.join(target_path(record["url"], base_url.path, source_prefix) + query))
+    start = time.monotonic()
+    try:
+        response = await client.request(
+            **kwargs, validate_status=False, validate_response=False, validate_request=False,
+        )
+    except APIError as exc:
+        return ReplayResult(record, None, (time.monotonic() - start) * 1000, type(exc.__cause__ or exc).__name__)
+    return ReplayResult(record, response.status_code, (time.monotonic() - start) * 1000)
+
+
+async def replay(
+        client: HttpxAsyncClient,
+        records: Iterable[Record],
+        mode: ReplayMode = "fast",
+        speed: float = 1.0,
+        concurrency: int = 10,
+        secrets: Optional[Mapping[str, Any]] = None,
+        source_prefix: Optional[str] = None,
+) -> ReplayReport:
+    """
+    Повторить записи журнала через клиента.
+
+    :param mode: "fast" — без пауз, не больше concurrency одновременно; "timed" — по исходным ts
+    :param speed: ускорение исходных интервалов в режиме timed (2 — вдвое быстрее)
+    :param secrets: значения для замаскированных полей тела: {"password": "..."}
+    :param source_prefix: префикс путей в журнале, если он не совпадает с путём base_url
+                          клиента (см. target_path)
+    """
+
+    if mode not in ("fast", "timed"):
+        raise ValueError(f"mode must be 'fast' or 'timed', got {mode!r}")
+    if speed <= 0:
+        raise ValueError(f"speed must be positive, got {speed}")
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: list[asyncio.Task] = []
+
+    async def limited(record: Record) -> ReplayResult:
+        try:
+            return await _send(client, record, secrets, source_prefix)
+        finally:
+            semaphore.release()
+
+    started = loop.time()
+    first_ts: Optional[float] = None
+    for record in records:
+        if mode == "timed":
+            first_ts = record["ts"] if first_ts is None else first_ts
+            delay = started + (record["ts"] - first_ts) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_send(client, record, secrets, source_prefix)))
+        else:
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(limited(record)))
+
+    results = await asyncio.gather(*tasks)
+    return ReplayReport(mode=mode, speed=speed, wall_seconds=loop.time() - started, results=tuple(results))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    from .auth import APIKeyAuth, BearerAuth
+    from .config import APIConfig
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", required=True, help="куда воспроизводить, напр. http://127.0.0.1:8000/api")
+    parser.add_argument("--source-prefix", default=None,
+                        help="префикс путей в журнале, если он не совпадает с путём --base-url (напр. /api/v1)")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_DIR, help="корень журнала")
+    parser.add_argument("--run", default="last", help="имя прогона (каталог) или last")
+    parser.add_argument("--mode", choices=("fast", "timed"), default="fast")
+    parser.add_argument("--speed", type=float, default=1.0, help="ускорение интервалов для --mode timed")
+    parser.add_argument("--concurrency", type=int, default=10, help="одновременных запросов для --mode fast")
+    parser.add_argument("--bearer-env", help="переменная окружения с Bearer-токеном")
+    parser.add_argument("--api-key-env", help="переменная окружения с X-API-Key")
+    parser.add_argument("--secret", action="append", default=[], metavar="KEY=ENV",
+                        help="замаскированное поле тела ← переменная окружения")
+    parser.add_argument("--method")
+    parser.add_argument("--path", help='шаблон ("/posts/{id}") или конкретный путь')
+    parser.add_argument("--test", help="подстрока node id теста")
+    args = parser.parse_args(argv)
+
+    auth = None
+    if args.bearer_env:
+        auth = BearerAuth(os.environ[args.bearer_env])
+    elif args.api_key_env:
+        auth = APIKeyAuth(os.environ[args.api_key_env])
+    secrets = {key: os.environ[env] for key, env in (item.split("=", 1) for item in args.secret)}
+
+    predicate = record_filter(args.method, args.path, args.test)
+    records = (record for record in iter_log(log_files(resolve_run(args.dir, args.run))) if predicate(record))
+
+    async def run() -> ReplayReport:
+        url = httpx.URL(args.base_url)
+        config = APIConfig(host=url.host, protocol=url.scheme, port=url.port, prefix_path=url.path.strip("/"))
+        client = HttpxAsyncClient(config, auth=auth)
+        try:
+            return await replay(
+                client, records, args.mode, args.speed, args.concurrency, secrets, args.source_prefix,
+            )
+        finally:
+            await client.aclose()
+
+    print(asyncio.run(run()).summary())
+
+
+if __name__ == "__main__":
+    main()
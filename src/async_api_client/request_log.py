@@ -0,0 +1,228 @@
+"""
+Структурированный журнал запросов: одна компактная JSON-строка на каждый обмен.
+
+RequestLogger передаёт сюда каждый ответ и сбой, если подключён хотя бы один
+приёмник (add_sink). Запись:
+
+    {"ts": 1760812303.412, "run": "20261018-224143", "worker": "gw0",
+     "test": "tests/test_posts.py::TestPosts::test_get", "trace": "a1b2c3d4",
+     "method": "GET", "path": "/posts/{id}", "url": "/posts/17", "status": 200,
+     "ms": 41.7, "req_bytes": 0, "resp_bytes": 292, "redirects": 0}
+
+Сбой транспорта — "status": null и "error": "ReadTimeout". test — текущий тест
+(ставит pytest-плагин utils/request_log.py), worker — воркер pytest-xdist.
+Строка запроса — в "query"; с capture_bodies(True) тело запроса пишется в "body"
+и "content_type" — этого достаточно, чтобы воспроизвести трафик (replay). Пишутся
+только тела, которые можно замаскировать: JSON и формы (x-www-form-urlencoded),
+чувствительные поля в них — "***". Прочие тела (multipart, текст, бинарные)
+в журнал не попадают — в записи остаётся только content_type.
+
+JSONLSink пишет файлы <dir>/<run>/requests-<worker>-<NNNN>.jsonl с ротацией
+по размеру; закрытые файлы можно сжимать в .jsonl.gz (в фоновом потоке).
+Индекс и запросы к журналу — request_log_query.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+from httpx import Request, RequestNotRead, Response
+
+from .helpers.functions import mask_form_bytes, mask_json_bytes
+from .metrics import template_path
+
+RUN_ENV = "REQUEST_LOG_RUN"
+
+
+class RequestSink(Protocol):
+    def write(self, record: dict[str, Any]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+# Подключённые приёмники; пока список пуст, RequestLogger не строит записи
+_sinks: list[RequestSink] = []
+_current_test: Optional[str] = None
+_capture_bodies = False
+
+
+def add_sink(sink: RequestSink) -> None:
+    _sinks.append(sink)
+
+
+def remove_sink(sink: RequestSink) -> None:
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def set_test(nodeid: Optional[str]) -> None:
+    """Тест, которому приписываются следующие записи."""
+    global _current_test
+    _current_test = nodeid
+
+
+def capture_bodies(enabled: bool = True) -> None:
+    """Писать ли тела запросов (нужно для replay POST/PUT/PATCH)."""
+    global _capture_bodies
+    _capture_bodies = enabled
+
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+
+def run_id() -> str:
+    """Идентификатор прогона: из окружения (общий для воркеров xdist) или текущее время."""
+    return os.environ.get(RUN_ENV) or datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def _worker() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def _emit(record: dict[str, Any]) -> None:
+    for sink in list(_sinks):
+        sink.write(record)
+
+
+def _request_fields(request: Request) -> dict[str, Any]:
+    fields: dict[str, Any] = {}
+    if request.url.query:
+        fields["query"] = request.url.query.decode("ascii")
+    if not _capture_bodies:
+        return fields
+    try:
+        content = request.content
+    except RequestNotRead:
+        return fields
+    if content:
+        content_type = request.headers.get("content-type", "")
+        fields["content_type"] = content_type
+        media_type = content_type.lower()
+        if "json" in media_type:
+            fields["body"] = mask_json_bytes(content)
+        elif "x-www-form-urlencoded" in media_type:
+            fields["body"] = mask_form_bytes(content)
+    return fields
+
+
+def record_response(request_id: str, response: Response, elapsed_ms: float) -> None:
+    history = response.history
+    first = history[0].request if history else response.request
+    _emit({
+        "ts": round(time.time() - elapsed_ms / 1000, 3),
+        "worker": _worker(),
+        "test": _current_test,
+        "trace": request_id,
+        "method": first.method,
+        "path": template_path(first.url.path),
+        "url": first.url.path,
+        "status": response.status_code,
+        "ms": round(elapsed_ms, 2),
+        "req_bytes": int(first.headers.get("content-length", 0)),
+        "resp_bytes": len(response.content),
+        "redirects": len(history),
+        **_request_fields(first),
+    })
+
+
+def record_failure(request_id: str, method: str, path: str, elapsed_ms: float, exc: Exception) -> None:
+    try:
+        request: Optional[Request] = exc.request  # httpx.RequestError
+    except (AttributeError, RuntimeError):
+        request = None
+    url = request.url.path if request is not None else path.split("?", 1)[0]
+    _emit({
+        "ts": round(time.time() - elapsed_ms / 1000, 3),
+        "worker": _worker(),
+        "test": _current_test,
+        "trace": request_id,
+        "method": method,
+        "path": template_path(url),
+        "url": url,
+        "status": None,
+        "ms": round(elapsed_ms, 2),
+        "error": type(exc.__cause__ or exc).__name__,
+        **(_request_fields(request) if request is not None else {}),
+    })
+
+
+class JSONLSink:
+    """
+    Запись журнала в JSONL с ротацией.
+
+    :param directory: корень журнала; файлы прогона — в <directory>/<run>/
+    :param run: идентификатор прогона (по умолчанию run_id())
+    :param max_bytes: размер файла, после которого открывается следующий
+    :param compress: сжимать закрытые файлы в .gz (в фоне; последний — при close)
+    """
+
+    def __init__(
+            self,
+            directory: Path,
+            run: Optional[str] = None,
+            max_bytes: int = 64 * 1024 * 1024,
+            compress: bool = False,
+    ):
+        self.run = run or run_id()
+        self.directory = Path(directory) / self.run
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.worker = _worker()
+        self._sequence = 0
+        self._size = 0
+        self._file = None
+        self._path: Optional[Path] = None
+        self._compressors: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Текущий (открытый) файл."""
+        return self._path
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = json.dumps({"run": self.run, **record}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None or self._size >= self.max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_current()
+            self._file = None
+        for thread in self._compressors:
+            thread.join()
+        self._compressors.clear()
+
+    def _rotate(self) -> None:
+        self._close_current()
+        self._sequence += 1
+        self._path = self.directory / f"requests-{self.worker}-{self._sequence:04d}.jsonl"
+        self._file = self._path.open("a", encoding="utf-8")
+        self._size = self._path.stat().st_size
+
+    def _close_current(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        if self.compress:
+            thread = threading.Thread(target=_gzip_file, args=(self._path,), name="request-log-gzip", daemon=True)
+            thread.start()
+            self._compressors.append(thread)
+
+
+def _gzip_file(path: Path) -> None:
+    target = path.with_name(path.name + ".gz")
+    with path.open("rb") as source, gzip.open(target, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+    path.unlink()
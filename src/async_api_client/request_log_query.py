@@ -0,0 +1,295 @@
+"""
+Запросы к журналу request_log без загрузки его целиком.
+
+Для каждого файла журнала строится индекс <файл>.idx.json (как у кассет): по
+каждому endpoint'у ("GET /posts/{id}") — число вызовов, ошибки, статусы,
+гистограмма задержек и INDEX_TOP самых медленных записей. Индекс перестраивается,
+если файл изменился (размер/mtime), и работает и для сжатых .jsonl.gz.
+
+Сводка и «самые медленные» по endpoint'у отвечаются по индексам; остальные
+фильтры (тест, статус, воркер, trace) — потоковым проходом по файлам с
+ограниченной памятью (heapq).
+
+    python -m src.async_api_client.request_log_query runs
+    python -m src.async_api_client.request_log_query summary
+    python -m src.async_api_client.request_log_query slowest --path "/posts/{id}" -n 20
+    python -m src.async_api_client.request_log_query slowest --test test_bulk --status 5xx
+    python -m src.async_api_client.request_log_query find --trace a1b2c3d4
+
+По умолчанию берётся последний прогон (--run last) в --dir logs/requests.
+"""
+
+import argparse
+import gzip
+import heapq
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .metrics import LatencyHistogram, template_path
+
+INDEX_VERSION = 1
+INDEX_TOP = 100
+DEFAULT_DIR = Path("logs") / "requests"
+
+Record = dict[str, Any]
+
+
+def endpoint_key(record: Record) -> str:
+    return f"{record['method']} {record['path']}"
+
+
+def is_error(record: Record) -> bool:
+    """Ошибка — сбой транспорта или ответ 5xx."""
+    return record.get("status") is None or record["status"] >= 500
+
+
+def list_runs(root: Path) -> list[Path]:
+    """Каталоги прогонов, от старого к новому (имена — время запуска)."""
+    if not root.is_dir():
+        return []
+    return sorted(path for path in root.iterdir() if path.is_dir())
+
+
+def resolve_run(root: Path, run: Optional[str] = None) -> Path:
+    if run and run != "last":
+        return root / run
+    runs = list_runs(root)
+    if not runs:
+        raise FileNotFoundError(f"no request log runs in {root}")
+    return runs[-1]
+
+
+def log_files(run_dir: Path) -> list[Path]:
+    return sorted(path for path in run_dir.iterdir() if path.name.endswith((".jsonl", ".jsonl.gz")))
+
+
+def iter_records(path: Path) -> Iterator[Record]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_index(path: Path) -> dict[str, Any]:
+    """Один проход по файлу: агрегаты по endpoint'ам и top самых медленных записей."""
+
+    endpoints: dict[str, dict[str, Any]] = {}
+    histograms: dict[str, LatencyHistogram] = {}
+    slowest: dict[str, list[tuple[float, int, Record]]] = {}
+    for sequence, record in enumerate(iter_records(path)):
+        key = endpoint_key(record)
+        entry = endpoints.setdefault(key, {"count": 0, "errors": 0, "statuses": {}})
+        entry["count"] += 1
+        entry["errors"] += is_error(record)
+        status = str(record.get("status"))
+        entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+        histograms.setdefault(key, LatencyHistogram()).record(record["ms"] / 1000)
+
+        heap = slowest.setdefault(key, [])
+        item = (record["ms"], sequence, record)
+        if len(heap) < INDEX_TOP:
+            heapq.heappush(heap, item)
+        elif item[0] > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+    for key, entry in endpoints.items():
+        entry["histogram"] = histograms[key].to_dict()
+        entry["slowest"] = [record for _, _, record in sorted(slowest[key], reverse=True)]
+    stat = path.stat()
+    return {"version": INDEX_VERSION, "size": stat.st_size, "mtime": stat.st_mtime, "endpoints": endpoints}
+
+
+def load_index(path: Path) -> dict[str, Any]:
+    """Индекс файла: с диска, если актуален, иначе перестроенный и сохранённый."""
+
+    index_path = path.with_name(path.name + ".idx.json")
+    stat = path.stat()
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+        if (
+                payload.get("version") == INDEX_VERSION
+                and payload.get("size") == stat.st_size
+                and payload.get("mtime") == stat.st_mtime
+        ):
+            return payload
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    payload = build_index(path)
+    tmp = index_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, index_path)
+    return payload
+
+
+class RunIndex:
+    """Индексы всех файлов прогона, сведённые по endpoint'ам."""
+
+    def __init__(self, files: Iterable[Path]):
+        self.files = list(files)
+        self.endpoints: dict[str, dict[str, Any]] = {}
+        for path in self.files:
+            for key, entry in load_index(path)["endpoints"].items():
+                total = self.endpoints.setdefault(
+                    key, {"count": 0, "errors": 0, "statuses": {}, "histogram": LatencyHistogram(), "slowest": []},
+                )
+                total["count"] += entry["count"]
+                total["errors"] += entry["errors"]
+                for status, count in entry["statuses"].items():
+                    total["statuses"][status] = total["statuses"].get(status, 0) + count
+                total["histogram"].merge(LatencyHistogram.from_dict(entry["histogram"]))
+                total["slowest"] = heapq.nlargest(
+                    INDEX_TOP, [*total["slowest"], *entry["slowest"]], key=lambda record: record["ms"],
+                )
+
+    @property
+    def count(self) -> int:
+        return sum(entry["count"] for entry in self.endpoints.values())
+
+    def matching(self, method: Optional[str] = None, path: Optional[str] = None) -> list[str]:
+        return [
+            key for key in self.endpoints
+            if (method is None or key.split(" ", 1)[0] == method.upper())
+            and (path is None or key.split(" ", 1)[1] == template_path(path))
+        ]
+
+    def slowest(self, n: int, method: Optional[str] = None, path: Optional[str] = None) -> list[Record]:
+        """Самые медленные записи endpoint'ов; n не больше INDEX_TOP."""
+        if n > INDEX_TOP:
+            raise ValueError(f"index keeps {INDEX_TOP} slowest records per endpoint, asked for {n}")
+        candidates = (record for key in self.matching(method, path) for record in self.endpoints[key]["slowest"])
+        return heapq.nlargest(n, candidates, key=lambda record: record["ms"])
+
+
+def status_matches(status: Optional[int], spec: str) -> bool:
+    """spec: "500", "5xx" или "error" (сбой транспорта)."""
+    if spec == "error":
+        return status is None
+    if status is None:
+        return False
+    if spec.endswith("xx"):
+        return str(status)[0] == spec[0]
+    return status == int(spec)
+
+
+def record_filter(
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        test: Optional[str] = None,
+        status: Optional[str] = None,
+        worker: Optional[str] = None,
+        trace: Optional[str] = None,
+) -> Callable[[Record], bool]:
+    """Предикат записи; test — подстрока node id, path — шаблон или конкретный путь."""
+
+    template = template_path(path) if path else None
+
+    def predicate(record: Record) -> bool:
+        return (
+            (method is None or record["method"] == method.upper())
+            and (template is None or record["path"] == template)
+            and (test is None or test in (record.get("test") or ""))
+            and (status is None or status_matches(record.get("status"), status))
+            and (worker is None or record.get("worker") == worker)
+            and (trace is None or record.get("trace") == trace)
+        )
+
+    return predicate
+
+
+def scan(files: Iterable[Path], predicate: Callable[[Record], bool]) -> Iterator[Record]:
+    for path in files:
+        yield from (record for record in iter_records(path) if predicate(record))
+
+
+def scan_slowest(files: Iterable[Path], predicate: Callable[[Record], bool], n: int) -> list[Record]:
+    """Потоковый top-n: в памяти не больше n записей."""
+    return heapq.nlargest(n, scan(files, predicate), key=lambda record: record["ms"])
+
+
+def format_record(record: Record) -> str:
+    status = record.get("status") or record.get("error", "-")
+    return (
+        f"{record['ms']:>9.1f}ms  {status!s:>5}  {record['method']} {record['url']}"
+        f"  [{record.get('trace')}] {record.get('worker')}  {record.get('test') or '-'}"
+    )
+
+
+def format_summary(index: RunIndex, top: Optional[int] = None) -> str:
+    rows = sorted(index.endpoints.items(), key=lambda item: item[1]["histogram"].percentile(99), reverse=True)
+    lines = [f"{'count':>7} {'errors':>6} {'p50, ms':>9} {'p95, ms':>9} {'p99, ms':>9} {'max, ms':>9}  endpoint"]
+    for key, entry in rows[:top]:
+        histogram = entry["histogram"]
+        lines.append(
+            f"{entry['count']:>7} {entry['errors']:>6} {histogram.percentile(50) * 1000:>9.1f} "
+            f"{histogram.percentile(95) * 1000:>9.1f} {histogram.percentile(99) * 1000:>9.1f} "
+            f"{histogram.max * 1000:>9.1f}  {key}"
+        )
+    return "\n".join(lines)
+
+
+def _add_filters(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--method")
+    parser.add_argument("--path", help='шаблон ("/posts/{id}") или конкретный путь')
+    parser.add_argument("--test", help="подстрока node id теста")
+    parser.add_argument("--status", help='"500", "5xx" или "error"')
+    parser.add_argument("--worker", help="воркер xdist (gw0, ...; main без xdist)")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, default=DEFAULT_DIR, help="корень журнала")
+    parser.add_argument("--run", default="last", help="имя прогона (каталог) или last")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("runs", help="список прогонов")
+    commands.add_parser("index", help="построить индексы прогона")
+    summary = commands.add_parser("summary", help="сводка по endpoint'ам (по индексам)")
+    summary.add_argument("--top", type=int)
+    slowest = commands.add_parser("slowest", help="самые медленные вызовы")
+    slowest.add_argument("-n", type=int, default=20)
+    _add_filters(slowest)
+    find = commands.add_parser("find", help="записи по фильтру (JSONL)")
+    find.add_argument("-n", type=int, default=50)
+    find.add_argument("--trace")
+    _add_filters(find)
+    args = parser.parse_args(argv)
+
+    if args.command == "runs":
+        for run_dir in list_runs(args.dir):
+            files = log_files(run_dir)
+            size = sum(path.stat().st_size for path in files)
+            print(f"{run_dir.name}  {len(files)} files  {size / 1024:.1f} KiB")
+        return
+
+    files = log_files(resolve_run(args.dir, args.run))
+    if args.command in ("index", "summary"):
+        index = RunIndex(files)
+        if args.command == "index":
+            print(f"{len(files)} files, {index.count} records, {len(index.endpoints)} endpoints")
+        else:
+            print(format_summary(index, args.top))
+        return
+
+    if args.command == "slowest":
+        if args.test is None and args.status is None and args.worker is None and args.n <= INDEX_TOP:
+            records = RunIndex(files).slowest(args.n, args.method, args.path)
+        else:
+            predicate = record_filter(args.method, args.path, args.test, args.status, args.worker)
+            records = scan_slowest(files, predicate, args.n)
+        for record in records:
+            print(format_record(record))
+        return
+
+    predicate = record_filter(args.method, args.path, args.test, args.status, args.worker, args.trace)
+    for number, record in enumerate(scan(files, predicate)):
+        if number >= args.n:
+            break
+        print(json.dumps(record, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 import logging
 import time
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 import allure
 from httpx import Response
 
-from .helpers.functions import truncate, mask_body, mask_headers
+from . import request_log
+from .helpers.functions import truncate, mask_body, mask_headers, mask_json_bytes
 from .constants import SENSITIVE_HEADERS
 from utils.curl import to_curl
 
@@ -32,8 +33,13 @@ class RequestLogger:
         files = kwargs.get("files")
 
         safe_headers = mask_headers(headers)
-        safe_body = mask_body(raw_body)
-        body_log = truncate(str(safe_body), self._max_body) if safe_body is not None else None
+        content = kwargs.get("content")
+        if raw_body is None and isinstance(content, bytes) and _is_json(headers):
+            # Тело уже сериализовано prepare_payload — маскируем те же байты, без повторного разбора
+            safe_body = body_log = mask_json_bytes(content, self._max_body)
+        else:
+            safe_body = mask_body(raw_body)
+            body_log = truncate(str(safe_body), self._max_body) if safe_body is not None else None
 
         self._logger.info(
             "→ [%s] %s %s | headers=%s | params=%s | body=%s%s",
@@ -55,19 +61,31 @@ class RequestLogger:
             attachment_type=allure.attachment_type.TEXT,
         )
 
-    def log_response(self, request_id: str, response: Response, start: float) -> None:
-        elapsed_ms = (time.monotonic() - start) * 1000
+    @property
+    def max_body_size(self) -> int:
+        return self._max_body
+
+    def log_response(
+            self,
+            request_id: str,
+            response: Response,
+            start: float,
+            end: Optional[float] = None,
+            rendered_body: Optional[tuple[str, Any]] = None,
+    ) -> None:
+        """
+        :param end: момент получения ответа (по умолчанию — сейчас)
+        :param rendered_body: заранее подготовленные (тело, тип вложения) — см. render_body
+        """
+        elapsed_ms = ((end if end is not None else time.monotonic()) - start) * 1000
         self._logger.info(
             "← [%s] %s %s | %d | %.1fms | %d bytes",
             request_id, response.request.method, response.request.url.path,
             response.status_code, elapsed_ms, len(response.content),
         )
-        try:
-            body_str = truncate(str(response.json()), self._max_body)
-            atype = allure.attachment_type.JSON
-        except ValueError:
-            body_str = truncate(response.text, self._max_body)
-            atype = allure.attachment_type.TEXT
+        if request_log.enabled():
+            request_log.record_response(request_id, response, elapsed_ms)
+        body_str, atype = rendered_body or render_body(response, self._max_body)
         payload = (
             f"Status: {response.status_code}\n"
             f"Elapsed: {elapsed_ms:.1f}ms\n"
@@ -85,4 +103,22 @@ class RequestLogger:
         self._logger.error(
             "✗ [%s] %s %s | %.1fms | %s: %s",
             request_id, method, path, elapsed_ms, type(exc).__name__, exc,
-        )
\ No newline at end of file
+        )
+        if request_log.enabled():
+            request_log.record_failure(request_id, method, path, elapsed_ms, exc)
+
+
+def render_body(response: Response, max_body: int) -> tuple[str, Any]:
+    """Тело ответа для лога и тип Allure-вложения. Не трогает Allure — можно вызывать из пула."""
+
+    if _is_json(response.headers):
+        # Логируем исходные байты ответа — без декодирования всего тела ради первых max_body символов
+        return mask_json_bytes(response.content, max_body), allure.attachment_type.JSON
+    return truncate(response.text, max_body), allure.attachment_type.TEXT
+
+
+def _is_json(headers: Mapping[str, str]) -> bool:
+    return any(
+        name.lower() == "content-type" and "json" in str(value).lower()
+        for name, value in (headers or {}).items()
+    )
@@ -0,0 +1,103 @@
+"""
+Типизированный результат вызова endpoint'а.
+
+APIResult — лёгкая обёртка над httpx.Response: статус, заголовки и тайминг
+доступны сразу, а тело разбирается лениво и один раз. Если ответ уже был
+провалидирован транспортом, модель берётся из кэша без повторной валидации.
+
+    async with AsyncAPIClient(config, typed_results=True) as client:
+        result = await client.posts.get(1)
+        assert result.status_code == 200
+        post: Post = result.data
+"""
+
+from datetime import timedelta
+from typing import Any, Callable, Generic, Optional, Type, TypeVar
+
+from httpx import Headers, Response
+from pydantic import BaseModel
+
+from .validators import VALIDATED_MODEL_KEY, model_adapter
+
+T = TypeVar("T")
+
+_UNSET = object()
+
+
+class APIResult(Generic[T]):
+    """
+    Результат запроса с уже разобранным телом.
+
+    :param response: исходный httpx.Response (доступен как .response)
+    :param model: Pydantic-модель тела; None — .data вернёт разобранный JSON как есть
+    :param many: тело — JSON-массив элементов model
+    :param decode: функция разбора JSON (обычно HttpxAsyncClient.json — с кэшем и кодеком клиента)
+    """
+
+    __slots__ = ("response", "_model", "_many", "_decode", "_data")
+
+    def __init__(
+            self,
+            response: Response,
+            model: Optional[Type[BaseModel]] = None,
+            many: bool = False,
+            decode: Optional[Callable[[Response], Any]] = None,
+    ):
+        self.response = response
+        self._model = model
+        self._many = many
+        self._decode = decode or Response.json
+        self._data: Any = _UNSET
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self) -> Headers:
+        return self.response.headers
+
+    @property
+    def elapsed(self) -> timedelta:
+        return self.response.elapsed
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.response.elapsed.total_seconds() * 1000
+
+    @property
+    def model(self) -> Optional[Type[BaseModel]]:
+        return self._model
+
+    def json(self) -> Any:
+        """Разобранное тело; повторно не декодирует."""
+        return self._decode(self.response)
+
+    @property
+    def data(self) -> T:
+        """Провалидированная модель (или список моделей); строится при первом обращении."""
+
+        if self._data is _UNSET:
+            self._data = self._build()
+        return self._data
+
+    def _build(self) -> Any:
+        if not self.response.content:
+            return None
+        if self._model is None:
+            return self.json()
+
+        cached = self.response.extensions.get(VALIDATED_MODEL_KEY)
+        if cached is not None and cached[0] is self._model:
+            return cached[1]
+
+        return model_adapter(self._model, many=self._many).validate_python(self.json())
+
+    def __repr__(self) -> str:
+        model = self._model.__name__ if self._model else None
+        if self._many and model:
+            model = f"list[{model}]"
+        return (
+            f"<APIResult {self.response.request.method} {self.response.request.url.path} "
+            f"[{self.status_code}] model={model}>"
+        )
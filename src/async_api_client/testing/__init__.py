@@ -0,0 +1,94 @@
+"""Инструменты для тестов и бенчмарков клиента: mock-сервер, внедрение сбоев, распределения задержек, монитор лага цикла."""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .latency import Latency, NO_LATENCY
+    from .mock_server import MOCK_CONFIG, LocalMockServer, MockAPI, MockServerConfig, generate_dataset
+    from .faults import (
+        FaultInjectionTransport,
+        FaultRule,
+        DelayFault,
+        ErrorFault,
+        TruncateFault,
+        TimeoutFault,
+        ResetFault,
+        session_fault_counts,
+        add_session_fault_counts,
+        format_fault_counts,
+    )
+    from .loop_lag import LoopLagMonitor, LoopBlock, LabelLag, format_lag_report
+
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".latency": (
+        "Latency",
+        "NO_LATENCY",
+    ),
+    ".mock_server": (
+        "MOCK_CONFIG",
+        "MockAPI",
+        "MockServerConfig",
+        "LocalMockServer",
+        "generate_dataset",
+    ),
+    ".faults": (
+        "FaultInjectionTransport",
+        "FaultRule",
+        "DelayFault",
+        "ErrorFault",
+        "TruncateFault",
+        "TimeoutFault",
+        "ResetFault",
+        "session_fault_counts",
+        "add_session_fault_counts",
+        "format_fault_counts",
+    ),
+    ".loop_lag": (
+        "LoopLagMonitor",
+        "LoopBlock",
+        "LabelLag",
+        "format_lag_report",
+    ),
+}
+
+_EXPORT_MODULES: dict[str, str] = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+__all__ = [
+    "Latency",
+    "NO_LATENCY",
+    "MOCK_CONFIG",
+    "MockAPI",
+    "MockServerConfig",
+    "LocalMockServer",
+    "generate_dataset",
+    "FaultInjectionTransport",
+    "FaultRule",
+    "DelayFault",
+    "ErrorFault",
+    "TruncateFault",
+    "TimeoutFault",
+    "ResetFault",
+    "session_fault_counts",
+    "add_session_fault_counts",
+    "format_fault_counts",
+    "LoopLagMonitor",
+    "LoopBlock",
+    "LabelLag",
+    "format_lag_report",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,265 @@
+"""
+Fault-injection транспорт: деградация upstream'а по правилам.
+
+Правило — шаблон пути (+ методы), вероятность и сбой:
+  • DelayFault    — дополнительная задержка (Latency: fixed / uniform / lognormal);
+  • ErrorFault    — ответ 5xx/429 без обращения к серверу, опционально с Retry-After;
+  • TruncateFault — ответ сервера с обрезанным телом (JSON перестаёт разбираться);
+  • TimeoutFault  — httpx.ReadTimeout (клиент поднимет APITimeoutError);
+  • ResetFault    — обрыв соединения, httpx.ReadError (клиент поднимет APITransportError).
+
+Сработавшие сбои применяются цепочкой в порядке правил: задержка и обрезка
+пропускают запрос дальше, ошибка/таймаут/обрыв — прерывают цепочку.
+Решения принимает random.Random(seed): при последовательных запросах
+прогон воспроизводим. Счётчики — в transport.counts и сводке сессии pytest.
+
+    transport = FaultInjectionTransport(
+        [
+            FaultRule(DelayFault(Latency("lognormal", 0.05, 0.8)), path="/posts*"),
+            FaultRule(ErrorFault(503, retry_after=2), path="/posts/*", probability=0.1),
+            FaultRule(ResetFault(), methods=("POST",), probability=0.02),
+        ],
+        transport=httpx.ASGITransport(app=MockAPI()),
+        seed=42,
+    )
+    async with AsyncAPIClient(MOCK_CONFIG, transport=transport) as client:
+        ...
+"""
+
+import asyncio
+import fnmatch
+import random
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+import httpx
+
+from .latency import Latency
+
+Forward = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+# Счётчики сработавших сбоев за процесс (сессию pytest) — для сводки в конце прогона
+_SESSION_COUNTS: Counter = Counter()
+
+
+def session_fault_counts() -> dict[str, int]:
+    """Сколько раз сработал каждый сбой во всех транспортах процесса."""
+    return dict(_SESSION_COUNTS)
+
+
+def add_session_fault_counts(counts: dict[str, int]) -> None:
+    """Добавить счётчики другого процесса (воркера pytest-xdist) к счётчикам этого."""
+    _SESSION_COUNTS.update(counts)
+
+
+class Fault(ABC):
+    """Сбой: получает запрос и следующий шаг цепочки, возвращает ответ или поднимает ошибку."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Ключ счётчика."""
+
+    @abstractmethod
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response: ...
+
+
+@dataclass(frozen=True)
+class DelayFault(Fault):
+    """Дополнительная задержка перед запросом."""
+
+    latency: Latency
+
+    @property
+    def name(self) -> str:
+        return "delay"
+
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response:
+        await asyncio.sleep(self.latency.sample(rng))
+        return await forward(request)
+
+
+@dataclass(frozen=True)
+class ErrorFault(Fault):
+    """
+    Ответ-ошибка вместо обращения к серверу.
+
+    :param retry_after: значение заголовка Retry-After в секундах (None — без заголовка)
+    """
+
+    status: int = 503
+    retry_after: Optional[int] = None
+    detail: str = "Injected fault"
+
+    def __post_init__(self):
+        if self.status < 400:
+            raise ValueError(f"ErrorFault status must be 4xx/5xx, got {self.status}")
+
+    @property
+    def name(self) -> str:
+        return f"error_{self.status}"
+
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response:
+        headers = {"retry-after": str(self.retry_after)} if self.retry_after is not None else {}
+        return httpx.Response(self.status, headers=headers, json={"detail": self.detail}, request=request)
+
+
+@dataclass(frozen=True)
+class TruncateFault(Fault):
+    """
+    Ответ сервера, у которого отрезан хвост тела.
+
+    :param keep: доля тела, которая остаётся (0..1)
+    """
+
+    keep: float = 0.5
+
+    def __post_init__(self):
+        if not 0.0 <= self.keep < 1.0:
+            raise ValueError(f"keep must be in [0, 1), got {self.keep}")
+
+    @property
+    def name(self) -> str:
+        return "truncate"
+
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response:
+        response = await forward(request)
+        content = await response.aread()
+        await response.aclose()
+        headers = [
+            (k, v) for k, v in response.headers.multi_items()
+            if k.lower() not in ("content-length", "content-encoding")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content[:int(len(content) * self.keep)],
+            request=request,
+        )
+
+
+@dataclass(frozen=True)
+class TimeoutFault(Fault):
+    """
+    Таймаут чтения ответа.
+
+    :param after: сколько «висеть» перед таймаутом, сек
+    """
+
+    after: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return "timeout"
+
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response:
+        if self.after:
+            await asyncio.sleep(self.after)
+        raise httpx.ReadTimeout("Injected read timeout", request=request)
+
+
+@dataclass(frozen=True)
+class ResetFault(Fault):
+    """Обрыв соединения сервером (ECONNRESET)."""
+
+    @property
+    def name(self) -> str:
+        return "reset"
+
+    async def apply(self, request: httpx.Request, forward: Forward, rng: random.Random) -> httpx.Response:
+        raise httpx.ReadError("[Errno 104] Connection reset by peer (injected)", request=request)
+
+
+@dataclass(frozen=True)
+class FaultRule:
+    """
+    Когда применять сбой.
+
+    :param path: glob по пути запроса ("/posts/*") или скомпилированное регулярное выражение
+    :param methods: HTTP-методы (None — любые)
+    :param probability: вероятность срабатывания на подходящий запрос (0..1)
+    """
+
+    fault: Fault
+    path: Union[str, "re.Pattern[str]"] = "*"
+    methods: Optional[tuple[str, ...]] = None
+    probability: float = 1.0
+
+    def __post_init__(self):
+        if not 0.0 <= self.probability <= 1.0:
+            raise ValueError(f"probability must be in [0, 1], got {self.probability}")
+
+    def matches(self, request: httpx.Request) -> bool:
+        if self.methods is not None and request.method.upper() not in {m.upper() for m in self.methods}:
+            return False
+        path = request.url.path
+        if isinstance(self.path, str):
+            return fnmatch.fnmatchcase(path, self.path)
+        return self.path.search(path) is not None
+
+
+@dataclass
+class FaultStats:
+    """Счётчики транспорта: всего запросов и срабатывания по имени сбоя."""
+
+    requests: int = 0
+    faults: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"requests": self.requests, **dict(self.faults)}
+
+
+class FaultInjectionTransport(httpx.AsyncBaseTransport):
+    """
+    Обёртка над транспортом, внедряющая сбои по правилам.
+
+    :param rules: правила; на один запрос может сработать несколько (например, задержка + 503)
+    :param transport: реальный транспорт (по умолчанию httpx.AsyncHTTPTransport)
+    :param seed: seed генератора решений и задержек
+    """
+
+    def __init__(
+            self,
+            rules: Iterable[FaultRule],
+            transport: Optional[httpx.AsyncBaseTransport] = None,
+            seed: int = 0,
+    ):
+        self.rules = list(rules)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._rng = random.Random(seed)
+        self.stats = FaultStats()
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return dict(self.stats.faults)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        fired = [
+            rule.fault for rule in self.rules
+            if rule.matches(request) and self._rng.random() < rule.probability
+        ]
+
+        forward: Forward = self._transport.handle_async_request
+        for fault in reversed(fired):
+            forward = self._bind(fault, forward)
+        return await forward(request)
+
+    def _bind(self, fault: Fault, forward: Forward) -> Forward:
+        async def call(request: httpx.Request) -> httpx.Response:
+            self.stats.faults[fault.name] += 1
+            _SESSION_COUNTS[fault.name] += 1
+            return await fault.apply(request, forward, self._rng)
+
+        return call
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def format_fault_counts(counts: dict[str, int]) -> str:
+    """Однострочная сводка для логов и отчёта: `delay=120 error_503=14 reset=2`."""
+    return " ".join(f"{name}={count}" for name, count in sorted(counts.items()))
@@ -0,0 +1,60 @@
+"""Распределения задержек для mock-сервера и fault-injection транспорта."""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+
+@dataclass(frozen=True)
+class Latency:
+    """
+    Распределение задержки в секундах.
+
+    :param distribution: "fixed" — всегда value;
+                         "uniform" — равномерно в [value, value + spread];
+                         "lognormal" — медиана value, sigma = spread (тяжёлый хвост, как у реальных API)
+    :param cap: верхняя граница выборки (None — без ограничения)
+    """
+
+    distribution: Literal["fixed", "uniform", "lognormal"] = "fixed"
+    value: float = 0.0
+    spread: float = 0.0
+    cap: Optional[float] = None
+
+    def __post_init__(self):
+        if self.distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution {self.distribution!r}")
+        if self.value < 0 or self.spread < 0:
+            raise ValueError(f"latency parameters must be non-negative, got {self!r}")
+        if self.distribution == "lognormal" and self.value == 0:
+            raise ValueError("lognormal latency needs a positive median (value)")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            delay = self.value + rng.random() * self.spread
+        elif self.distribution == "lognormal":
+            delay = rng.lognormvariate(math.log(self.value), self.spread)
+        else:
+            delay = self.value
+        return delay if self.cap is None else min(delay, self.cap)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """
+        Разбор из строки CLI: "0.05" (fixed), "uniform:0.01:0.04", "lognormal:0.02:0.6[:1.0]".
+        Последнее необязательное число — cap.
+        """
+
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("fixed", float(parts[0]))
+        distribution, *numbers = parts
+        if not 1 <= len(numbers) <= 3:
+            raise ValueError(f"Cannot parse latency spec {spec!r}")
+        values = [float(n) for n in numbers]
+        cap = values[2] if len(values) == 3 else None
+        return cls(distribution, values[0], values[1] if len(values) > 1 else 0.0, cap)  # type: ignore[arg-type]
+
+
+NO_LATENCY = Latency()
@@ -0,0 +1,205 @@
+"""
+Монитор задержки event loop: поиск синхронной работы, блокирующей цикл.
+
+Все запросы тестов идут через один session-цикл. Синхронная работа внутри
+него (логирование, запись вложений Allure, валидация больших тел) на время
+выполнения останавливает все остальные запросы — их задержки растут, хотя
+сервер ни при чём.
+
+Задача-сэмплер засыпает на interval и замеряет, насколько позже она
+проснулась: это и есть лаг цикла. Лаг от threshold — блокировка; она
+приписывается текущей метке (label — id теста в pytest-плагине).
+
+Фоновый поток-сторож:
+  • отмечает интервалы, когда цикл не был запущен (между тестами pytest-asyncio
+    останавливает цикл) — такие замеры отбрасываются, это не блокировка;
+  • с capture_stacks=True снимает стек потока цикла, как только текущая
+    блокировка дольше threshold, — видно, какой вызов держит цикл.
+
+    async with LoopLagMonitor(threshold=0.05, capture_stacks=True) as monitor:
+        monitor.label = "bulk create"
+        await client.posts.create_many(payloads)
+    print(format_lag_report(monitor))
+
+Стек снимается через sys._current_frames(): если блокирующий вызов держит
+GIL (C-код без отпускания), сторож ждёт его окончания и стека не будет.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Optional
+
+from ..metrics import LatencyHistogram
+
+STACK_DEPTH = 12
+NO_LABEL = "<outside tests>"
+
+
+@dataclass(frozen=True)
+class LoopBlock:
+    """Одна блокировка цикла."""
+
+    label: str
+    seconds: float
+    stack: Optional[str] = None
+
+
+@dataclass
+class LabelLag:
+    """Блокировки одной метки (теста): число, суммарное и худшее время, стек худшей."""
+
+    label: str
+    blocks: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+    worst_stack: Optional[str] = None
+
+    def add(self, block: LoopBlock) -> None:
+        self.blocks += 1
+        self.total += block.seconds
+        if block.seconds >= self.worst:
+            self.worst = block.seconds
+            self.worst_stack = block.stack
+
+
+class LoopLagMonitor:
+    """
+    :param interval: период сэмплирования, сек
+    :param threshold: лаг, с которого интервал считается блокировкой, сек
+    :param capture_stacks: снимать стек блокирующего вызова (поток-сторож смотрит чаще)
+    :param max_blocks: сколько последних блокировок хранить в blocks (сводка по меткам — все)
+    """
+
+    def __init__(
+            self,
+            interval: float = 0.01,
+            threshold: float = 0.05,
+            capture_stacks: bool = False,
+            max_blocks: int = 1000,
+    ):
+        if interval <= 0 or threshold <= 0:
+            raise ValueError("interval and threshold must be positive")
+        self.interval = interval
+        self.threshold = threshold
+        self.capture_stacks = capture_stacks
+        self.max_blocks = max_blocks
+        self.label = NO_LABEL
+
+        self.lag = LatencyHistogram()
+        self.blocks: list[LoopBlock] = []
+        self.by_label: dict[str, LabelLag] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread = 0
+        # Начало текущего интервала; сторож и сэмплер сверяют по нему, к какому интервалу относятся данные
+        self._beat = 0.0
+        self._stale = False
+        self._stack: Optional[tuple[float, str]] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Запустить в текущем (работающем) цикле."""
+
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._beat = time.perf_counter()
+        self._task = self._loop.create_task(self._sample(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def skip_sample(self) -> None:
+        """Не учитывать текущий интервал (цикл останавливали снаружи — например, между фазами теста)."""
+        self._stale = True
+
+    def top(self, n: int = 10) -> list[LabelLag]:
+        """Метки с наибольшим суммарным временем блокировок."""
+        return sorted(self.by_label.values(), key=lambda item: item.total, reverse=True)[:n]
+
+    async def _sample(self) -> None:
+        while True:
+            label = self.label
+            self._stale = False
+            self._beat = beat = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - beat - self.interval)
+            if self._stale:
+                continue
+            self.lag.record(lag)
+            if lag >= self.threshold:
+                stack = self._stack[1] if self._stack is not None and self._stack[0] == beat else None
+                self._record(LoopBlock(label, lag, stack))
+
+    def _record(self, block: LoopBlock) -> None:
+        self.blocks.append(block)
+        if len(self.blocks) > self.max_blocks:
+            del self.blocks[0]
+        stats = self.by_label.get(block.label)
+        if stats is None:
+            stats = self.by_label[block.label] = LabelLag(block.label)
+        stats.add(block)
+
+    def _watch(self) -> None:
+        # Со снятием стеков смотрим чаще — чтобы застать вызов до его окончания
+        period = min(self.interval, self.threshold / 4) if self.capture_stacks else self.interval
+        while not self._stopped.wait(period):
+            if not self._loop.is_running():
+                self._stale = True
+                continue
+            beat = self._beat
+            if not self.capture_stacks or (self._stack is not None and self._stack[0] == beat):
+                continue
+            if time.perf_counter() - beat - self.interval >= self.threshold:
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is not None:
+                    self._stack = (beat, "".join(traceback.format_stack(frame, limit=STACK_DEPTH)))
+
+
+def format_lag_report(monitor: LoopLagMonitor, top: int = 10, stacks: bool = True) -> str:
+    """Сводка: распределение лага и метки с наибольшим временем блокировок."""
+
+    lag = monitor.lag
+    lines = [
+        f"samples={lag.count} p50={lag.percentile(50) * 1000:.1f}ms p99={lag.percentile(99) * 1000:.1f}ms "
+        f"max={lag.max * 1000:.1f}ms; blocks >= {monitor.threshold * 1000:g}ms: "
+        f"{sum(item.blocks for item in monitor.by_label.values())}",
+    ]
+    for item in monitor.top(top):
+        lines.append(
+            f"{item.total * 1000:9.1f}ms total {item.blocks:5d} blocks  worst {item.worst * 1000:7.1f}ms  {item.label}"
+        )
+        if stacks and item.worst_stack:
+            lines.extend("      " + line for line in item.worst_stack.rstrip().splitlines())
+    return "\n".join(lines)
@@ -0,0 +1,435 @@
+"""
+In-process mock JSONPlaceholder-подобного API: /posts и /posts/{id}/comments.
+
+Один и тот же MockAPI работает:
+  • как ASGI-приложение — через httpx.ASGITransport, без сокетов и сети;
+  • как WSGI-приложение — на localhost через werkzeug (для нагрузочных
+    прогонов и внешних инструментов).
+
+Данные генерируются детерминированно по seed: 100 постов от 10 пользователей,
+по 5 комментариев на пост. Задержка, размер тел и доля ошибок настраиваются
+через MockServerConfig.
+
+    api = MockAPI(MockServerConfig(latency=Latency("lognormal", 0.02, 0.5)))
+    async with AsyncAPIClient(MOCK_CONFIG, transport=httpx.ASGITransport(app=api)) as client:
+        await client.posts.list()
+
+    with LocalMockServer(api) as server:       # http://127.0.0.1:<port>
+        ...
+
+Запуск отдельным процессом:
+    python -m src.async_api_client.testing.mock_server --port 8000 --latency lognormal:0.02:0.5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import parse_qs
+
+from ..config import APIConfig
+from .latency import NO_LATENCY, Latency
+
+try:
+    from werkzeug.serving import make_server
+except ImportError:  # опциональная зависимость: нужна только для LocalMockServer
+    make_server = None
+
+logger = logging.getLogger("async_api_client")
+
+# Конфиг клиента для ASGI-режима: хост произвольный, запрос до сети не доходит
+MOCK_CONFIG = APIConfig(host="mock.api", protocol="http")
+
+_WORDS = (
+    "sunt aut facere repellat provident occaecati excepturi optio reprehenderit "
+    "quia et suscipit recusandae consequuntur expedita nostrum rerum est autem "
+    "qui dolorem ipsum neque nisi nulla magnam voluptas tempore vitae sequi sint "
+    "odit ea molestias quasi eum accusamus dolor beatae doloribus veritatis"
+).split()
+_DOMAINS = ("gardner.biz", "sydney.com", "jasper.info", "billy.biz", "dana.io", "kory.org")
+
+
+@dataclass(frozen=True)
+class MockServerConfig:
+    """
+    Параметры mock-сервера.
+
+    :param latency: задержка перед каждым ответом
+    :param error_rate: доля запросов, на которые отвечать error_status (0..1)
+    :param error_status: статус «сбоя» (тело — {"detail": ...}, как у ServerError)
+    :param posts: число постов; пользователей — posts // 10
+    :param comments_per_post: комментариев на пост
+    :param body_size: длина тела поста в символах (None — 3-4 строки, как у JSONPlaceholder)
+    :param stateful: сохранять ли POST/PUT/PATCH/DELETE (JSONPlaceholder — не сохраняет)
+    :param seed: seed генерации данных, задержек и ошибок
+    """
+
+    latency: Latency = NO_LATENCY
+    error_rate: float = 0.0
+    error_status: int = 500
+    posts: int = 100
+    comments_per_post: int = 5
+    body_size: Optional[int] = None
+    stateful: bool = False
+    seed: int = 0
+
+    def __post_init__(self):
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError(f"error_rate must be in [0, 1], got {self.error_rate}")
+
+
+@dataclass
+class MockResponse:
+    status: int
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def encode(self) -> tuple[bytes, list[tuple[str, str]]]:
+        content = b"" if self.body is None else json.dumps(self.body, separators=(",", ":")).encode("utf-8")
+        headers = {"content-type": "application/json; charset=utf-8", **self.headers}
+        headers["content-length"] = str(len(content))
+        return content, list(headers.items())
+
+
+def _query_ints(query: dict[str, list[str]], name: str) -> Optional[list[int]]:
+    """Целые значения query-параметра; None — хотя бы одно значение не число."""
+    try:
+        return [int(value) for value in query.get(name, [])]
+    except ValueError:
+        return None
+
+
+def _bad_query(name: str, query: dict[str, list[str]]) -> MockResponse:
+    return MockResponse(400, {"detail": f"Query parameter {name} must be an integer, got {query[name]!r}"})
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _text(rng: random.Random, size: Optional[int]) -> str:
+    if size is None:
+        return "\n".join(_sentence(rng, 6, 12) for _ in range(rng.randint(3, 4)))
+    text = _sentence(rng, 8, 8)
+    return (text * (size // len(text) + 1))[:size]
+
+
+def generate_dataset(config: MockServerConfig) -> tuple[dict[int, dict], dict[int, list[dict]]]:
+    """Посты и комментарии (по id поста), детерминированно по config.seed."""
+
+    rng = random.Random(config.seed)
+    users = max(1, config.posts // 10)
+    posts: dict[int, dict] = {}
+    comments: dict[int, list[dict]] = {}
+    comment_id = 1
+    for post_id in range(1, config.posts + 1):
+        posts[post_id] = {
+            "userId": (post_id - 1) * users // config.posts + 1,
+            "id": post_id,
+            "title": _sentence(rng, 3, 8),
+            "body": _text(rng, config.body_size),
+        }
+        comments[post_id] = []
+        for _ in range(config.comments_per_post):
+            comments[post_id].append({
+                "postId": post_id,
+                "id": comment_id,
+                "name": _sentence(rng, 3, 6),
+                "email": f"{rng.choice(_WORDS).capitalize()}@{rng.choice(_DOMAINS)}",
+                "body": _text(rng, config.body_size),
+            })
+            comment_id += 1
+    return posts, comments
+
+
+Route = tuple[str, "re.Pattern[str]", Callable[..., MockResponse]]
+
+
+class MockAPI:
+    """
+    Mock JSONPlaceholder: маршрутизация, данные и счётчики запросов.
+
+    Поддерживаемые маршруты:
+      GET    /posts                 (?userId=, ?_page=&_limit= → X-Total-Count)
+      POST   /posts
+      GET    /posts/{id}
+      PUT    /posts/{id}
+      PATCH  /posts/{id}
+      DELETE /posts/{id}
+      GET    /posts/{id}/comments
+      GET    /comments              (?postId=)
+    """
+
+    def __init__(self, config: MockServerConfig = MockServerConfig()):
+        self.config = config
+        self.posts, self.comments = generate_dataset(config)
+        self._next_id = config.posts + 1
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.requests: dict[str, int] = {}
+        self._routes: list[Route] = [
+            ("GET", re.compile(r"/posts/?"), self._list_posts),
+            ("POST", re.compile(r"/posts/?"), self._create_post),
+            ("GET", re.compile(r"/posts/(\d+)"), self._get_post),
+            ("PUT", re.compile(r"/posts/(\d+)"), self._replace_post),
+            ("PATCH", re.compile(r"/posts/(\d+)"), self._patch_post),
+            ("DELETE", re.compile(r"/posts/(\d+)"), self._delete_post),
+            ("GET", re.compile(r"/posts/(\d+)/comments"), self._post_comments),
+            ("GET", re.compile(r"/comments/?"), self._list_comments),
+        ]
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def handle(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[MockResponse, float]:
+        """Ответ и задержка перед ним. Не блокирует — задержку выдерживает вызывающий."""
+
+        with self._lock:
+            key = f"{method} {path}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+            delay = self.config.latency.sample(self._rng)
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                return MockResponse(self.config.error_status, {"detail": "Injected server error"}), delay
+            return self._dispatch(method, path, query, body), delay
+
+    def _dispatch(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> MockResponse:
+        path_matched = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            payload = None
+            if body:
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    return MockResponse(400, {"detail": "Request body is not valid JSON"})
+            return handler(*match.groups(), query=query, payload=payload)
+        if path_matched:
+            return MockResponse(405, {"detail": f"Method {method} not allowed"})
+        return MockResponse(404, {"detail": f"Route {path} not found"})
+
+    # --- handlers -------------------------------------------------------------
+
+    def _list_posts(self, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        items: Iterable[dict] = self.posts.values()
+        if "userId" in query:
+            user_ids = _query_ints(query, "userId")
+            if user_ids is None:
+                return _bad_query("userId", query)
+            items = [p for p in items if p["userId"] in set(user_ids)]
+        return self._paged(list(items), query)
+
+    def _list_comments(self, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        if "postId" in query:
+            post_ids = _query_ints(query, "postId")
+            if post_ids is None:
+                return _bad_query("postId", query)
+            items = [c for post_id in post_ids for c in self.comments.get(post_id, [])]
+        else:
+            items = [c for group in self.comments.values() for c in group]
+        return self._paged(items, query)
+
+    def _paged(self, items: list[dict], query: dict[str, list[str]]) -> MockResponse:
+        if "_page" not in query and "_limit" not in query:
+            return MockResponse(200, items)
+        for name in ("_limit", "_page"):
+            if _query_ints(query, name) is None:
+                return _bad_query(name, query)
+        # Как JSONPlaceholder: страница и размер не меньше 1
+        limit = max(1, (_query_ints(query, "_limit") or [10])[0])
+        page = max(1, (_query_ints(query, "_page") or [1])[0])
+        start = (page - 1) * limit
+        return MockResponse(200, items[start:start + limit], {"x-total-count": str(len(items))})
+
+    def _get_post(self, post_id: str, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        post = self.posts.get(int(post_id))
+        if post is None:
+            return MockResponse(404, {"detail": f"Post {post_id} not found"})
+        return MockResponse(200, post)
+
+    def _create_post(self, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        post = {**(payload or {}), "id": self._next_id}
+        if self.config.stateful:
+            self.posts[self._next_id] = post
+            self.comments[self._next_id] = []
+            self._next_id += 1
+        return MockResponse(201, post)
+
+    def _replace_post(self, post_id: str, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        if int(post_id) not in self.posts:
+            return MockResponse(404, {"detail": f"Post {post_id} not found"})
+        post = {**(payload or {}), "id": int(post_id)}
+        if self.config.stateful:
+            self.posts[int(post_id)] = post
+        return MockResponse(200, post)
+
+    def _patch_post(self, post_id: str, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        post = self.posts.get(int(post_id))
+        if post is None:
+            return MockResponse(404, {"detail": f"Post {post_id} not found"})
+        post = {**post, **(payload or {}), "id": int(post_id)}
+        if self.config.stateful:
+            self.posts[int(post_id)] = post
+        return MockResponse(200, post)
+
+    def _delete_post(self, post_id: str, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        if self.config.stateful:
+            self.posts.pop(int(post_id), None)
+            self.comments.pop(int(post_id), None)
+        return MockResponse(200, {})
+
+    def _post_comments(self, post_id: str, query: dict[str, list[str]], payload: Any) -> MockResponse:
+        return MockResponse(200, self.comments.get(int(post_id), []))
+
+    # --- ASGI / WSGI ----------------------------------------------------------
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        response, delay = self.handle(
+            scope["method"], scope["path"], parse_qs(scope.get("query_string", b"").decode("latin-1")), body,
+        )
+        if delay:
+            await asyncio.sleep(delay)
+
+        content, headers = response.encode()
+        await send({
+            "type": "http.response.start",
+            "status": response.status,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def wsgi(self, environ: dict, start_response: Callable) -> list[bytes]:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        response, delay = self.handle(
+            environ["REQUEST_METHOD"], environ.get("PATH_INFO", "/"), parse_qs(environ.get("QUERY_STRING", "")), body,
+        )
+        if delay:
+            time.sleep(delay)
+
+        content, headers = response.encode()
+        start_response(f"{response.status} {_reason(response.status)}", headers)
+        return [content]
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
+
+
+class LocalMockServer:
+    """
+    MockAPI на localhost в фоновом потоке (многопоточный werkzeug).
+
+    :param port: 0 — любой свободный
+    """
+
+    def __init__(self, api: Optional[MockAPI] = None, host: str = "127.0.0.1", port: int = 0):
+        if make_server is None:
+            raise ImportError("LocalMockServer requires werkzeug: pip install werkzeug")
+        self.api = api or MockAPI()
+        self._server = make_server(host, port, self.api.wsgi, threaded=True)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.host
+
+    @property
+    def port(self) -> int:
+        return self._server.port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def config(self, **overrides: Any) -> APIConfig:
+        """APIConfig, указывающий на этот сервер."""
+        return APIConfig(host=self.host, port=self.port, protocol="http", **overrides)
+
+    def start(self) -> "LocalMockServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        logger.info("Mock API is serving on %s", self.url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Обслуживать запросы в текущем потоке (до KeyboardInterrupt)."""
+        logger.info("Mock API is serving on %s", self.url)
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalMockServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="JSONPlaceholder-like mock API on localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=Latency.parse, default=NO_LATENCY,
+                        help='"0.05", "uniform:0.01:0.04" or "lognormal:<median>:<sigma>[:<cap>]"')
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--body-size", type=int, default=None)
+    parser.add_argument("--stateful", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        posts=args.posts,
+        body_size=args.body_size,
+        stateful=args.stateful,
+        seed=args.seed,
+    )
+    server = LocalMockServer(MockAPI(config), host=args.host, port=args.port)
+    print(f"Mock API: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
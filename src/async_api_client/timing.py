@@ -0,0 +1,158 @@
+"""
+Повторные замеры задержки вызова: распределение вместо одного response.elapsed.
+
+Один ответ — случайная величина: GC, планировщик, прогрев соединений дают
+разброс в разы. measure() вызывает корутину N раз с заданной конкурентностью
+(после прогрева, не попадающего в замер) и возвращает LatencyStats —
+перцентили, среднее, стандартное отклонение и пропускную способность.
+
+    stats = await measure(lambda: client.posts.get(1), calls=200, concurrency=10, warmup=20)
+    assert_p95_below(stats, ms=150)
+
+Замеряется время вызова целиком, как его видит тест: сеть, сервер и работа
+клиента (логирование, валидация).
+"""
+
+import asyncio
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+import allure
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Распределение задержек серии вызовов; значения в миллисекундах."""
+
+    name: str
+    calls: int
+    concurrency: int
+    wall_seconds: float
+    samples_ms: tuple[float, ...] = field(repr=False)
+
+    @property
+    def mean_ms(self) -> float:
+        return statistics.fmean(self.samples_ms) if self.samples_ms else 0.0
+
+    @property
+    def stddev_ms(self) -> float:
+        return statistics.stdev(self.samples_ms) if len(self.samples_ms) > 1 else 0.0
+
+    @property
+    def min_ms(self) -> float:
+        return min(self.samples_ms, default=0.0)
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.samples_ms, default=0.0)
+
+    @property
+    def throughput(self) -> float:
+        """Вызовов в секунду за время серии (без прогрева)."""
+        return self.calls / self.wall_seconds if self.wall_seconds else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Перцентиль q по выборке (nearest-rank), мс."""
+
+        if not 0 <= q <= 100:
+            raise ValueError(f"percentile must be in [0, 100], got {q}")
+        if not self.samples_ms:
+            return 0.0
+        ordered = sorted(self.samples_ms)
+        rank = max(1, math.ceil(len(ordered) * q / 100))
+        return ordered[rank - 1]
+
+    @property
+    def p50_ms(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95_ms(self) -> float:
+        return self.percentile(95)
+
+    @property
+    def p99_ms(self) -> float:
+        return self.percentile(99)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "concurrency": self.concurrency,
+            "throughput_rps": round(self.throughput, 1),
+            "min_ms": round(self.min_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "stddev_ms": round(self.stddev_ms, 3),
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: n={self.calls} c={self.concurrency} "
+            f"p50={self.p50_ms:.1f}ms p95={self.p95_ms:.1f}ms p99={self.p99_ms:.1f}ms "
+            f"mean={self.mean_ms:.1f}±{self.stddev_ms:.1f}ms {self.throughput:.1f} req/s"
+        )
+
+
+async def measure(
+        call: Callable[[], Awaitable[Any]],
+        calls: int = 100,
+        concurrency: int = 1,
+        warmup: int = 5,
+        name: Optional[str] = None,
+) -> LatencyStats:
+    """
+    Вызвать call() calls раз и собрать распределение задержек.
+
+    :param call: фабрика корутины (`lambda: client.posts.get(1)`), вызывается на каждый замер
+    :param calls: число замеров
+    :param concurrency: сколько вызовов выполняется одновременно
+    :param warmup: вызовов до замера (соединения, кэши) — в статистику не попадают
+    :param name: имя серии в Allure и сообщениях ассертов
+    :return: LatencyStats; исключение вызова прерывает замер и пробрасывается
+    """
+
+    if calls < 1:
+        raise ValueError(f"calls must be >= 1, got {calls}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    name = name or "call"
+
+    with allure.step(f"Measure {name}: {calls} calls, concurrency {concurrency}, warm-up {warmup}"):
+        for _ in range(warmup):
+            await call()
+
+        samples: list[float] = []
+        remaining = iter(range(calls))
+
+        async def worker() -> None:
+            for _ in remaining:
+                start = time.perf_counter()
+                await call()
+                samples.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, calls))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # gather не отменяет соседей: без этого оставшиеся вызовы продолжились бы в фоне
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        stats = LatencyStats(
+            name=name,
+            calls=calls,
+            concurrency=concurrency,
+            wall_seconds=time.perf_counter() - started,
+            samples_ms=tuple(samples),
+        )
+        allure.attach(str(stats), name=f"Latency: {name}", attachment_type=allure.attachment_type.TEXT)
+    return stats
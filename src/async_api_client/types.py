@@ -1,7 +1,7 @@
 """Type aliases для аннотаций HTTP-клиента."""
 
 from http import HTTPStatus
-from typing import Iterable, Optional, Type, Union
+from typing import Iterable, Literal, Optional, Type, Union
 
 from pydantic import BaseModel
 
@@ -9,4 +9,6 @@ StatusCode = Union[int, HTTPStatus, Iterable[Union[int, HTTPStatus]], None]
 
 ResponseModel = Optional[Type[BaseModel]]
 RequestModel = Optional[Type[BaseModel]]
-RequestPayload = Union[BaseModel, dict, None]
\ No newline at end of file
+RequestPayload = Union[BaseModel, dict, None]
+# True — полная валидация, False — без валидации, "sample" — выборочная (для больших коллекций)
+ValidateMode = Union[bool, Literal["sample"]]
@@ -1,47 +1,122 @@
 import logging
+import random
+from dataclasses import dataclass
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Type, Optional
+from typing import Any, Type, Optional
 
+import allure
 from httpx import Response
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from .codec import JSONCodec, StdlibJSONCodec, decode_response
+from .config import ValidationSampling
 from .exceptions import (
     StatusAssertionError,
     RequestValidationError,
     ResponseValidationError,
 )
-from .types import StatusCode, ResponseModel, RequestModel
+from .types import StatusCode, ResponseModel, RequestModel, ValidateMode
 
 logger = logging.getLogger("async_api_client")
 
+_DEFAULT_CODEC = StdlibJSONCodec()
 
-def prepare_payload(kwargs: dict, request_model: RequestModel, validate: bool) -> dict:
-    """Сериализует Pydantic-модель в dict для отправки, опционально валидируя сырой dict."""
+# Ключ в response.extensions: (модель, провалидированное значение) после строгой валидации
+VALIDATED_MODEL_KEY = "validated_model"
+
+
+@dataclass(frozen=True)
+class SampleReport:
+    """Какие элементы коллекции были проверены при выборочной валидации."""
+
+    total: int
+    indices: tuple[int, ...]
+    seed: int
+
+    @property
+    def checked(self) -> int:
+        return len(self.indices)
+
+    @property
+    def is_full(self) -> bool:
+        return self.checked == self.total
+
+    def __str__(self) -> str:
+        return (
+            f"validated {self.checked} of {self.total} items (seed={self.seed}): "
+            f"{_format_ranges(self.indices)}"
+        )
+
+
+def prepare_payload(
+        kwargs: dict,
+        request_model: RequestModel,
+        validate: bool,
+        codec: Optional[JSONCodec] = None,
+) -> dict:
+    """
+    Сериализует тело запроса в JSON-байты за один проход и отправляет их как content=.
+
+    • Pydantic-модель (или список моделей) → dump_json сразу в bytes,
+      без промежуточного dict и повторной сериализации в httpx.
+    • Сырой dict/list при validate=True → валидация через request_model и dump_json.
+    • Сырой dict/list без валидации → сериализуется переданным codec.
+    """
 
     payload = kwargs.get("json")
     if payload is None:
         return kwargs
 
     if isinstance(payload, BaseModel):
-        kwargs["json"] = payload.model_dump(by_alias=True, exclude_none=True)
-        return kwargs
+        return _set_json_content(kwargs, _dump_json(_adapter(type(payload)), payload))
+
+    if _is_model_list(payload):
+        return _set_json_content(kwargs, _dump_json(_list_adapter(type(payload[0])), payload))
 
     if validate:
         if request_model is None:
             raise RequestValidationError(
                 "Cannot validate dict payload without request_model. ..."
             )
+        adapter = _list_adapter(request_model) if isinstance(payload, list) else _adapter(request_model)
         try:
-            model_instance = request_model.model_validate(payload)
+            validated = adapter.validate_python(payload)
         except ValidationError as exc:
             raise RequestValidationError(
                 f"Request body does not match {request_model.__name__}:\n{exc}"
             ) from exc
-        kwargs["json"] = model_instance.model_dump(by_alias=True, exclude_none=True)
+        return _set_json_content(kwargs, _dump_json(adapter, validated))
+
+    return _set_json_content(kwargs, (codec or _DEFAULT_CODEC).dumps(payload))
+
 
+def _set_json_content(kwargs: dict, content: bytes) -> dict:
+    """Заменяет json= на готовые байты и проставляет Content-Type, если его не задали."""
+
+    kwargs.pop("json", None)
+    kwargs["content"] = content
+
+    headers = dict(kwargs.get("headers") or {})
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    kwargs["headers"] = headers
     return kwargs
 
 
+def _dump_json(adapter: TypeAdapter, value: Any) -> bytes:
+    return adapter.dump_json(value, by_alias=True, exclude_none=True)
+
+
+def _is_model_list(payload: Any) -> bool:
+    return (
+        isinstance(payload, list)
+        and bool(payload)
+        and all(type(item) is type(payload[0]) for item in payload)
+        and isinstance(payload[0], BaseModel)
+    )
+
+
 def assert_status(response: Response, expected: StatusCode) -> None:
     """Проверяет, что статус-код входит в список ожидаемых."""
 
@@ -69,9 +144,17 @@ def validate_body(
         response: Response,
         response_model: ResponseModel,
         error_models: dict[int, Type[BaseModel]],
+        sampling: Optional[ValidationSampling] = None,
+        codec: Optional[JSONCodec] = None,
+        attach: bool = True,
 ) -> None:
     """
-    Валидирует тело ответа.
+    Валидирует тело ответа. JSON разбирается переданным codec (stdlib по умолчанию).
+    attach=False — не прикладывать отчёт о выборке к Allure (вызов вне потока теста).
+
+    Если тело — JSON-массив, response_model применяется к каждому элементу.
+    При переданном `sampling` массив проверяется выборочно (см. ValidationSampling),
+    а проверенные индексы кладутся в response.extensions["validation_sample"].
 
     Стратегия:
       • Явная response_model — строгая валидация, падает при несоответствии.
@@ -85,10 +168,11 @@ def validate_body(
     """
 
     status = response.status_code
+    codec = codec or _DEFAULT_CODEC
 
     if response_model is not None:
         # Явная модель — строгая валидация для любого статуса
-        _validate_strict(response, response_model, status)
+        _validate_strict(response, response_model, status, codec, sampling, attach)
         return
 
     if HTTPStatus.BAD_REQUEST <= status < 600:
@@ -100,7 +184,7 @@ def validate_body(
                 status,
             )
             return
-        _validate_soft(response, model, status)
+        _validate_soft(response, model, status, codec)
         return
 
     raise ResponseValidationError(
@@ -109,36 +193,145 @@ def validate_body(
     )
 
 
-def _validate_strict(response: Response, model: Type[BaseModel], status: int) -> None:
+def _validate_strict(
+        response: Response,
+        model: Type[BaseModel],
+        status: int,
+        codec: JSONCodec,
+        sampling: Optional[ValidationSampling] = None,
+        attach: bool = True,
+) -> None:
     """Строгая валидация: при любой ошибке поднимает ResponseValidationError."""
 
     if not response.content:
         return
 
     try:
-        body = response.json()
+        body = decode_response(response, codec)
     except ValueError as exc:
         raise ResponseValidationError(
             f"Expected JSON matching {model.__name__}, got non-JSON: {response.text[:200]}"
         ) from exc
 
+    if isinstance(body, list) and sampling is not None:
+        _validate_sample(response, body, model, status, sampling, attach)
+        return
+
     try:
-        model.model_validate(body)
+        validated = model_adapter(model, many=isinstance(body, list)).validate_python(body)
     except ValidationError as exc:
         raise ResponseValidationError(
             f"Response body does not match {model.__name__} "
             f"(status {status}):\n{exc}\n\nBody: {body}"
         ) from exc
+    # Сохраняем результат — APIResult отдаст его без повторной валидации
+    response.extensions[VALIDATED_MODEL_KEY] = (model, validated)
+
+
+def _validate_sample(
+        response: Response,
+        body: list[Any],
+        model: Type[BaseModel],
+        status: int,
+        sampling: ValidationSampling,
+        attach: bool = True,
+) -> None:
+    """Выборочная валидация элементов коллекции: head + tail + seeded random."""
+
+    report = SampleReport(
+        total=len(body),
+        indices=tuple(sample_indices(len(body), sampling)),
+        seed=sampling.seed,
+    )
+    response.extensions["validation_sample"] = report
+    logger.debug("Sample validation against %s: %s", model.__name__, report)
+    if attach:
+        attach_sample_report(report)
+
+    failed: list[tuple[int, ValidationError]] = []
+    for index in report.indices:
+        try:
+            model.model_validate(body[index])
+        except ValidationError as exc:
+            failed.append((index, exc))
+
+    if failed:
+        first_index, first_exc = failed[0]
+        raise ResponseValidationError(
+            f"Response items {[i for i, _ in failed]} do not match {model.__name__} "
+            f"(status {status}, {report}):\n"
+            f"[{first_index}] {first_exc}\n\nItem: {body[first_index]}"
+        )
+
+
+def attach_sample_report(report: SampleReport) -> None:
+    allure.attach(
+        str(report),
+        name=f"Validation sample ({report.checked}/{report.total})",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+
+
+def sample_indices(total: int, sampling: ValidationSampling) -> list[int]:
+    """
+    Отсортированные индексы для выборочной проверки коллекции длины `total`.
+
+    Выборка детерминирована: одинаковые total и sampling дают одинаковые индексы.
+    """
+
+    if total <= sampling.head + sampling.tail + sampling.random:
+        return list(range(total))
+
+    middle = range(sampling.head, total - sampling.tail)
+    picked = random.Random(sampling.seed).sample(middle, sampling.random)
+    return [
+        *range(sampling.head),
+        *sorted(picked),
+        *range(total - sampling.tail, total),
+    ]
+
+
+def model_adapter(model: Type[BaseModel], many: bool = False) -> TypeAdapter:
+    """Кэшированный TypeAdapter для модели или списка моделей."""
+    return _list_adapter(model) if many else _adapter(model)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _format_ranges(indices: tuple[int, ...]) -> str:
+    """(0, 1, 2, 7, 9, 10) → "0-2, 7, 9-10"."""
+
+    if not indices:
+        return "(none)"
+
+    parts: list[str] = []
+    start = prev = indices[0]
+    for index in indices[1:]:
+        if index == prev + 1:
+            prev = index
+            continue
+        parts.append(f"{start}-{prev}" if start != prev else str(start))
+        start = prev = index
+    parts.append(f"{start}-{prev}" if start != prev else str(start))
+    return ", ".join(parts)
 
 
-def _validate_soft(response: Response, model: Type[BaseModel], status: int) -> None:
+def _validate_soft(response: Response, model: Type[BaseModel], status: int, codec: JSONCodec) -> None:
     """Мягкая валидация: при ошибке логирует warning и продолжает."""
 
     if not response.content:
         return
 
     try:
-        body = response.json()
+        body = decode_response(response, codec)
     except ValueError:
         logger.warning(
             "Status %d body is not JSON, cannot validate against %s. Body: %s",
@@ -155,5 +348,5 @@ def _validate_soft(response: Response, model: Type[BaseModel], status: int) -> N
         )
 
 
-def effective(per_request: Optional[bool], *, default: bool) -> bool:
+def effective(per_request: Optional[ValidateMode], *, default: ValidateMode) -> ValidateMode:
     return default if per_request is None else per_request
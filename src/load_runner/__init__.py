@@ -0,0 +1,30 @@
+"""
+Генератор нагрузки поверх AsyncAPIClient: сценарии — методы endpoint'ов,
+открытая модель прибытий, гистограммы задержек и JSON/HTML-отчёт.
+"""
+
+from .distributed import Coordinator, run_worker
+from .multiprocess import MultiProcessRunner
+from .profile import LoadProfile, Stage
+from .runner import LoadReport, LoadRunner
+from .scenario import Scenario, ScenarioMix, load_scenarios, scenario
+from .stats import RunStats, ScenarioStats
+from .target import TargetSpec, config_from_url
+
+__all__ = [
+    "LoadRunner",
+    "LoadReport",
+    "MultiProcessRunner",
+    "Coordinator",
+    "run_worker",
+    "LoadProfile",
+    "Stage",
+    "Scenario",
+    "ScenarioMix",
+    "scenario",
+    "load_scenarios",
+    "RunStats",
+    "ScenarioStats",
+    "TargetSpec",
+    "config_from_url",
+]
@@ -0,0 +1,145 @@
+"""
+CLI генератора нагрузки.
+
+    python -m src.load_runner --rate 200 --ramp-up 10 --steady 60 --ramp-down 10 \\
+        --base-url https://jsonplaceholder.typicode.com \\
+        --json reports/load.json --html reports/load.html
+
+Без --base-url нагрузка идёт на in-process testing.MockAPI (--mock-latency, --mock-error-rate) —
+удобно для замера накладных расходов самого клиента.
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from utils.logger import configure_logging
+
+from .distributed import Coordinator
+from .multiprocess import MultiProcessRunner
+from .profile import LoadProfile
+from .report import format_text, write_html, write_json
+from .runner import LoadReport, LoadRunner
+from .scenario import load_scenarios
+from .stats import RunStats
+from .target import TargetSpec
+
+DEFAULT_SCENARIOS = "src.load_runner.examples:POSTS_SCENARIOS"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.load_runner", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_argument_group("target")
+    target.add_argument("--base-url", default=None, help="API base URL; omitted — in-process MockAPI")
+    target.add_argument("--connections", type=int, default=100)
+    target.add_argument("--timeout", type=float, default=10.0)
+    target.add_argument("--validate", choices=("off", "sample", "full"), default="sample",
+                        help="response body validation during load (status is always checked)")
+    target.add_argument("--mock-latency", default="0", help='MockAPI latency, e.g. "lognormal:0.02:0.5"')
+    target.add_argument("--mock-error-rate", type=float, default=0.0)
+
+    load = parser.add_argument_group("load")
+    load.add_argument("--scenarios", default=DEFAULT_SCENARIOS, help="module:ATTR with a list of Scenario")
+    load.add_argument("--rate", type=float, required=True, help="target arrivals per second")
+    load.add_argument("--ramp-up", type=float, default=0.0)
+    load.add_argument("--steady", type=float, default=30.0)
+    load.add_argument("--ramp-down", type=float, default=0.0)
+    load.add_argument("--arrivals", choices=("constant", "poisson"), default="poisson")
+    load.add_argument("--max-in-flight", type=int, default=10_000)
+    load.add_argument("--seed", type=int, default=0)
+    load.add_argument("--workers", type=int, default=1,
+                      help="worker processes, each with its own event loop and client; the rate is split evenly")
+
+    distributed = parser.add_argument_group("distributed (ZeroMQ)")
+    distributed.add_argument("--bind", default=None,
+                             help="run as coordinator on this address, e.g. tcp://*:5557; "
+                                  "workers: python -m src.load_runner.worker --connect ...")
+    distributed.add_argument("--expect-workers", type=int, default=1, help="workers to wait for before the start")
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--json", dest="json_path", default=None, help="write JSON report")
+    output.add_argument("--html", dest="html_path", default=None, help="write HTML report")
+    output.add_argument("--log-level", default="WARNING")
+    output.add_argument("--quiet", action="store_true", help="no per-second progress")
+    return parser
+
+
+def target_from_args(args: argparse.Namespace) -> TargetSpec:
+    return TargetSpec(
+        base_url=args.base_url,
+        connections=args.connections,
+        timeout=args.timeout,
+        validate=args.validate,
+        mock_latency=args.mock_latency,
+        mock_error_rate=args.mock_error_rate,
+    )
+
+
+def profile_from_args(args: argparse.Namespace) -> LoadProfile:
+    return LoadProfile.standard(
+        rate=args.rate, steady=args.steady, ramp_up=args.ramp_up, ramp_down=args.ramp_down, arrivals=args.arrivals,
+    )
+
+
+def print_progress(elapsed: float, window: RunStats) -> None:
+    total = window.total
+    errors = sum(total.errors.values())
+    print(
+        f"[{elapsed:7.1f}s] completed={total.count:<6} errors={errors:<5} dropped={window.dropped:<5} "
+        f"p50={total.response_time.percentile(50) * 1000:7.1f}ms "
+        f"p95={total.response_time.percentile(95) * 1000:7.1f}ms",
+        flush=True,
+    )
+
+
+def write_reports(report: LoadReport, args: argparse.Namespace) -> None:
+    print(format_text(report))
+    if args.json_path:
+        print(f"JSON report: {write_json(report, args.json_path)}")
+    if args.html_path:
+        print(f"HTML report: {write_html(report, args.html_path)}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.bind and args.workers > 1:
+        parser.error("--workers is for a local run; with --bind start workers via python -m src.load_runner.worker")
+    configure_logging(level=args.log_level, log_file="load_runner")
+
+    target = target_from_args(args)
+    on_interval = None if args.quiet else print_progress
+    if args.bind:
+        report = Coordinator(
+            target,
+            args.scenarios,
+            profile_from_args(args),
+            expected_workers=args.expect_workers,
+            bind=args.bind,
+            seed=args.seed,
+            max_in_flight=args.max_in_flight,
+            on_interval=on_interval,
+        ).run()
+    elif args.workers > 1:
+        report = MultiProcessRunner(
+            target,
+            args.scenarios,
+            profile_from_args(args),
+            workers=args.workers,
+            seed=args.seed,
+            max_in_flight=args.max_in_flight,
+            on_interval=on_interval,
+        ).run()
+    else:
+        runner = LoadRunner(
+            target.client,
+            load_scenarios(args.scenarios),
+            profile_from_args(args),
+            seed=args.seed,
+            max_in_flight=args.max_in_flight,
+            on_interval=on_interval,
+        )
+        report = asyncio.run(runner.run())
+    report.meta.update({"target": target.label, "validate": target.validate})
+    write_reports(report, args)
@@ -0,0 +1,265 @@
+"""
+Распределённый прогон через ZeroMQ: координатор и воркеры на нескольких узлах.
+
+Координатор слушает ROUTER-сокет, воркеры подключаются DEALER-сокетами.
+Все сообщения — JSON:
+
+    воркер → {"type": "hello", "host", "pid", "weight"}
+    коорд. → {"type": "start", "target", "scenarios", "profile", "seed", "max_in_flight", "interval", "start_in"}
+    воркер → {"type": "interval", "elapsed", "stats"}         раз в interval секунд
+    воркер → {"type": "done", "duration", "started_at", "stats", "cpu_seconds"}
+    воркер → {"type": "error", "traceback"}
+
+Дождавшись expected_workers воркеров, координатор делит профиль пропорционально
+weight (split_profile: profile.scaled(share, phase=доля предыдущих воркеров) —
+постоянные прибытия узлов сдвинуты, а не синхронны) и рассылает общий момент старта. Момент
+передаётся относительным (start_in): часы узлов могут расходиться, а задержка
+доставки по сети — единицы миллисекунд. Интервальные RunStats складываются
+по тикам (IntervalMerger) — живые throughput и перцентили по всему кластеру;
+итоговые — в один LoadReport (meta["nodes"] — вклад и CPU каждого воркера).
+
+    # узел-координатор
+    python -m src.load_runner --rate 20000 --steady 120 --base-url http://api:8000 \\
+        --bind tcp://*:5557 --expect-workers 8
+    # каждый узел нагрузки (по процессу на ядро)
+    python -m src.load_runner.worker --connect tcp://coordinator:5557
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import traceback
+from typing import Any, Optional
+
+import psutil
+import zmq
+
+from .profile import LoadProfile
+from .runner import IntervalCallback, LoadReport, LoadRunner
+from .scenario import load_scenarios
+from .stats import IntervalMerger, RunStats
+from .target import TargetSpec
+
+# Запас на доставку start и подготовку клиента на воркерах
+START_DELAY = 0.5
+
+
+def split_profile(profile: LoadProfile, weights: list[float]) -> list[LoadProfile]:
+    """
+    Доли профиля по весам воркеров. Фаза воркера — суммарная доля предыдущих:
+    при равных весах воркер i сдвинут на i/(N·rate), как в MultiProcessRunner.
+    """
+
+    total = sum(weights)
+    shares, before = [], 0.0
+    for weight in weights:
+        shares.append(profile.scaled(weight / total, phase=before / total))
+        before += weight
+    return shares
+
+
+def _send(sock: zmq.Socket, message: dict[str, Any], identity: Optional[bytes] = None) -> None:
+    payload = json.dumps(message).encode()
+    sock.send_multipart([identity, payload] if identity is not None else [payload])
+
+
+class Coordinator:
+    """
+    :param target: цель нагрузки (передаётся воркерам как словарь)
+    :param scenarios: ссылка "module:ATTR" — модуль должен быть доступен на воркерах
+    :param profile: общий профиль кластера
+    :param expected_workers: сколько воркеров ждать перед стартом
+    :param bind: адрес ROUTER-сокета ("tcp://*:5557"; порт 0 — случайный, см. endpoint)
+    :param seed: базовый seed; воркер i использует seed + i
+    :param max_in_flight: предел одновременных вызовов на воркер
+    :param interval: период интервальной статистики воркеров, сек
+    :param on_interval: callback(elapsed, статистика интервала всего кластера)
+    :param join_timeout: сколько ждать подключения воркеров, сек
+    :param silence_timeout: воркер, молчащий дольше во время прогона, считается потерянным
+    """
+
+    def __init__(
+            self,
+            target: TargetSpec,
+            scenarios: str,
+            profile: LoadProfile,
+            expected_workers: int,
+            bind: str = "tcp://*:5557",
+            seed: int = 0,
+            max_in_flight: int = 10_000,
+            interval: float = 1.0,
+            on_interval: Optional[IntervalCallback] = None,
+            join_timeout: float = 120.0,
+            silence_timeout: float = 30.0,
+    ):
+        if expected_workers < 1:
+            raise ValueError(f"expected_workers must be >= 1, got {expected_workers}")
+        self._target = target
+        self._scenarios = scenarios
+        self._profile = profile
+        self._expected = expected_workers
+        self._seed = seed
+        self._max_in_flight = max_in_flight
+        self._interval = interval
+        self._on_interval = on_interval
+        self._join_timeout = join_timeout
+        self._silence_timeout = silence_timeout
+        self._started = 0.0
+
+        self._context = zmq.Context.instance()
+        self._socket = self._context.socket(zmq.ROUTER)
+        self._socket.setsockopt(zmq.LINGER, 1000)
+        if bind.endswith(":0"):
+            port = self._socket.bind_to_random_port(bind.rsplit(":", 1)[0])
+            self.endpoint = f"{bind.rsplit(':', 1)[0]}:{port}".replace("*", "127.0.0.1")
+        else:
+            self._socket.bind(bind)
+            self.endpoint = bind
+
+    def run(self) -> LoadReport:
+        try:
+            workers = self._await_workers()
+            self._start(workers)
+            finals = self._collect(workers)
+        finally:
+            self._socket.close()
+        return self._merge(workers, finals)
+
+    def _recv(self, timeout: float) -> Optional[tuple[bytes, dict[str, Any]]]:
+        if not self._socket.poll(int(max(0.0, timeout) * 1000)):
+            return None
+        identity, payload = self._socket.recv_multipart()
+        return identity, json.loads(payload)
+
+    def _await_workers(self) -> dict[bytes, dict[str, Any]]:
+        workers: dict[bytes, dict[str, Any]] = {}
+        deadline = time.monotonic() + self._join_timeout
+        while len(workers) < self._expected:
+            received = self._recv(deadline - time.monotonic())
+            if received is None:
+                raise TimeoutError(f"only {len(workers)} of {self._expected} load workers joined")
+            identity, message = received
+            if message["type"] == "hello":
+                workers[identity] = {**message, "index": len(workers)}
+        return workers
+
+    def _start(self, workers: dict[bytes, dict[str, Any]]) -> None:
+        shares = split_profile(self._profile, [worker["weight"] for worker in workers.values()])
+        for (identity, worker), share in zip(workers.items(), shares):
+            _send(self._socket, {
+                "type": "start",
+                "target": self._target.to_dict(),
+                "scenarios": self._scenarios,
+                "profile": share.to_dict(),
+                "seed": self._seed + worker["index"],
+                "max_in_flight": self._max_in_flight,
+                "interval": self._interval,
+                "start_in": START_DELAY,
+            }, identity)
+        self._started = time.time() + START_DELAY
+
+    def _collect(self, workers: dict[bytes, dict[str, Any]]) -> dict[bytes, dict[str, Any]]:
+        finals: dict[bytes, dict[str, Any]] = {}
+        merger = IntervalMerger(workers, self._interval, self._on_interval or (lambda *_: None))
+        last_seen = {identity: time.monotonic() + START_DELAY for identity in workers}
+
+        while len(finals) < len(workers):
+            received = self._recv(self._interval / 2)
+            now = time.monotonic()
+            if received is not None:
+                identity, message = received
+                last_seen[identity] = now
+                kind = message["type"]
+                if kind == "interval":
+                    merger.add(identity, message["elapsed"], RunStats.from_dict(message["stats"]))
+                elif kind == "done":
+                    finals[identity] = message
+                    merger.finish(identity)
+                elif kind == "error":
+                    raise RuntimeError(f"load worker {workers[identity]['host']} failed:\n{message['traceback']}")
+
+            for identity, seen in last_seen.items():
+                if identity not in finals and now - seen > self._silence_timeout:
+                    worker = workers[identity]
+                    raise TimeoutError(f"load worker {worker['host']}/{worker['pid']} went silent")
+            merger.flush(time.time() - self._started)
+
+        merger.flush(time.time() - self._started, force=True)
+        return finals
+
+    def _merge(self, workers: dict[bytes, dict[str, Any]], finals: dict[bytes, dict[str, Any]]) -> LoadReport:
+        stats = RunStats()
+        nodes = []
+        for identity, final in sorted(finals.items(), key=lambda item: workers[item[0]]["index"]):
+            worker_stats = RunStats.from_dict(final["stats"])
+            stats.merge(worker_stats)
+            worker = workers[identity]
+            nodes.append({
+                "index": worker["index"],
+                "host": worker["host"],
+                "pid": worker["pid"],
+                "weight": worker["weight"],
+                "requests": worker_stats.count,
+                "dropped": worker_stats.dropped,
+                "cpu_seconds": final["cpu_seconds"],
+                "cpu_percent": round(100 * final["cpu_seconds"] / final["duration"], 1) if final["duration"] else 0.0,
+            })
+
+        return LoadReport(
+            started_at=min(final["started_at"] for final in finals.values()),
+            duration=max(final["duration"] for final in finals.values()),
+            profile=self._profile.describe(),
+            stats=stats,
+            meta={"seed": self._seed, "scenarios": self._scenarios, "nodes": nodes},
+        )
+
+
+def run_worker(connect: str, weight: float = 1.0) -> None:
+    """
+    Воркер: подключиться к координатору, дождаться start, отработать свою долю
+    профиля и отправить итог. Один прогон на процесс.
+    """
+
+    sock = zmq.Context.instance().socket(zmq.DEALER)
+    sock.setsockopt(zmq.LINGER, 5000)
+    sock.connect(connect)
+    try:
+        _send(sock, {"type": "hello", "host": socket.gethostname(), "pid": os.getpid(), "weight": weight})
+        message = json.loads(sock.recv())
+        if message["type"] != "start":
+            raise RuntimeError(f"unexpected coordinator message {message['type']!r}")
+        start_at = time.time() + message["start_in"]
+
+        try:
+            runner = LoadRunner(
+                TargetSpec(**message["target"]).client,
+                load_scenarios(message["scenarios"]),
+                LoadProfile.from_dict(message["profile"]),
+                seed=message["seed"],
+                max_in_flight=message["max_in_flight"],
+                interval=message["interval"],
+                on_interval=lambda elapsed, window: _send(
+                    sock, {"type": "interval", "elapsed": elapsed, "stats": window.to_dict()},
+                ),
+            )
+            process = psutil.Process()
+            cpu_before = process.cpu_times()
+            report = asyncio.run(runner.run(start_at=start_at))
+            cpu_after = process.cpu_times()
+        except Exception:
+            _send(sock, {"type": "error", "traceback": traceback.format_exc()})
+            raise
+
+        _send(sock, {
+            "type": "done",
+            "started_at": report.started_at,
+            "duration": report.duration,
+            "stats": report.stats.to_dict(),
+            "cpu_seconds": round(
+                (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system), 3,
+            ),
+        })
+    finally:
+        sock.close()
@@ -0,0 +1,35 @@
+"""
+Пример набора сценариев для PostsEndpoint (JSONPlaceholder / testing.MockAPI).
+
+    python -m src.load_runner --scenarios src.load_runner.examples:POSTS_SCENARIOS ...
+"""
+
+import random
+
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.models.posts import PostCreate
+
+from .scenario import scenario
+
+
+@scenario(weight=5)
+async def read_post(client: AsyncAPIClient, rng: random.Random) -> None:
+    await client.posts.get(rng.randint(1, 100))
+
+
+@scenario(weight=3)
+async def list_user_posts(client: AsyncAPIClient, rng: random.Random) -> None:
+    await client.posts.list(user_id=rng.randint(1, 10))
+
+
+@scenario(weight=2)
+async def post_comments(client: AsyncAPIClient, rng: random.Random) -> None:
+    await client.posts.comments(rng.randint(1, 100))
+
+
+@scenario(weight=1)
+async def create_post(client: AsyncAPIClient, rng: random.Random) -> None:
+    await client.posts.create(PostCreate(title="load", body="generated by load_runner", userId=rng.randint(1, 10)))
+
+
+POSTS_SCENARIOS = [read_post, list_user_posts, post_comments, create_post]
@@ -0,0 +1,371 @@
+"""
+Адаптер Locust для AsyncAPIClient: сценарии Locust поверх тех же endpoint'ов,
+моделей и стратегий авторизации, что и в тестах.
+
+Locust построен на gevent (monkey-patching при импорте), клиент — на asyncio.
+Мост: в процессе один asyncio-цикл в настоящем потоке ОС (с исходным, не
+пропатченным селектором); гринлет пользователя отправляет в него корутину
+и кооперативно ждёт результата — остальные пользователи в это время работают.
+
+Каждый HTTP-запрос попадает в статистику Locust отдельно: тип — метод,
+имя — шаблон пути (/posts/{id}), время — response.elapsed. Валидация
+Pydantic-моделью вынесена с критического пути: пользователь получает
+APIResult сразу, модель строится после — в потоке ОС пула моста, а не в
+цикле asyncio, который обслуживает ввод-вывод всех пользователей. Исход
+валидации — не запрос: он идёт в отдельное событие environment.events.validation
+(name, response_time, exception, response), сводка печатается при выходе Locust.
+
+    from locust import between, task
+    from src.load_runner.locust_user import AsyncAPIUser
+
+    class PostsUser(AsyncAPIUser):
+        wait_time = between(0.5, 1.5)
+
+        def make_auth(self):
+            return BearerAuth(issue_token(self.user_index))
+
+        @task
+        def read_post(self):
+            self.call(lambda client: client.posts.get(random.randint(1, 100)))
+
+    locust -f locustfile.py --host https://jsonplaceholder.typicode.com
+
+Модуль импортируется только из locustfile: импорт locust патчит стандартную
+библиотеку, в процессе pytest этого делать нельзя.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+
+import gevent
+import httpcore  # noqa: F401 — импорт в потоке gevent, а не лениво в потоке asyncio (см. _open)
+import httpx
+from gevent import monkey
+from gevent.event import AsyncResult
+from locust import User
+from locust.event import EventHook
+
+from src.async_api_client.auth import AsyncAuthStrategy
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.metrics import LatencyHistogram, template_path
+from src.async_api_client.results import APIResult
+
+from .target import config_from_url
+
+CallFactory = Callable[[AsyncAPIClient], Awaitable[Any]]
+
+# Запросы текущего вызова call(): заполняют event hooks httpx в задаче вызова
+_captured: ContextVar[Optional[list["_Exchange"]]] = ContextVar("locust_captured", default=None)
+
+
+class _Exchange:
+    __slots__ = ("request", "started", "response")
+
+    def __init__(self, request: httpx.Request):
+        self.request = request
+        self.started = time.perf_counter()
+        self.response: Optional[httpx.Response] = None
+
+
+async def _on_request(request: httpx.Request) -> None:
+    captured = _captured.get()
+    if captured is not None:
+        captured.append(_Exchange(request))
+
+
+async def _on_response(response: httpx.Response) -> None:
+    for exchange in reversed(_captured.get() or ()):
+        if exchange.request is response.request:
+            exchange.response = response
+            return
+
+
+def _resolve(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class AsyncioBridge:
+    """
+    asyncio-цикл в отдельном потоке ОС и ожидание его корутин из гринлетов.
+
+    Один на процесс (AsyncioBridge.get()): все пользователи делят цикл,
+    а значит и пул соединений каждого клиента обслуживается одним селектором.
+
+    CPU-работа (валидация) — в собственных потоках ОС моста (run_in_thread):
+    ThreadPoolExecutor и offload.run_in_pool под monkey-patching gevent
+    создают гринлеты вместо потоков и из потока asyncio не работают.
+    """
+
+    _instance: Optional["AsyncioBridge"] = None
+
+    def __init__(self, worker_threads: int = 2):
+        selector = monkey.get_original("selectors", "DefaultSelector")()
+        self.loop = asyncio.SelectorEventLoop(selector)
+        self._hub = gevent.get_hub()
+        # Колбэки, которые нужно выполнить в потоке gevent (события статистики Locust)
+        self._pending: deque[Callable[[], None]] = deque()
+        self._wakeup = self._hub.loop.async_()
+        self._wakeup.ref = False
+        self._wakeup.start(self._drain)
+        start_thread = monkey.get_original("_thread", "start_new_thread")
+        self._jobs = monkey.get_original("queue", "SimpleQueue")()
+        for _ in range(worker_threads):
+            start_thread(self._work, ())
+        start_thread(self._run, ())
+
+    @classmethod
+    def get(cls) -> "AsyncioBridge":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Выполнить корутину в цикле; текущий гринлет ждёт, не блокируя остальные."""
+
+        result = AsyncResult()
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        watcher = self._hub.loop.async_()
+
+        def deliver():
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+            else:
+                result.set(future.result())
+
+        watcher.start(deliver)
+        future.add_done_callback(lambda _: watcher.send())
+        try:
+            return result.get()
+        finally:
+            watcher.close()
+
+    def submit(self, coro: Awaitable[Any]) -> None:
+        """Запустить корутину в цикле, не дожидаясь результата."""
+        asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def run_in_thread(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Выполнить fn в потоке ОС моста, не блокируя цикл (вызывается из цикла)."""
+        future = self.loop.create_future()
+        self._jobs.put((future, fn, args))
+        return await future
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._jobs.get()
+            try:
+                result = fn(*args)
+            except BaseException as exc:
+                self.loop.call_soon_threadsafe(_resolve, future, None, exc)
+            else:
+                self.loop.call_soon_threadsafe(_resolve, future, result)
+
+    def call_in_hub(self, fn: Callable[[], None]) -> None:
+        """Выполнить fn в потоке gevent (вызывается из потока asyncio)."""
+        self._pending.append(fn)
+        self._wakeup.send()
+
+    def _drain(self) -> None:
+        while self._pending:
+            self._pending.popleft()()
+
+
+class ValidationStats:
+    """Итоги фоновой валидации по именам: вызовы, ошибки, время (не входят в статистику запросов)."""
+
+    def __init__(self):
+        self.entries: dict[str, tuple[int, int, LatencyHistogram]] = {}
+
+    def record(
+            self,
+            name: str,
+            response_time: float,
+            exception: Optional[BaseException] = None,
+            **kwargs: Any,
+    ) -> None:
+        count, failures, histogram = self.entries.get(name, (0, 0, LatencyHistogram()))
+        histogram.record(response_time / 1000)
+        self.entries[name] = (count + 1, failures + (exception is not None), histogram)
+
+    def format(self) -> str:
+        lines = [f"{'Validation':<40} {'# validations':>14} {'# fails':>8} {'p50, ms':>9} {'p95, ms':>9}"]
+        for name, (count, failures, histogram) in sorted(self.entries.items()):
+            lines.append(
+                f"{name:<40} {count:>14} {failures:>8} "
+                f"{histogram.percentile(50) * 1000:>9.2f} {histogram.percentile(95) * 1000:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+def validation_stats(environment) -> ValidationStats:
+    """
+    Событие environment.events.validation и сводка по нему (одни на окружение Locust).
+
+    Свои обработчики: environment.events.validation.add_listener(fn) — те же
+    аргументы, что у ValidationStats.record.
+    """
+
+    stats = getattr(environment, "validation_stats", None)
+    if stats is None:
+        stats = environment.validation_stats = ValidationStats()
+        if not hasattr(environment.events, "validation"):
+            environment.events.validation = EventHook()
+        environment.events.validation.add_listener(stats.record)
+
+        @environment.events.quitting.add_listener
+        def _print_summary(**kwargs: Any) -> None:
+            if stats.entries:
+                print(stats.format())
+
+    return stats
+
+
+class AsyncAPIUser(User):
+    """
+    Базовый пользователь Locust с собственным AsyncAPIClient.
+
+    Атрибуты класса:
+    - config: конфигурация API; None — собирается из host (--host);
+    - background_validation: валидировать ответы моделью вне критического пути
+      (False — валидация внутри вызова, как в тестах);
+    - client_options: дополнительные аргументы HttpxAsyncClient.
+
+    Переопределяемое:
+    - make_auth(): стратегия авторизации этого пользователя (свой токен/сессия);
+    - name_for(request): имя записи в статистике Locust.
+    """
+
+    abstract = True
+
+    config: Optional[APIConfig] = None
+    background_validation: bool = True
+    client_options: dict[str, Any] = {}
+
+    _user_counter = itertools.count()
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        self.user_index = next(AsyncAPIUser._user_counter)
+        self.client: Optional[AsyncAPIClient] = None
+        self._bridge = AsyncioBridge.get()
+        validation_stats(environment)
+
+    def make_auth(self) -> Optional[AsyncAuthStrategy]:
+        """Стратегия авторизации пользователя; вызывается в on_start, в потоке gevent."""
+        return None
+
+    def name_for(self, request: httpx.Request) -> str:
+        return template_path(request.url.path)
+
+    def on_start(self) -> None:
+        self.client = self._open()
+
+    def on_stop(self) -> None:
+        if self.client is not None:
+            client, self.client = self.client, None
+            self._bridge.run(client.aclose())
+
+    def _open(self) -> AsyncAPIClient:
+        # Клиент собирается в потоке gevent: ленивые импорты httpx/httpcore (trio → ctypes.util →
+        # subprocess) не должны выполняться в потоке asyncio с пропатченной stdlib без хаба
+        config = self.config or config_from_url(self.host)
+        http = HttpxAsyncClient(
+            config,
+            auth=self.make_auth(),
+            validate_response=not self.background_validation,
+            **self.client_options,
+        )
+        http.session.event_hooks["request"].append(_on_request)
+        http.session.event_hooks["response"].append(_on_response)
+        return AsyncAPIClient(config, http_client=http, typed_results=True, cleanup_on_close=False)
+
+    def call(self, factory: CallFactory, name: Optional[str] = None) -> Any:
+        """
+        Выполнить вызов клиента и записать его запросы в статистику Locust.
+
+        :param factory: функция client -> корутина (`lambda c: c.posts.get(1)`)
+        :param name: имя записи вместо шаблона пути (для всех запросов вызова)
+        :return: результат корутины; исключение пробрасывается после записи
+        """
+
+        result, captured, error = self._bridge.run(self._capture(factory))
+        for index, exchange in enumerate(captured):
+            last = index == len(captured) - 1
+            self._report(exchange, name, error if last else None)
+        if error is None and self.background_validation:
+            for item in result if isinstance(result, list) else (result,):
+                if isinstance(item, APIResult) and item.model is not None:
+                    self._bridge.submit(self._validate(item, name))
+        if error is not None:
+            if not captured:
+                self._fire("CALL", name or "unknown", 0.0, 0, error, None)
+            raise error
+        return result
+
+    async def _capture(self, factory: CallFactory) -> tuple[Any, list[_Exchange], Optional[BaseException]]:
+        captured: list[_Exchange] = []
+        _captured.set(captured)
+        try:
+            return await factory(self.client), captured, None
+        except Exception as exc:
+            return None, captured, exc
+
+    def _report(self, exchange: _Exchange, name: Optional[str], error: Optional[BaseException]) -> None:
+        response = exchange.response
+        if response is not None and not response.is_closed:
+            response = None
+        if response is not None:
+            elapsed = response.elapsed.total_seconds() * 1000
+            length = len(response.content)
+        else:
+            elapsed = (time.perf_counter() - exchange.started) * 1000
+            length = 0
+        self._fire(
+            exchange.request.method, name or self.name_for(exchange.request), elapsed, length, error, response,
+        )
+
+    async def _validate(self, result: APIResult, name: Optional[str]) -> None:
+        started = time.perf_counter()
+        error = None
+        try:
+            await self._bridge.run_in_thread(lambda: result.data)
+        except Exception as exc:
+            error = exc
+        elapsed = (time.perf_counter() - started) * 1000
+        label = name or self.name_for(result.response.request)
+        self._bridge.call_in_hub(lambda: self.environment.events.validation.fire(
+            name=label, response_time=elapsed, exception=error, response=result.response,
+        ))
+
+    def _fire(
+            self,
+            request_type: str,
+            name: str,
+            response_time: float,
+            response_length: int,
+            exception: Optional[BaseException],
+            response: Optional[httpx.Response],
+    ) -> None:
+        self.environment.events.request.fire(
+            request_type=request_type,
+            name=name,
+            response_time=response_time,
+            response_length=response_length,
+            response=response,
+            context=self.context(),
+            exception=exception,
+        )
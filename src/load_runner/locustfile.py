@@ -0,0 +1,35 @@
+"""
+Пример locustfile для PostsEndpoint — та же смесь, что и examples.POSTS_SCENARIOS.
+
+    python -m src.async_api_client.testing.mock_server --port 8000 &
+    locust -f src/load_runner/locustfile.py --host http://127.0.0.1:8000 \\
+        --headless -u 50 -r 10 -t 1m
+"""
+
+import random
+
+from locust import between, task
+
+from src.async_api_client.models.posts import PostCreate
+from src.load_runner.locust_user import AsyncAPIUser
+
+
+class PostsUser(AsyncAPIUser):
+    wait_time = between(0.1, 0.5)
+
+    @task(5)
+    def read_post(self):
+        self.call(lambda client: client.posts.get(random.randint(1, 100)))
+
+    @task(3)
+    def list_user_posts(self):
+        self.call(lambda client: client.posts.list(user_id=random.randint(1, 10)))
+
+    @task(2)
+    def post_comments(self):
+        self.call(lambda client: client.posts.comments(random.randint(1, 100)))
+
+    @task(1)
+    def create_post(self):
+        payload = PostCreate(title="load", body="generated by locust", userId=self.user_index % 10 + 1)
+        self.call(lambda client: client.posts.create(payload))
@@ -0,0 +1,257 @@
+"""
+Многопроцессный прогон: N воркеров, у каждого свой процесс, asyncio-цикл и клиент.
+
+Один цикл упирается в одно ядро (разбор JSON, валидация, логирование — всё
+в Python), поэтому профиль делится поровну: воркер i получает
+profile.scaled(1/N, phase=i/N) и свой seed — при постоянных прибытиях
+воркеры сдвинуты на i/(N·rate) и вместе дают равномерный поток, а не N
+одновременных запросов на каждом тике. Старт синхронный — координатор ждёт
+готовности всех воркеров и рассылает общий момент start_at, поэтому
+посекундные timeline воркеров совпадают по оси времени.
+
+Воркеры шлют координатору через multiprocessing.Queue интервальные
+RunStats.to_dict() (живой прогресс) и итог прогона; гистограммы
+складываются без потерь точности. В meta["workers"] — загрузка CPU каждого
+воркера (psutil): если она близка к 100%, узким местом был генератор, а не сервер.
+
+    runner = MultiProcessRunner(TargetSpec(base_url=...), "src.load_runner.examples:POSTS_SCENARIOS",
+                                LoadProfile.standard(rate=5000, steady=60), workers=4)
+    report = runner.run()
+"""
+
+import asyncio
+import multiprocessing
+import queue
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Optional, Sequence, Union
+
+import psutil
+
+from .profile import LoadProfile
+from .runner import IntervalCallback, LoadReport, LoadRunner
+from .scenario import Scenario, load_scenarios
+from .stats import IntervalMerger, RunStats
+from .target import TargetSpec
+
+ScenariosSpec = Union[str, Sequence[Scenario]]
+
+
+def _worker_main(
+        index: int,
+        target: TargetSpec,
+        scenarios: ScenariosSpec,
+        profile: LoadProfile,
+        seed: int,
+        max_in_flight: int,
+        interval: float,
+        control: Connection,
+        results: "multiprocessing.Queue",
+) -> None:
+    """Точка входа процесса-воркера (верхний уровень модуля — для spawn)."""
+
+    try:
+        mix = load_scenarios(scenarios) if isinstance(scenarios, str) else list(scenarios)
+        runner = LoadRunner(
+            target.client,
+            mix,
+            profile,
+            seed=seed,
+            max_in_flight=max_in_flight,
+            interval=interval,
+            on_interval=lambda elapsed, window: results.put(("interval", index, elapsed, window.to_dict())),
+        )
+        results.put(("ready", index, None))
+        start_at = control.recv()
+
+        process = psutil.Process()
+        cpu_before = process.cpu_times()
+        report = asyncio.run(runner.run(start_at=start_at))
+        cpu_after = process.cpu_times()
+
+        cpu_seconds = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
+        results.put(("done", index, {
+            "started_at": report.started_at,
+            "duration": report.duration,
+            "stats": report.stats.to_dict(),
+            "cpu_seconds": round(cpu_seconds, 3),
+        }))
+    except BaseException:
+        results.put(("error", index, traceback.format_exc()))
+        raise
+
+
+class MultiProcessRunner:
+    """
+    :param target: куда и как подключаться (собирается заново в каждом воркере)
+    :param scenarios: "module:ATTR" или список Scenario, определённых на уровне модуля
+    :param profile: общий профиль; воркер i выполняет profile.scaled(1/workers, phase=i/workers)
+    :param workers: число процессов
+    :param seed: базовый seed; воркер i использует seed + i
+    :param max_in_flight: предел одновременных вызовов на воркер
+    :param interval: период живой статистики, сек
+    :param on_interval: callback(elapsed, объединённая статистика интервала всех воркеров)
+    :param start_timeout: сколько ждать готовности воркеров (импорт, сборка клиента)
+    """
+
+    def __init__(
+            self,
+            target: TargetSpec,
+            scenarios: ScenariosSpec,
+            profile: LoadProfile,
+            workers: int = 2,
+            seed: int = 0,
+            max_in_flight: int = 10_000,
+            interval: float = 1.0,
+            on_interval: Optional[IntervalCallback] = None,
+            start_timeout: float = 60.0,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self._target = target
+        self._scenarios = scenarios
+        self._profile = profile
+        self._workers = workers
+        self._seed = seed
+        self._max_in_flight = max_in_flight
+        self._interval = interval
+        self._on_interval = on_interval
+        self._start_timeout = start_timeout
+
+    def run(self) -> LoadReport:
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        processes, controls = [], []
+        for index in range(self._workers):
+            share = self._profile.scaled(1 / self._workers, phase=index / self._workers)
+            reader, writer = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_worker_main,
+                name=f"load-worker-{index}",
+                args=(
+                    index, self._target, self._scenarios, share, self._seed + index,
+                    self._max_in_flight, self._interval, reader, results,
+                ),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+            controls.append(writer)
+
+        try:
+            self._await_ready(results, processes)
+            start_at = time.time() + 0.2
+            for control in controls:
+                control.send(start_at)
+            finals, cpu = self._collect(results, processes, start_at)
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        return self._merge(finals, cpu, processes)
+
+    def _await_ready(self, results: "multiprocessing.Queue", processes: list) -> None:
+        ready: set[int] = set()
+        deadline = time.monotonic() + self._start_timeout
+        while len(ready) < len(processes):
+            kind, index, payload = self._next(results, processes, deadline - time.monotonic())
+            if kind == "ready":
+                ready.add(index)
+
+    def _collect(
+            self, results: "multiprocessing.Queue", processes: list, start_at: float,
+    ) -> tuple[dict[int, dict[str, Any]], dict[int, list[float]]]:
+        finals: dict[int, dict[str, Any]] = {}
+        cpu: dict[int, list[float]] = {index: [] for index in range(len(processes))}
+        monitors = [psutil.Process(process.pid) for process in processes]
+        for monitor in monitors:
+            monitor.cpu_percent(None)
+
+        merger = IntervalMerger(range(len(processes)), self._interval, self._on_interval or (lambda *_: None))
+        next_sample = start_at + self._interval
+        while len(finals) < len(processes):
+            try:
+                kind, index, *payload = results.get(timeout=max(0.0, min(next_sample - time.time(), 1.0)))
+            except queue.Empty:
+                kind = None
+            if kind == "interval":
+                merger.add(index, payload[0], RunStats.from_dict(payload[1]))
+            elif kind == "done":
+                finals[index] = payload[0]
+                merger.finish(index)
+            elif kind == "error":
+                raise RuntimeError(f"load worker {index} failed:\n{payload[0]}")
+            elif kind is None:
+                self._check_alive(processes, finals)
+
+            if time.time() >= next_sample:
+                for index, monitor in enumerate(monitors):
+                    if index not in finals:
+                        cpu[index].append(self._cpu_percent(monitor))
+                next_sample += self._interval
+            merger.flush(time.time() - start_at)
+
+        merger.flush(time.time() - start_at, force=True)
+        return finals, cpu
+
+    def _next(self, results: "multiprocessing.Queue", processes: list, timeout: float) -> tuple:
+        while True:
+            if timeout <= 0:
+                raise TimeoutError("load workers did not become ready in time")
+            try:
+                kind, index, payload, *_ = results.get(timeout=min(timeout, 1.0))
+            except queue.Empty:
+                self._check_alive(processes, {})
+                timeout -= 1.0
+                continue
+            if kind == "error":
+                raise RuntimeError(f"load worker {index} failed:\n{payload}")
+            return kind, index, payload
+
+    @staticmethod
+    def _check_alive(processes: list, finals: dict[int, Any]) -> None:
+        for index, process in enumerate(processes):
+            if index not in finals and not process.is_alive():
+                raise RuntimeError(f"load worker {index} exited with code {process.exitcode}")
+
+    @staticmethod
+    def _cpu_percent(monitor: psutil.Process) -> float:
+        try:
+            return monitor.cpu_percent(None)
+        except psutil.Error:
+            return 0.0
+
+    def _merge(
+            self, finals: dict[int, dict[str, Any]], cpu: dict[int, list[float]], processes: list,
+    ) -> LoadReport:
+        stats = RunStats()
+        workers = []
+        for index in sorted(finals):
+            final = finals[index]
+            worker_stats = RunStats.from_dict(final["stats"])
+            stats.merge(worker_stats)
+            samples = cpu[index]
+            workers.append({
+                "index": index,
+                "pid": processes[index].pid,
+                "requests": worker_stats.count,
+                "dropped": worker_stats.dropped,
+                "cpu_seconds": final["cpu_seconds"],
+                "cpu_percent": round(100 * final["cpu_seconds"] / final["duration"], 1) if final["duration"] else 0.0,
+                "cpu_percent_peak": round(max(samples), 1) if samples else 0.0,
+            })
+
+        return LoadReport(
+            started_at=min(final["started_at"] for final in finals.values()),
+            duration=max(final["duration"] for final in finals.values()),
+            profile=self._profile.describe(),
+            stats=stats,
+            meta={
+                "seed": self._seed,
+                "scenarios": self._scenarios if isinstance(self._scenarios, str) else [s.name for s in self._scenarios],
+                "workers": workers,
+            },
+        )
@@ -0,0 +1,162 @@
+"""
+Профиль нагрузки: целевая интенсивность прибытий (запросов в секунду) во времени.
+
+Профиль состоит из стадий; интенсивность внутри стадии линейно меняется
+от конца предыдущей стадии до target_rate стадии (ramp-up / steady / ramp-down):
+
+    LoadProfile.standard(rate=200, ramp_up=10, steady=60, ramp_down=10)
+    LoadProfile([Stage(30, 50), Stage(30, 50), Stage(30, 300), Stage(60, 300)])
+
+Модель открытая: моменты прибытий считаются заранее и не зависят от того,
+как быстро отвечает сервер.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Iterator, Literal, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class Stage:
+    """:param duration: длительность, сек; :param target_rate: интенсивность в конце стадии, запросов/сек"""
+
+    duration: float
+    target_rate: float
+
+    def __post_init__(self):
+        if self.duration <= 0 or self.target_rate < 0:
+            raise ValueError(f"Invalid stage {self!r}")
+
+
+class LoadProfile:
+    """
+    :param stages: стадии по порядку
+    :param start_rate: интенсивность в начале первой стадии
+    :param arrivals: "constant" — равные интервалы; "poisson" — экспоненциальные
+                     интервалы с той же средней интенсивностью (реалистичнее для API)
+    :param phase: сдвиг постоянных прибытий в долях интервала [0, 1): k-е прибытие —
+                  при ∫rate = k + phase (воркеры одного профиля не стартуют одновременно)
+    """
+
+    def __init__(
+            self,
+            stages: Sequence[Stage],
+            start_rate: float = 0.0,
+            arrivals: Literal["constant", "poisson"] = "constant",
+            phase: float = 0.0,
+    ):
+        if not stages:
+            raise ValueError("LoadProfile needs at least one stage")
+        if arrivals not in ("constant", "poisson"):
+            raise ValueError(f"Unknown arrival process {arrivals!r}")
+        if not 0 <= phase < 1:
+            raise ValueError(f"phase must be in [0, 1), got {phase}")
+        self.stages = tuple(stages)
+        self.start_rate = start_rate
+        self.arrivals = arrivals
+        self.phase = phase
+
+    @classmethod
+    def standard(
+            cls,
+            rate: float,
+            steady: float,
+            ramp_up: float = 0.0,
+            ramp_down: float = 0.0,
+            arrivals: Literal["constant", "poisson"] = "constant",
+    ) -> "LoadProfile":
+        stages = []
+        if ramp_up > 0:
+            stages.append(Stage(ramp_up, rate))
+        stages.append(Stage(steady, rate))
+        if ramp_down > 0:
+            stages.append(Stage(ramp_down, 0.0))
+        return cls(stages, start_rate=0.0 if ramp_up > 0 else rate, arrivals=arrivals)
+
+    @property
+    def duration(self) -> float:
+        return sum(stage.duration for stage in self.stages)
+
+    @property
+    def expected_requests(self) -> float:
+        """Площадь под кривой интенсивности — ожидаемое число прибытий."""
+
+        total, rate = 0.0, self.start_rate
+        for stage in self.stages:
+            total += (rate + stage.target_rate) / 2 * stage.duration
+            rate = stage.target_rate
+        return total
+
+    def rate_at(self, t: float) -> float:
+        begin, rate = 0.0, self.start_rate
+        for stage in self.stages:
+            if t < begin + stage.duration:
+                return rate + (stage.target_rate - rate) * (t - begin) / stage.duration
+            begin, rate = begin + stage.duration, stage.target_rate
+        return 0.0
+
+    def scaled(self, factor: float, phase: float = 0.0) -> "LoadProfile":
+        """
+        Тот же профиль с интенсивностью × factor (доля одного воркера).
+
+        Для N равных долей воркер i берёт phase=i/N: его прибытия сдвинуты на
+        i/(N·rate), и вместе воркеры дают равномерный поток исходного профиля.
+        """
+
+        return LoadProfile(
+            [Stage(s.duration, s.target_rate * factor) for s in self.stages],
+            start_rate=self.start_rate * factor,
+            arrivals=self.arrivals,
+            phase=phase,
+        )
+
+    def arrival_times(self, rng: random.Random) -> Iterator[float]:
+        """
+        Запланированные моменты прибытий в секундах от старта.
+
+        k-е прибытие — момент, когда накопленная интенсивность ∫rate достигает k
+        (для poisson — суммы k экспоненциальных величин): так интервалы точно
+        следуют профилю и на крутом ramp-up, и при нулевой стартовой интенсивности.
+        """
+
+        position = self.phase if self.arrivals == "constant" else 0.0
+        while True:
+            t = self._time_of(position)
+            if t is None:
+                return
+            yield t
+            position += rng.expovariate(1.0) if self.arrivals == "poisson" else 1.0
+
+    def _time_of(self, arrivals: float) -> Optional[float]:
+        """Момент, когда ∫rate dt == arrivals; None — за пределами профиля."""
+
+        begin, rate, passed = 0.0, self.start_rate, 0.0
+        for stage in self.stages:
+            area = (rate + stage.target_rate) / 2 * stage.duration
+            if arrivals < passed + area:
+                left = arrivals - passed
+                slope = (stage.target_rate - rate) / stage.duration
+                if abs(slope) < 1e-12:
+                    return begin + left / rate
+                # rate*τ + slope*τ²/2 = left
+                root = math.sqrt(max(0.0, rate * rate + 2 * slope * left))
+                return begin + (root - rate) / slope
+            begin, rate, passed = begin + stage.duration, stage.target_rate, passed + area
+        return None
+
+    def describe(self) -> list[dict[str, float]]:
+        return [{"duration": s.duration, "target_rate": s.target_rate} for s in self.stages]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Для передачи воркерам на другие узлы."""
+        return {"stages": self.describe(), "start_rate": self.start_rate, "arrivals": self.arrivals, "phase": self.phase}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LoadProfile":
+        return cls(
+            [Stage(s["duration"], s["target_rate"]) for s in data["stages"]],
+            start_rate=data["start_rate"],
+            arrivals=data["arrivals"],
+            phase=data.get("phase", 0.0),
+        )
@@ -0,0 +1,126 @@
+"""JSON- и HTML-отчёты прогона."""
+
+import html
+import json
+from pathlib import Path
+from typing import Any, Union
+
+from .runner import LoadReport
+
+_PERCENTILE_KEYS = ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "p99.9_ms", "max_ms")
+
+
+def write_json(report: LoadReport, path: Union[str, Path]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.summary(), indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def format_text(report: LoadReport) -> str:
+    """Короткая таблица для консоли."""
+
+    summary = report.summary()
+    header = f"{'scenario':<24} {'req':>8} {'err':>6} {'rps':>8} " + " ".join(f"{k[:-3]:>9}" for k in _PERCENTILE_KEYS)
+    lines = [header, "-" * len(header)]
+    rows = [*summary["scenarios"].items(), ("TOTAL", summary["total"])]
+    for name, row in rows:
+        errors = sum(row["errors"].values())
+        latency = row["response_time"]
+        lines.append(
+            f"{name:<24} {row['requests']:>8} {errors:>6} {row['rps']:>8} "
+            + " ".join(f"{latency[k]:>9.1f}" for k in _PERCENTILE_KEYS)
+        )
+    lines.append(f"duration {summary['duration_s']}s, dropped {summary['dropped']}; latency: response time, ms")
+    for worker in summary["meta"].get("workers", ()):
+        lines.append(
+            f"worker {worker['index']} (pid {worker['pid']}): {worker['requests']} requests, "
+            f"CPU {worker['cpu_percent']}% avg / {worker['cpu_percent_peak']}% peak"
+        )
+    for node in summary["meta"].get("nodes", ()):
+        lines.append(
+            f"node {node['index']} ({node['host']}, pid {node['pid']}): {node['requests']} requests, "
+            f"CPU {node['cpu_percent']}% avg"
+        )
+    return "\n".join(lines)
+
+
+def write_html(report: LoadReport, path: Union[str, Path]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_html(report.summary()), encoding="utf-8")
+    return path
+
+
+def render_html(summary: dict[str, Any]) -> str:
+    """Самодостаточная HTML-страница: таблица перцентилей, ошибки и график нагрузки."""
+
+    def latency_cells(latency: dict[str, float]) -> str:
+        return "".join(f"<td>{latency[k]:.1f}</td>" for k in _PERCENTILE_KEYS)
+
+    rows = []
+    for name, row in [*summary["scenarios"].items(), ("TOTAL", summary["total"])]:
+        errors = ", ".join(f"{html.escape(k)}: {v}" for k, v in row["errors"].items()) or "—"
+        rows.append(
+            f"<tr><th>{html.escape(name)}</th><td>{row['requests']}</td><td>{row['rps']}</td>"
+            f"{latency_cells(row['response_time'])}{latency_cells(row['service_time'])}<td>{errors}</td></tr>"
+        )
+
+    percentile_headers = "".join(f"<th>{k[:-3]}</th>" for k in _PERCENTILE_KEYS)
+    meta = ", ".join(
+        f"{html.escape(str(k))}={html.escape(str(v))}" for k, v in summary["meta"].items() if k not in ("workers", "nodes")
+    )
+    workers = "".join(
+        f"<tr><th>{w['index']}</th><td>{w['pid']}</td><td>{w['requests']}</td><td>{w['dropped']}</td>"
+        f"<td>{w['cpu_percent']}</td><td>{w['cpu_percent_peak']}</td></tr>"
+        for w in summary["meta"].get("workers", ())
+    )
+    if workers:
+        workers = (
+            "<h2>Workers</h2><table><tr><th>worker</th><th>pid</th><th>requests</th><th>dropped</th>"
+            f"<th>CPU avg, %</th><th>CPU peak, %</th></tr>{workers}</table>"
+        )
+
+    return f"""<!DOCTYPE html>
+<html lang="ru"><head><meta charset="utf-8"><title>Load report {html.escape(summary['started_at'])}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th:first-child {{ text-align: left; }}
+</style></head><body>
+<h1>Load report</h1>
+<p>Started {html.escape(summary['started_at'])}, duration {summary['duration_s']} s,
+dropped arrivals {summary['dropped']}. {meta}</p>
+<table>
+<tr><th rowspan="2">scenario</th><th rowspan="2">requests</th><th rowspan="2">rps</th>
+<th colspan="{len(_PERCENTILE_KEYS)}">response time, ms (from scheduled start)</th>
+<th colspan="{len(_PERCENTILE_KEYS)}">service time, ms</th><th rowspan="2">errors</th></tr>
+<tr>{percentile_headers}{percentile_headers}</tr>
+{''.join(rows)}
+</table>
+{workers}
+<h2>Throughput per second</h2>
+{_timeline_svg(summary['timeline'])}
+</body></html>
+"""
+
+
+def _timeline_svg(timeline: list[dict[str, int]], width: int = 900, height: int = 240) -> str:
+    if not timeline:
+        return "<p>no data</p>"
+    last = max(point["second"] for point in timeline) or 1
+    peak = max(max(point["sent"], point["completed"]) for point in timeline) or 1
+
+    def polyline(key: str, color: str) -> str:
+        points = " ".join(
+            f"{point['second'] / last * width:.1f},{height - point[key] / peak * height:.1f}"
+            for point in timeline
+        )
+        return f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{points}"/>'
+
+    return (
+        f'<svg width="{width}" height="{height}" style="border:1px solid #ccc">'
+        f'{polyline("sent", "#888")}{polyline("completed", "#2a7")}{polyline("errors", "#d33")}'
+        f'</svg><p>grey — sent, green — completed, red — errors; peak {peak}/s</p>'
+    )
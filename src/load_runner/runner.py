@@ -0,0 +1,196 @@
+"""
+Генератор нагрузки с открытой моделью поверх AsyncAPIClient.
+
+Каждое прибытие из профиля запускает выбранный сценарий отдельной задачей
+в запланированный момент, не дожидаясь завершения предыдущих: медленные
+ответы не снижают подаваемую нагрузку (в отличие от цикла «запрос → ответ →
+следующий запрос», где задержки сервера прячутся — coordinated omission).
+Задержка считается от запланированного момента, поэтому очередь на стороне
+генератора тоже попадает в response_time.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional
+
+from src.async_api_client.client import AsyncAPIClient
+
+from .profile import LoadProfile
+from .scenario import Scenario, ScenarioMix
+from .stats import RunStats
+
+logger = logging.getLogger("load_runner")
+
+ClientFactory = Callable[[], AbstractAsyncContextManager[AsyncAPIClient]]
+IntervalCallback = Callable[[float, RunStats], Any]
+
+
+@dataclass
+class LoadReport:
+    """Итог прогона: параметры, статистика и посекундная динамика."""
+
+    started_at: str
+    duration: float
+    profile: list[dict[str, float]]
+    stats: RunStats
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        """Сводка для JSON/HTML-отчёта (без сырых гистограмм)."""
+
+        def describe(stats) -> dict[str, Any]:
+            return {
+                "requests": stats.count,
+                "ok": stats.ok,
+                "errors": dict(stats.errors),
+                "rps": round(stats.count / self.duration, 2) if self.duration else 0.0,
+                "response_time": stats.response_time.summary(),
+                "service_time": stats.service_time.summary(),
+            }
+
+        return {
+            "started_at": self.started_at,
+            "duration_s": round(self.duration, 3),
+            "profile": self.profile,
+            "meta": self.meta,
+            "dropped": self.stats.dropped,
+            "total": describe(self.stats.total),
+            "scenarios": {name: describe(stats) for name, stats in sorted(self.stats.scenarios.items())},
+            "timeline": [
+                {"second": second, **{k: tick.get(k, 0) for k in ("sent", "completed", "errors", "dropped")}}
+                for second, tick in sorted(self.stats.timeline.items())
+            ],
+        }
+
+
+class LoadRunner:
+    """
+    :param client_factory: фабрика клиента — async context manager (обычно лямбда с AsyncAPIClient(...))
+    :param scenarios: взвешенные сценарии
+    :param profile: профиль интенсивности
+    :param seed: seed выбора сценариев и пуассоновских прибытий
+    :param max_in_flight: предел одновременных вызовов; прибытия сверх него
+                          не запускаются и учитываются как dropped
+    :param drain_timeout: сколько ждать незавершённые вызовы после конца профиля
+    :param interval: период вызова on_interval, сек
+    :param on_interval: callback(elapsed, stats_за_интервал) — для живого прогресса
+                        и отправки метрик координатору
+    """
+
+    def __init__(
+            self,
+            client_factory: ClientFactory,
+            scenarios: Iterable[Scenario],
+            profile: LoadProfile,
+            seed: int = 0,
+            max_in_flight: int = 10_000,
+            drain_timeout: float = 30.0,
+            interval: float = 1.0,
+            on_interval: Optional[IntervalCallback] = None,
+    ):
+        self._client_factory = client_factory
+        self._mix = ScenarioMix(scenarios)
+        self._profile = profile
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._max_in_flight = max_in_flight
+        self._drain_timeout = drain_timeout
+        self._interval = interval
+        self._on_interval = on_interval
+
+        self._total = RunStats()
+        self._window = RunStats()
+        self._in_flight: set[asyncio.Task] = set()
+        self._t0 = 0.0
+
+    async def run(self, start_at: Optional[float] = None) -> LoadReport:
+        """
+        :param start_at: время старта по time.time() — для синхронного старта
+                         нескольких процессов/узлов; None — сразу
+        """
+
+        loop = asyncio.get_running_loop()
+        if start_at is not None:
+            await asyncio.sleep(max(0.0, start_at - time.time()))
+        started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        async with self._client_factory() as client:
+            self._t0 = loop.time()
+            ticker = asyncio.create_task(self._tick()) if self._on_interval else None
+            try:
+                await self._generate(client)
+                await self._drain()
+            finally:
+                if ticker is not None:
+                    ticker.cancel()
+                    await asyncio.gather(ticker, return_exceptions=True)
+
+        duration = loop.time() - self._t0
+        window = self._flush_window()
+        if self._on_interval is not None and window.count:
+            self._on_interval(duration, window)
+
+        return LoadReport(
+            started_at=started_at,
+            duration=duration,
+            profile=self._profile.describe(),
+            stats=self._total,
+            meta={"seed": self._seed, "scenarios": self._mix.names},
+        )
+
+    async def _generate(self, client: AsyncAPIClient) -> None:
+        loop = asyncio.get_running_loop()
+        # Отдельный генератор: выбор сценариев не сдвигает расписание прибытий
+        for offset in self._profile.arrival_times(random.Random(f"arrivals-{self._seed}")):
+            delay = self._t0 + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if len(self._in_flight) >= self._max_in_flight:
+                self._window.record_dropped(offset)
+                continue
+
+            task = asyncio.create_task(self._execute(client, self._mix.pick(self._rng), offset))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _execute(self, client: AsyncAPIClient, scenario: Scenario, intended: float) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time() - self._t0
+        error = None
+        try:
+            await scenario(client, self._rng)
+        except asyncio.CancelledError:
+            error = "Cancelled"
+            raise
+        except Exception as exc:
+            error = type(exc).__name__
+            logger.debug("Scenario %s failed: %r", scenario.name, exc)
+        finally:
+            self._window.record(scenario.name, intended, started, loop.time() - self._t0, error)
+
+    async def _drain(self) -> None:
+        if not self._in_flight:
+            return
+        done, pending = await asyncio.wait(set(self._in_flight), timeout=self._drain_timeout)
+        if pending:
+            logger.warning("%d calls still running after %.0fs drain, cancelling", len(pending), self._drain_timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self._interval)
+            self._on_interval(loop.time() - self._t0, self._flush_window())
+
+    def _flush_window(self) -> RunStats:
+        window, self._window = self._window, RunStats()
+        self._total.merge(window)
+        return window
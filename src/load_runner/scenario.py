@@ -0,0 +1,87 @@
+"""
+Сценарии нагрузки — обычные корутины поверх endpoint'ов AsyncAPIClient.
+
+Сценарий получает клиента и случайный генератор прогона и делает один
+«пользовательский» вызов (или короткую цепочку). Статус и тело проверяются
+тем же транспортом, что и в функциональных тестах (validators): ошибка
+проверки — это ошибка сценария в отчёте, с именем класса исключения.
+
+    @scenario(weight=5)
+    async def read_post(client, rng):
+        await client.posts.get(rng.randint(1, 100))
+
+    SCENARIOS = [read_post, list_posts]
+"""
+
+import importlib
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from src.async_api_client.client import AsyncAPIClient
+
+ScenarioFn = Callable[["AsyncAPIClient", random.Random], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    :param name: имя в отчёте (по умолчанию — имя функции)
+    :param fn: корутина (client, rng) -> Any
+    :param weight: относительная доля прибытий, назначаемых сценарию
+    """
+
+    name: str
+    fn: ScenarioFn
+    weight: float = 1.0
+
+    def __post_init__(self):
+        if self.weight <= 0:
+            raise ValueError(f"Scenario {self.name!r}: weight must be positive, got {self.weight}")
+
+    async def __call__(self, client: "AsyncAPIClient", rng: random.Random) -> Any:
+        return await self.fn(client, rng)
+
+
+def scenario(weight: float = 1.0, name: Optional[str] = None) -> Callable[[ScenarioFn], Scenario]:
+    """Декоратор: превращает корутину в Scenario."""
+
+    def wrap(fn: ScenarioFn) -> Scenario:
+        return Scenario(name=name or fn.__name__, fn=fn, weight=weight)
+
+    return wrap
+
+
+class ScenarioMix:
+    """Взвешенный выбор сценария на каждое прибытие."""
+
+    def __init__(self, scenarios: Iterable[Scenario]):
+        self.scenarios: Sequence[Scenario] = tuple(scenarios)
+        if not self.scenarios:
+            raise ValueError("At least one scenario is required")
+        names = [s.name for s in self.scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Scenario names must be unique, got {names}")
+        self._weights = [s.weight for s in self.scenarios]
+
+    def pick(self, rng: random.Random) -> Scenario:
+        return rng.choices(self.scenarios, weights=self._weights)[0]
+
+    @property
+    def names(self) -> list[str]:
+        return [s.name for s in self.scenarios]
+
+
+def load_scenarios(spec: str) -> list[Scenario]:
+    """
+    Сценарии по ссылке "module:ATTR" — ATTR это список Scenario (или один Scenario).
+
+    Используется CLI и воркерами: в другой процесс передаётся строка, а не функции.
+    """
+
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Scenario spec must look like 'module:ATTR', got {spec!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    return [value] if isinstance(value, Scenario) else list(value)
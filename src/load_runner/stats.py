@@ -0,0 +1,184 @@
+"""Сбор результатов прогона: гистограммы по сценариям, ошибки и посекундная динамика."""
+
+from collections import Counter
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from src.async_api_client.metrics import LatencyHistogram
+
+
+class ScenarioStats:
+    """
+    Результаты одного сценария.
+
+    response_time — от запланированного момента прибытия до ответа: включает
+    ожидание в очереди генератора, то есть скорректирован на coordinated omission.
+    service_time — от фактического старта вызова до ответа (то, что видит клиент).
+    """
+
+    def __init__(self):
+        self.response_time = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.ok = 0
+        self.errors: Counter = Counter()
+
+    @property
+    def count(self) -> int:
+        return self.ok + sum(self.errors.values())
+
+    def merge(self, other: "ScenarioStats") -> "ScenarioStats":
+        self.response_time.merge(other.response_time)
+        self.service_time.merge(other.service_time)
+        self.ok += other.ok
+        self.errors.update(other.errors)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "response_time": self.response_time.to_dict(),
+            "service_time": self.service_time.to_dict(),
+            "ok": self.ok,
+            "errors": dict(self.errors),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScenarioStats":
+        stats = cls()
+        stats.response_time = LatencyHistogram.from_dict(data["response_time"])
+        stats.service_time = LatencyHistogram.from_dict(data["service_time"])
+        stats.ok = data["ok"]
+        stats.errors = Counter(data["errors"])
+        return stats
+
+
+class RunStats:
+    """
+    Результаты прогона (или его интервала). Складываются через merge —
+    так объединяются интервалы одного воркера и итоги разных воркеров.
+
+    timeline: {секунда от старта: {"sent", "completed", "errors"}};
+    sent считается по запланированному моменту, completed/errors — по моменту ответа.
+    """
+
+    def __init__(self):
+        self.scenarios: dict[str, ScenarioStats] = {}
+        self.dropped = 0
+        self.timeline: dict[int, Counter] = {}
+
+    def record(
+            self,
+            scenario: str,
+            intended: float,
+            started: float,
+            finished: float,
+            error: Optional[str] = None,
+    ) -> None:
+        """Все моменты — секунды от старта прогона."""
+
+        stats = self.scenarios.get(scenario)
+        if stats is None:
+            stats = self.scenarios[scenario] = ScenarioStats()
+        stats.response_time.record(finished - intended)
+        stats.service_time.record(finished - started)
+        if error is None:
+            stats.ok += 1
+        else:
+            stats.errors[error] += 1
+
+        self._tick(int(intended))["sent"] += 1
+        finished_tick = self._tick(int(finished))
+        finished_tick["completed"] += 1
+        if error is not None:
+            finished_tick["errors"] += 1
+
+    def record_dropped(self, intended: float) -> None:
+        """Прибытие не запущено: исчерпан лимит одновременных запросов генератора."""
+
+        self.dropped += 1
+        self._tick(int(intended))["dropped"] += 1
+
+    def _tick(self, second: int) -> Counter:
+        tick = self.timeline.get(second)
+        if tick is None:
+            tick = self.timeline[second] = Counter()
+        return tick
+
+    @property
+    def total(self) -> ScenarioStats:
+        """Все сценарии вместе."""
+
+        total = ScenarioStats()
+        for stats in self.scenarios.values():
+            total.merge(stats)
+        return total
+
+    @property
+    def count(self) -> int:
+        return sum(stats.count for stats in self.scenarios.values())
+
+    def merge(self, other: "RunStats") -> "RunStats":
+        for name, stats in other.scenarios.items():
+            self.scenarios.setdefault(name, ScenarioStats()).merge(stats)
+        self.dropped += other.dropped
+        for second, tick in other.timeline.items():
+            self._tick(second).update(tick)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scenarios": {name: stats.to_dict() for name, stats in self.scenarios.items()},
+            "dropped": self.dropped,
+            "timeline": {str(second): dict(tick) for second, tick in self.timeline.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunStats":
+        stats = cls()
+        stats.scenarios = {name: ScenarioStats.from_dict(s) for name, s in data["scenarios"].items()}
+        stats.dropped = data["dropped"]
+        stats.timeline = {int(second): Counter(tick) for second, tick in data["timeline"].items()}
+        return stats
+
+
+class IntervalMerger:
+    """
+    Сводит интервальную статистику нескольких источников (процессов, узлов)
+    в общие интервалы для живого прогресса.
+
+    Источник присылает окно с elapsed от общего старта; окна группируются
+    по номеру тика round(elapsed / interval). Тик отдаётся в callback, когда
+    его прислали все источники, кроме завершившихся, или когда он опоздал
+    больше чем на интервал — зависший источник не останавливает прогресс.
+
+    :param sources: идентификаторы источников
+    :param interval: период интервалов источников, сек
+    :param callback: callback(elapsed, объединённая статистика тика)
+    """
+
+    def __init__(self, sources: Iterable[Hashable], interval: float, callback: Callable[[float, "RunStats"], Any]):
+        self._sources = set(sources)
+        self._finished: set = set()
+        self._interval = interval
+        self._callback = callback
+        self._ticks: dict[int, tuple[RunStats, set]] = {}
+
+    def add(self, source: Hashable, elapsed: float, window: RunStats) -> None:
+        tick = max(1, round(elapsed / self._interval))
+        merged, reporters = self._ticks.setdefault(tick, (RunStats(), set()))
+        merged.merge(window)
+        reporters.add(source)
+
+    def finish(self, source: Hashable) -> None:
+        """Источник больше не пришлёт окон (его итог получен)."""
+        self._finished.add(source)
+
+    def flush(self, elapsed: float, force: bool = False) -> None:
+        """Отдать готовые тики по порядку; force — все оставшиеся (конец прогона)."""
+
+        for tick in sorted(self._ticks):
+            merged, reporters = self._ticks[tick]
+            complete = self._sources <= reporters | self._finished
+            if not (complete or force or elapsed > (tick + 1) * self._interval):
+                break
+            del self._ticks[tick]
+            if merged.count:
+                self._callback(min(elapsed, tick * self._interval), merged)
@@ -0,0 +1,82 @@
+"""
+Куда направлять нагрузку и как собирать клиента.
+
+TargetSpec — простые данные (pickle/JSON), поэтому клиента можно собрать
+заново в дочернем процессе или на другом узле.
+"""
+
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Literal, Optional
+
+import httpx
+
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.config import APIConfig
+from src.async_api_client.testing import MOCK_CONFIG, Latency, MockAPI, MockServerConfig
+
+_VALIDATE_MODES = {"off": False, "sample": "sample", "full": True}
+
+
+def config_from_url(base_url: str, **overrides: Any) -> APIConfig:
+    """APIConfig из полного URL ("http://127.0.0.1:8000/api")."""
+
+    url = httpx.URL(base_url)
+    if url.scheme not in ("http", "https") or not url.host:
+        raise ValueError(f"base_url must be an absolute http(s) URL, got {base_url!r}")
+    return APIConfig(
+        host=url.host,
+        protocol=url.scheme,
+        port=url.port,
+        prefix_path=url.path.strip("/"),
+        **overrides,
+    )
+
+
+@dataclass(frozen=True)
+class TargetSpec:
+    """
+    :param base_url: адрес API; None — in-process testing.MockAPI через ASGITransport
+    :param connections: размер пула соединений клиента
+    :param timeout: таймаут запроса, сек
+    :param validate: проверка тел ответов — "off" | "sample" | "full" (статус проверяется всегда)
+    :param mock_latency: задержка MockAPI в формате Latency.parse ("lognormal:0.02:0.5")
+    :param mock_error_rate: доля ответов-сбоев MockAPI
+    """
+
+    base_url: Optional[str] = None
+    connections: int = 100
+    timeout: float = 10.0
+    validate: Literal["off", "sample", "full"] = "sample"
+    mock_latency: str = "0"
+    mock_error_rate: float = 0.0
+
+    def __post_init__(self):
+        if self.validate not in _VALIDATE_MODES:
+            raise ValueError(f"validate must be one of {sorted(_VALIDATE_MODES)}, got {self.validate!r}")
+
+    @property
+    def label(self) -> str:
+        return self.base_url or "in-process MockAPI"
+
+    def client(self) -> AsyncAPIClient:
+        """Новый клиент (использовать как async context manager)."""
+
+        limits = {"max_connections": self.connections, "max_keepalive_connections": self.connections}
+        transport = None
+        if self.base_url is None:
+            config = replace(MOCK_CONFIG, timeout=self.timeout, **limits)
+            mock = MockServerConfig(latency=Latency.parse(self.mock_latency), error_rate=self.mock_error_rate)
+            transport = httpx.ASGITransport(app=MockAPI(mock))
+        else:
+            config = config_from_url(self.base_url, timeout=self.timeout, **limits)
+
+        return AsyncAPIClient(
+            config,
+            transport=transport,
+            validate_request=False,
+            validate_response=_VALIDATE_MODES[self.validate],
+            cleanup_on_close=False,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,31 @@
+"""
+Воркер распределённого прогона.
+
+    python -m src.load_runner.worker --connect tcp://coordinator:5557 [--weight 2]
+
+Подключается к координатору (python -m src.load_runner --bind ...), получает
+цель, сценарии и свою долю профиля, отрабатывает её и отправляет итог.
+"""
+
+import argparse
+from typing import Optional
+
+from utils.logger import configure_logging
+
+from .distributed import run_worker
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.load_runner.worker", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connect", required=True, help="coordinator address, e.g. tcp://10.0.0.5:5557")
+    parser.add_argument("--weight", type=float, default=1.0, help="share of the load relative to other workers")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    configure_logging(level=args.log_level, log_file="load_runner")
+    run_worker(args.connect, weight=args.weight)
+
+
+if __name__ == "__main__":
+    main()
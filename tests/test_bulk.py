@@ -0,0 +1,41 @@
+import allure
+import pytest
+
+from src.async_api_client.endpoints.bulk import run_bulk
+from src.async_api_client.exceptions import ResponseValidationError, StatusAssertionError
+from src.async_api_client.models.posts import Comment
+
+
+@allure.epic("async_api_client")
+@allure.feature("Bulk operations")
+class TestBulk:
+    @allure.title("get_many передаёт аргументы в get; ошибка статуса — исход элемента")
+    async def test_get_many_forwards_kwargs(self, mock_api_client):
+        result = await mock_api_client.posts.get_many([1, 2, 999], headers={"X-Scenario": "bulk"})
+
+        assert [item.ok for item in result] == [True, True, False]
+        assert [response.json()["id"] for response in result.values] == [1, 2]
+        assert isinstance(result.failed[0].error, StatusAssertionError)
+        assert result.values[0].request.headers["X-Scenario"] == "bulk"
+
+    @allure.title("get_many валидирует ответы, если это запрошено")
+    async def test_get_many_validates(self, mock_api_client):
+        result = await mock_api_client.posts.get_many([1], validate_response=True, response_model=Comment)
+
+        assert isinstance(result.failed[0].error, ResponseValidationError)
+
+    @allure.title("delete_many передаёт аргументы в delete")
+    async def test_delete_many_forwards_kwargs(self, mock_api_client):
+        result = await mock_api_client.posts.delete_many([1, 2], headers={"X-Scenario": "bulk"})
+
+        assert result.ok and len(result) == 2
+
+    @allure.title("Ошибка программы в операции не маскируется под ошибку элемента")
+    async def test_programming_errors_propagate(self):
+        async def operation(item):
+            if item == 2:
+                raise TypeError("bad call")
+            return item
+
+        with pytest.raises(TypeError, match="bad call"):
+            await run_bulk(operation, [1, 2, 3])
@@ -0,0 +1,96 @@
+import json
+
+import allure
+import httpx
+import pytest
+
+from src.async_api_client.cassette import CassetteTransport
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.config import APIConfig
+from src.async_api_client.exceptions import APITransportError
+from src.async_api_client.models.posts import PostCreate
+
+CONFIG = APIConfig(host="api.test")
+
+
+class CountingServer:
+    """Считает обращения — чтобы видеть, дошёл ли запрос до «сети»; в ответе есть секретное поле."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(
+            201 if request.method == "POST" else 200,
+            json={"path": request.url.path, "call": self.calls, "access_token": "secret-value"},
+        )
+
+
+async def run(transport: CassetteTransport) -> list[dict]:
+    async with AsyncAPIClient(CONFIG, transport=transport, validate_response=False) as client:
+        first = await client.posts.get(1)
+        second = await client.posts.get(1)
+        created = await client.posts.create(
+            PostCreate(title="t", body="b", userId=1), headers={"Authorization": "Bearer abc"},
+        )
+    return [r.json() for r in (first, second, created)]
+
+
+@allure.epic("async_api_client")
+@allure.feature("Cassette")
+class TestCassette:
+    @allure.title("Записанные ответы воспроизводятся без обращения к серверу, по порядку")
+    async def test_record_then_replay(self, tmp_path):
+        path = tmp_path / "posts.jsonl"
+        server = CountingServer()
+
+        recorded = await run(CassetteTransport(path, mode="record", transport=httpx.MockTransport(server)))
+        replayed = await run(CassetteTransport(path, mode="replay"))
+
+        assert server.calls == 3
+        assert [r["call"] for r in replayed] == [r["call"] for r in recorded] == [1, 2, 3]
+        assert (tmp_path / "posts.jsonl.idx.json").exists()
+
+    @allure.title("Секреты в заголовках и JSON-телах маскируются при записи")
+    async def test_secrets_are_masked(self, tmp_path):
+        path = tmp_path / "posts.jsonl"
+        await run(CassetteTransport(path, mode="record", transport=httpx.MockTransport(CountingServer())))
+
+        text = path.read_text(encoding="utf-8")
+        assert "Bearer abc" not in text
+        assert "secret-value" not in text
+        assert json.loads(text.splitlines()[-1])["request"]["headers"]["authorization"] == "***"
+
+    @allure.title("replay: незаписанный запрос — ошибка транспорта; new_episodes — дозапись")
+    async def test_miss_handling(self, tmp_path):
+        path = tmp_path / "posts.jsonl"
+        server = CountingServer()
+        await run(CassetteTransport(path, mode="record", transport=httpx.MockTransport(server)))
+
+        replay = CassetteTransport(path, mode="replay")
+        async with AsyncAPIClient(CONFIG, transport=replay, validate_response=False) as client:
+            with pytest.raises(APITransportError, match="No recorded episode"):
+                await client.posts.get(2)
+
+        transport = CassetteTransport(path, mode="new_episodes", transport=httpx.MockTransport(server))
+        async with AsyncAPIClient(CONFIG, transport=transport, validate_response=False) as client:
+            await client.posts.get(1)
+            await client.posts.get(2)
+        assert (transport.hits, transport.misses) == (1, 1)
+        assert server.calls == 4
+
+    @allure.title("Тело формы маскируется, тело запроса другого типа не записывается")
+    async def test_form_and_raw_request_bodies(self, tmp_path):
+        path = tmp_path / "login.jsonl"
+        transport = CassetteTransport(path, mode="record", transport=httpx.MockTransport(CountingServer()))
+        async with httpx.AsyncClient(base_url="https://api.test", transport=transport) as session:
+            await session.post("/login", data={"username": "admin", "password": "hunter2"})
+            await session.post("/upload", content=b"password=hunter2", headers={"Content-Type": "text/plain"})
+        await transport.aclose()
+
+        text = path.read_text(encoding="utf-8")
+        assert "hunter2" not in text
+        form, raw = (json.loads(line)["request"] for line in text.splitlines())
+        assert form["body"] == "username=admin&password=***"
+        assert raw["body"] == "" and raw["omitted_bytes"] == len(b"password=hunter2")
@@ -0,0 +1,29 @@
+import json
+
+import allure
+import pytest
+
+from benchmarks.overhead import LAYERS, format_results, run_case, with_layer_costs
+from src.async_api_client import http_client as http_client_module
+
+
+@pytest.mark.performance
+@allure.epic("async_api_client")
+@allure.feature("Performance")
+class TestClientOverhead:
+    @allure.title("Накладные расходы клиента по слоям относительно голого httpx")
+    async def test_layer_overhead(self):
+        original_allure = http_client_module.allure
+        results = [await run_case("get", 10, 1, 200, raw=True), await run_case("get", 10, 1, 200)]
+        for layer in LAYERS:
+            if layer != "redirects":
+                results.append(await run_case("get", 10, 1, 200, disabled=(layer,)))
+        results = with_layer_costs(results)
+
+        allure.attach(format_results(results), name="overhead", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(results, indent=2), name="overhead.json", attachment_type=allure.attachment_type.JSON)
+
+        by_config = {r["config"]: r for r in results}
+        assert all(r["requests"] == 200 for r in results)
+        assert by_config["raw"]["p50_us"] < by_config["full"]["p50_us"]
+        assert http_client_module.allure is original_allure
@@ -0,0 +1,69 @@
+import allure
+import httpx
+import pytest
+
+from src.async_api_client import codec as codec_module
+from src.async_api_client.codec import OrjsonCodec, StdlibJSONCodec, decode_response, get_codec
+from src.async_api_client.config import APIConfig
+
+requires_orjson = pytest.mark.skipif(codec_module.orjson is None, reason="orjson не установлен")
+
+PAYLOAD = {"id": 1, "title": "Привет", "tags": ["a", "b"], "nested": {"ok": True, "none": None, "ratio": 0.5}}
+
+
+@allure.epic("async_api_client")
+@allure.feature("JSON codec")
+class TestCodec:
+    @allure.title("По умолчанию — stdlib json, auto выбирает orjson при наличии")
+    @requires_orjson
+    def test_default_and_auto(self, monkeypatch):
+        assert APIConfig(host="api.test").json_codec == "json"
+        assert isinstance(get_codec(), StdlibJSONCodec)
+        assert isinstance(get_codec("auto"), OrjsonCodec)
+
+        monkeypatch.setattr(codec_module, "orjson", None)
+        assert isinstance(get_codec("auto"), StdlibJSONCodec)
+        with pytest.raises(ImportError, match="pip install orjson"):
+            get_codec("orjson")
+
+    @allure.title("Неизвестное имя кодека — ValueError")
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+            get_codec("yaml")
+
+    @allure.title("Кодеки сохраняют данные при dumps → loads")
+    @pytest.mark.parametrize("name", ["json", pytest.param("orjson", marks=requires_orjson)])
+    def test_round_trip(self, name):
+        codec = get_codec(name)
+        data = codec.dumps(PAYLOAD)
+
+        assert isinstance(data, bytes)
+        assert codec.loads(data) == PAYLOAD
+        assert codec.loads(data.decode("utf-8")) == PAYLOAD
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    @allure.title("orjson строже stdlib: большие целые и NaN")
+    @requires_orjson
+    def test_orjson_is_stricter(self):
+        body = b'{"big": 123456789012345678901234567890, "nan": NaN}'
+
+        assert get_codec("json").loads(body)["big"] == 123456789012345678901234567890
+        with pytest.raises(ValueError):
+            get_codec("orjson").loads(body)
+
+    @allure.title("decode_response разбирает тело один раз")
+    def test_decode_response_is_cached(self):
+        calls = []
+
+        class CountingCodec(StdlibJSONCodec):
+            def loads(self, data):
+                calls.append(data)
+                return super().loads(data)
+
+        response = httpx.Response(200, json=PAYLOAD)
+        codec = CountingCodec()
+
+        first = decode_response(response, codec)
+        assert decode_response(response, codec) is first
+        assert first == PAYLOAD and len(calls) == 1
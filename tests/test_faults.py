@@ -0,0 +1,82 @@
+import allure
+import httpx
+import pytest
+
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.exceptions import APITimeoutError, APITransportError
+from src.async_api_client.testing import (
+    MOCK_CONFIG,
+    ErrorFault,
+    FaultInjectionTransport,
+    FaultRule,
+    MockAPI,
+    ResetFault,
+    TimeoutFault,
+    TruncateFault,
+    add_session_fault_counts,
+    session_fault_counts,
+)
+from src.async_api_client.testing import faults as faults_module
+
+
+def make_client(*rules: FaultRule, seed: int = 0) -> tuple[AsyncAPIClient, FaultInjectionTransport]:
+    transport = FaultInjectionTransport(rules, transport=httpx.ASGITransport(app=MockAPI()), seed=seed)
+    client = AsyncAPIClient(MOCK_CONFIG, transport=transport, validate_response=False)
+    return client, transport
+
+
+@allure.epic("async_api_client")
+@allure.feature("Fault injection")
+class TestFaultInjection:
+    @allure.title("429 с Retry-After — только для путей, подходящих под правило")
+    async def test_error_fault_matches_path(self):
+        client, transport = make_client(FaultRule(ErrorFault(429, retry_after=3), path="/posts/1"))
+        async with client:
+            limited = await client.posts.get(1, expected_status=429)
+            await client.posts.get(2)
+
+        assert limited.headers["retry-after"] == "3"
+        assert transport.stats.as_dict() == {"requests": 2, "error_429": 1}
+
+    @allure.title("Сбои транспорта превращаются в исключения клиента")
+    @pytest.mark.parametrize("fault, error", [
+        (TimeoutFault(), APITimeoutError),
+        (ResetFault(), APITransportError),
+    ])
+    async def test_transport_faults(self, fault, error):
+        client, _ = make_client(FaultRule(fault))
+        async with client:
+            with pytest.raises(error):
+                await client.posts.get(1)
+
+    @allure.title("Обрезанное тело не разбирается как JSON")
+    async def test_truncated_body(self):
+        client, _ = make_client(FaultRule(TruncateFault(keep=0.5)))
+        async with client:
+            response = await client.posts.get(1)
+        with pytest.raises(ValueError):
+            response.json()
+
+    @allure.title("Один seed — одна и та же последовательность сбоев")
+    async def test_seeded_runs_are_reproducible(self):
+        async def run(seed: int) -> list[int]:
+            client, _ = make_client(FaultRule(ErrorFault(503), probability=0.3), seed=seed)
+            async with client:
+                return [
+                    (await client.posts.get(i % 10 + 1, expected_status=[200, 503])).status_code
+                    for i in range(40)
+                ]
+
+        first, second = await run(7), await run(7)
+        assert first == second
+        assert 0 < first.count(503) < 40
+
+    @allure.title("Счётчики сбоев воркеров складываются в счётчики процесса-контроллера")
+    def test_worker_counts_are_merged(self, monkeypatch):
+        monkeypatch.setattr(faults_module, "_SESSION_COUNTS", faults_module.Counter({"reset": 1}))
+
+        add_session_fault_counts({"reset": 2, "error_503": 5})
+        add_session_fault_counts({})
+
+        assert session_fault_counts() == {"reset": 3, "error_503": 5}
+
@@ -0,0 +1,77 @@
+import dataclasses
+import json
+
+import allure
+import httpx
+import pytest
+
+from src.async_api_client.asserts import get_validation_sample
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.config import APIConfig, ValidationSampling
+from src.async_api_client.exceptions import ResponseValidationError
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.models.posts import Post
+from src.async_api_client.results import APIResult
+
+CONFIG = APIConfig(host="api.test")
+
+
+def posts_body(count: int, broken: tuple[int, ...] = ()) -> bytes:
+    return json.dumps([
+        {"id": i, "userId": "broken" if i in broken else 1, "title": "t", "body": "b"}
+        for i in range(count)
+    ]).encode()
+
+
+def make_client(body: bytes, config: APIConfig = CONFIG) -> HttpxAsyncClient:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+    )
+    session = httpx.AsyncClient(base_url=config.base_url, transport=transport)
+    return HttpxAsyncClient(config, session=session)
+
+
+@allure.epic("async_api_client")
+@allure.feature("Offload")
+class TestOffload:
+    @allure.title("Большой ответ валидируется в пуле потоков, выборка доходит до теста")
+    async def test_thread_offload_keeps_sample_report(self):
+        config = dataclasses.replace(
+            CONFIG,
+            offload_threshold=1,
+            validation_sampling=ValidationSampling(head=2, tail=2, random=2),
+        )
+        async with make_client(posts_body(50), config) as client:
+            response = await client.get("/posts", response_model=Post, validate_response="sample")
+
+        assert get_validation_sample(response).checked == 6
+
+    @allure.title("Ошибка валидации из пула поднимается в вызывающем коде")
+    async def test_thread_offload_raises_validation_error(self):
+        config = dataclasses.replace(CONFIG, offload_threshold=1)
+        async with make_client(posts_body(10, broken=(3,)), config) as client:
+            with pytest.raises(ResponseValidationError):
+                await client.get("/posts", response_model=Post)
+
+
+@allure.epic("async_api_client")
+@allure.feature("Typed results")
+class TestTypedResults:
+    @allure.title("typed_results=True: endpoint отдаёт уже провалидированные модели")
+    async def test_list_returns_validated_models(self):
+        http = make_client(posts_body(3))
+        async with AsyncAPIClient(CONFIG, http_client=http, typed_results=True) as client:
+            result = await client.posts.list()
+
+        assert isinstance(result, APIResult)
+        assert result.status_code == 200
+        assert [post.id for post in result.data] == [0, 1, 2]
+        # Модель взята из кэша валидатора, а не построена повторно
+        assert result.data is result.response.extensions["validated_model"][1]
+
+    @allure.title("Без флага endpoint возвращает сырой httpx.Response")
+    async def test_raw_response_by_default(self):
+        async with AsyncAPIClient(CONFIG, http_client=make_client(posts_body(1))) as client:
+            response = await client.posts.list()
+
+        assert isinstance(response, httpx.Response)
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.async_api_client.client import AsyncAPIClient, _LazyEndpoint, _resolve_endpoint
+from src.async_api_client.endpoints.base import BaseEndpoint
+from src.async_api_client.endpoints.posts import PostsEndpoint
+from src.async_api_client.testing import MOCK_CONFIG
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_CHECK = """
+import sys
+
+import src.async_api_client as package
+
+def endpoints_loaded():
+    return sorted(name for name in sys.modules if name.startswith("src.async_api_client.endpoints"))
+
+assert endpoints_loaded() == [], endpoints_loaded()
+client_cls = package.AsyncAPIClient
+assert endpoints_loaded() == [], endpoints_loaded()
+client = client_cls(package.APIConfig(host="api.test"))
+assert endpoints_loaded() == [], endpoints_loaded()
+client.posts
+assert "src.async_api_client.endpoints.posts" in endpoints_loaded(), endpoints_loaded()
+"""
+
+
+class CommentsEndpoint(BaseEndpoint):
+    PATH = "/comments"
+
+
+class ReportingClient(AsyncAPIClient):
+    ENDPOINTS = {
+        "articles": ".endpoints.posts:PostsEndpoint",
+        "comments": CommentsEndpoint,
+        "broken": "tests.test_lazy_endpoints",
+    }
+
+
+@allure.epic("async_api_client")
+@allure.feature("Lazy endpoints")
+class TestLazyEndpoints:
+    @allure.title("Строковая спецификация импортируется, относительный модуль — от пакета клиента")
+    def test_string_spec(self):
+        assert _resolve_endpoint(".endpoints.posts:PostsEndpoint") is PostsEndpoint
+        assert _resolve_endpoint("src.async_api_client.endpoints.posts:PostsEndpoint") is PostsEndpoint
+        assert _resolve_endpoint(CommentsEndpoint) is CommentsEndpoint
+
+    @allure.title("Спецификация без ':Class' — ValueError")
+    def test_malformed_spec(self):
+        with pytest.raises(ValueError, match="module:Class"):
+            _resolve_endpoint(".endpoints.posts")
+
+        client = ReportingClient(MOCK_CONFIG)
+        with pytest.raises(ValueError, match="'tests.test_lazy_endpoints'"):
+            client.broken
+
+    @allure.title("Подкласс с ENDPOINTS получает свои ленивые атрибуты, базовый класс не меняется")
+    async def test_subclass_endpoints(self):
+        assert isinstance(ReportingClient.__dict__["articles"], _LazyEndpoint)
+        assert not hasattr(AsyncAPIClient, "articles") and not hasattr(AsyncAPIClient, "comments")
+
+        async with ReportingClient(MOCK_CONFIG, cleanup_on_close=False) as client:
+            articles = client.articles
+            assert isinstance(articles, PostsEndpoint) and client.articles is articles
+            assert isinstance(client.comments, CommentsEndpoint)
+            assert isinstance(client.posts, PostsEndpoint)
+            assert client.posts is not articles
+
+    @allure.title("import src.async_api_client не импортирует endpoint'ы до первого обращения")
+    def test_import_does_not_load_endpoints(self):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CHECK], cwd=ROOT, capture_output=True, text=True, timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,139 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+
+from src.async_api_client.metrics import LatencyHistogram
+from src.load_runner import Coordinator, LoadProfile, LoadRunner, MultiProcessRunner, TargetSpec
+from src.load_runner.distributed import split_profile
+from src.load_runner.examples import POSTS_SCENARIOS, read_post
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@allure.epic("load_runner")
+@allure.feature("Load generator")
+class TestLoadRunner:
+    @allure.title("Гистограмма: перцентили с погрешностью < 1%, merge и сериализация без потерь")
+    def test_histogram_accuracy_and_merge(self):
+        rng = random.Random(1)
+        values = sorted(rng.lognormvariate(-4, 1) for _ in range(20_000))
+        halves = LatencyHistogram(), LatencyHistogram()
+        for i, value in enumerate(values):
+            halves[i % 2].record(value)
+
+        merged = LatencyHistogram.from_dict(LatencyHistogram.merged(halves).to_dict())
+
+        assert merged.count == len(values)
+        for q in (50, 95, 99):
+            exact = values[int(len(values) * q / 100) - 1]
+            assert abs(merged.percentile(q) / exact - 1) < 0.01
+
+    @allure.title("Профиль ramp-up/steady/ramp-down даёт ожидаемое число прибытий по секундам")
+    def test_profile_arrivals(self):
+        profile = LoadProfile.standard(rate=100, ramp_up=2, steady=2, ramp_down=2, arrivals="constant")
+        per_second = [0] * 6
+        for t in profile.arrival_times(random.Random(0)):
+            per_second[int(t)] += 1
+
+        assert profile.expected_requests == sum(per_second) == 400
+        assert per_second == [25, 75, 100, 100, 75, 25]
+
+    @allure.title("Доли воркеров со сдвигом фазы вместе дают равномерный поток исходного профиля")
+    def test_scaled_shares_interleave(self):
+        profile = LoadProfile.standard(rate=100, steady=1, arrivals="constant")
+        workers = 4
+        shares = [profile.scaled(1 / workers, phase=index / workers) for index in range(workers)]
+        times = sorted(t for share in shares for t in share.arrival_times(random.Random(0)))
+
+        assert len(times) == 100
+        assert all(abs(t - k / 100) < 1e-9 for k, t in enumerate(times))
+        assert LoadProfile.from_dict(shares[1].to_dict()).phase == 0.25
+
+    @allure.title("Доли узлов ZeroMQ тоже сдвинуты по фазе: равные веса дают равномерный поток")
+    def test_distributed_shares_interleave(self):
+        profile = LoadProfile.standard(rate=90, steady=1, arrivals="constant")
+        shares = split_profile(profile, [1.0, 1.0, 1.0])
+        times = sorted(t for share in shares for t in share.arrival_times(random.Random(0)))
+
+        assert len(times) == 90
+        assert all(abs(t - k / 90) < 1e-9 for k, t in enumerate(times))
+        assert [share.phase for share in split_profile(profile, [1.0, 2.0, 1.0])] == [0.0, 0.25, 0.75]
+
+    @allure.title("Открытая модель: медленные ответы не снижают подаваемую нагрузку")
+    async def test_open_model_keeps_offered_rate(self):
+        target = TargetSpec(mock_latency="0.2")
+        runner = LoadRunner(target.client, [read_post], LoadProfile.standard(rate=100, steady=0.5, arrivals="constant"))
+
+        report = await runner.run()
+
+        stats = report.stats.scenarios["read_post"]
+        assert stats.count == 50 and stats.ok == 50
+        assert stats.response_time.percentile(50) >= 0.2
+        assert report.duration < 1.0
+
+    @allure.title("Ошибки проверок транспорта попадают в отчёт по классу исключения")
+    async def test_errors_are_classified(self):
+        target = TargetSpec(mock_error_rate=1.0)
+        runner = LoadRunner(target.client, POSTS_SCENARIOS, LoadProfile.standard(rate=200, steady=0.2))
+
+        summary = (await runner.run()).summary()
+
+        assert summary["total"]["ok"] == 0
+        assert summary["total"]["errors"] == {"StatusAssertionError": summary["total"]["requests"]}
+
+    @allure.title("Несколько процессов: нагрузка делится поровну, статистика воркеров складывается")
+    def test_multiprocess_merges_worker_stats(self):
+        windows = []
+        runner = MultiProcessRunner(
+            TargetSpec(validate="off"),
+            "src.load_runner.examples:POSTS_SCENARIOS",
+            LoadProfile.standard(rate=200, steady=1.5, arrivals="constant"),
+            workers=2,
+            on_interval=lambda elapsed, window: windows.append(window.count),
+        )
+
+        report = runner.run()
+
+        workers = report.meta["workers"]
+        assert report.stats.count == sum(w["requests"] for w in workers) == sum(windows) == 300
+        assert [w["requests"] for w in workers] == [150, 150]
+        assert all(w["cpu_seconds"] > 0 for w in workers)
+        assert report.stats.total.response_time.count == 300
+
+    @allure.title("ZeroMQ: координатор делит профиль по весам воркеров и собирает живую и итоговую статистику")
+    def test_distributed_coordinator(self):
+        windows = []
+        coordinator = Coordinator(
+            TargetSpec(validate="off"),
+            "src.load_runner.examples:POSTS_SCENARIOS",
+            LoadProfile.standard(rate=300, steady=1, arrivals="constant"),
+            expected_workers=2,
+            bind="tcp://127.0.0.1:0",
+            on_interval=lambda elapsed, window: windows.append(window.count),
+            join_timeout=60,
+        )
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "src.load_runner.worker", "--connect", coordinator.endpoint, "--weight", weight],
+                env={**os.environ, "PYTHONPATH": str(ROOT)},
+            )
+            for weight in ("1", "2")
+        ]
+        try:
+            report = coordinator.run()
+        finally:
+            for worker in workers:
+                try:
+                    worker.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    worker.kill()
+                    worker.wait()
+
+        nodes = report.meta["nodes"]
+        assert report.stats.count == sum(windows) == 300
+        assert sorted(node["requests"] for node in nodes) == [100, 200]
+        assert all(worker.returncode == 0 for worker in workers)
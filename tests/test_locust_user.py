@@ -0,0 +1,44 @@
+import csv
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+
+from src.async_api_client.testing import LocalMockServer, MockAPI, MockServerConfig
+
+ROOT = Path(__file__).resolve().parents[1]
+LOCUSTFILE = ROOT / "src" / "load_runner" / "locustfile.py"
+
+
+@allure.epic("load_runner")
+@allure.feature("Locust adapter")
+class TestLocustUser:
+    @allure.title("Locust: запросы в статистике по шаблонам путей, ошибки и валидация — отдельно")
+    def test_headless_run_reports_templated_requests(self, tmp_path):
+        # Locust патчит stdlib при импорте — запускаем его отдельным процессом
+        with LocalMockServer(MockAPI(MockServerConfig(error_rate=0.2, seed=1))) as server:
+            run = subprocess.run(
+                [
+                    sys.executable, "-m", "locust", "-f", str(LOCUSTFILE), "--host", server.url,
+                    "--headless", "-u", "10", "-r", "10", "-t", "3s", "--csv", str(tmp_path / "run"),
+                    "--only-summary", "--loglevel", "WARNING",
+                ],
+                cwd=tmp_path,
+                env={**os.environ, "PYTHONPATH": str(ROOT)},
+                timeout=60,
+                capture_output=True,
+                text=True,
+            )
+
+        with open(tmp_path / "run_stats.csv", encoding="utf-8") as f:
+            rows = {(row["Type"], row["Name"]): row for row in csv.DictReader(f)}
+
+        assert ("GET", "/posts/{id}") in rows
+        assert not any(name.startswith("/posts/1") for _, name in rows)
+        assert int(rows[("GET", "/posts/{id}")]["Failure Count"]) > 0
+        # Валидация — отдельное событие, в статистику запросов не входит
+        assert {request_type for request_type, _ in rows} <= {"GET", "POST", "PUT", "PATCH", "DELETE", ""}
+        validation = next(line.split() for line in run.stdout.splitlines() if line.startswith("/posts/{id} "))
+        assert int(validation[1]) > 0 and int(validation[2]) == 0
@@ -0,0 +1,136 @@
+import logging
+import os
+import queue
+import re
+from datetime import datetime
+
+import allure
+import pytest
+
+from utils import logger as logger_module
+from utils.log_merge import find_logs, merge_logs
+from utils.logger import MANAGED_LOGGERS, BoundedQueueHandler, configure_logging, shutdown_logging
+
+
+@pytest.fixture
+def isolated_logging():
+    """Вернуть настройку managed-логгеров сессии после теста."""
+
+    if logger_module._listener is not None:
+        pytest.skip("логи сессии уже идут через очередь (--log-queue)")
+    saved = {name: (list(logging.getLogger(name).handlers), logging.getLogger(name).level) for name in MANAGED_LOGGERS}
+    yield
+    shutdown_logging()
+    for name, (handlers, level) in saved.items():
+        target = logging.getLogger(name)
+        for handler in list(target.handlers):
+            target.removeHandler(handler)
+            if handler not in handlers:
+                handler.close()
+        for handler in handlers:
+            target.addHandler(handler)
+        target.setLevel(level)
+    logger_module._configured = True
+
+
+@allure.epic("utils")
+@allure.feature("Logging")
+class TestQueueLogging:
+    @allure.title("Записи пишутся фоновым потоком и дописываются при shutdown_logging")
+    def test_queue_mode_flushes_on_shutdown(self, isolated_logging, tmp_path):
+        configure_logging(
+            level="INFO", log_file="queued", logs_dir=tmp_path, use_console=False, force=True, queue_mode="block",
+            per_worker=False,
+        )
+        log = logging.getLogger("async_api_client")
+        assert [type(h) for h in log.handlers] == [BoundedQueueHandler]
+
+        for index in range(500):
+            log.info("record %d %s", index, {"id": index})
+        shutdown_logging()
+
+        lines = (tmp_path / "queued.log").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 500
+        assert lines[-1].endswith("async_api_client: record 499 {'id': 499}")
+        # После остановки логгеры пишут напрямую в те же обработчики
+        assert [type(h).__name__ for h in log.handlers] == ["TimedRotatingFileHandler"]
+
+    @allure.title("Политика drop отбрасывает записи переполненной очереди и считает их")
+    def test_drop_policy_counts(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), block=False)
+        for index in range(5):
+            handler.handle(logging.makeLogRecord({"msg": "record %d", "args": (index,)}))
+
+        assert handler.dropped == 3
+        assert handler.queue.get_nowait().msg == "record 0"
+
+
+@allure.epic("utils")
+@allure.feature("Logging")
+class TestWorkerLogs:
+    @allure.title("Воркер xdist пишет в свой файл")
+    def test_worker_file(self, isolated_logging, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        configure_logging(level="INFO", logs_dir=tmp_path, use_console=False, force=True)
+        logging.getLogger("tests").info("from worker")
+        shutdown_logging()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["tests_cycle-gw3.log"]
+        line = (tmp_path / "tests_cycle-gw3.log").read_text(encoding="utf-8")
+        # Миллисекунды в метке времени — для порядка при слиянии
+        assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3} \[INFO\] tests: from worker\n", line)
+
+    @allure.title("Логи воркеров сливаются в одну хронологию, traceback остаётся с записью")
+    def test_merge_timeline(self, tmp_path):
+        gw0 = tmp_path / "tests_cycle-gw0.log"
+        gw1 = tmp_path / "tests_cycle-gw1.log"
+        gw0.write_text(
+            "2026-10-18 10:00:00.100 [INFO] tests: a\n"
+            "2026-10-18 10:00:00.300 [ERROR] tests: c\n"
+            "Traceback (most recent call last):\n"
+            "ValueError: boom\n"
+            "2026-10-18 10:00:01.000 [INFO] tests: e\n",
+            encoding="utf-8",
+        )
+        gw1.write_text(
+            "2026-10-18 10:00:00.200 [INFO] tests: b\n"
+            "2026-10-18 10:00:00.400 [INFO] tests: d",
+            encoding="utf-8",
+        )
+        output = tmp_path / "merged.log"
+        with output.open("wb") as fh:
+            assert merge_logs([gw0, gw1], fh) == 5
+
+        assert output.read_text(encoding="utf-8").splitlines() == [
+            "2026-10-18 10:00:00.100 [gw0] [INFO] tests: a",
+            "2026-10-18 10:00:00.200 [gw1] [INFO] tests: b",
+            "2026-10-18 10:00:00.300 [gw0] [ERROR] tests: c",
+            "Traceback (most recent call last):",
+            "ValueError: boom",
+            "2026-10-18 10:00:00.400 [gw1] [INFO] tests: d",
+            "2026-10-18 10:00:01.000 [gw0] [INFO] tests: e",
+        ]
+
+    @allure.title("Слияние ограничено прогоном: старые записи, ротации и файлы прошлых воркеров не попадают")
+    def test_merge_is_scoped_to_run(self, tmp_path):
+        started = datetime(2026, 10, 18, 10, 0, 0).timestamp()
+        current = tmp_path / "tests_cycle-gw0.log"
+        current.write_text(
+            "2026-10-18 09:59:59.900 [INFO] tests: previous run\n"
+            "2026-10-18 10:00:00.100 [INFO] tests: this run\n",
+            encoding="utf-8",
+        )
+        os.utime(current, (started + 60, started + 60))
+        for stale in ("tests_cycle-gw5.log", "tests_cycle-gw0.log.2026-10-17"):
+            (tmp_path / stale).write_text("2026-10-17 12:00:00.000 [INFO] tests: old\n", encoding="utf-8")
+            os.utime(tmp_path / stale, (started - 3600, started - 3600))
+        (tmp_path / "tests_cycle-merged.log").write_text("", encoding="utf-8")
+
+        paths = find_logs(tmp_path, "tests_cycle", since=started)
+        assert paths == [current]
+
+        output = tmp_path / "merged.log"
+        with output.open("wb") as fh:
+            assert merge_logs(paths, fh, since=started) == 1
+        assert output.read_text(encoding="utf-8") == "2026-10-18 10:00:00.100 [gw0] [INFO] tests: this run\n"
+
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from pathlib import Path
+
+import allure
+
+from src.async_api_client.testing import LoopLagMonitor, format_lag_report
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INNER_TEST = """
+import asyncio
+import time
+
+
+def blocking_work():
+    time.sleep(0.15)
+
+
+async def test_blocks_loop():
+    await asyncio.sleep(0.05)
+    blocking_work()
+    await asyncio.sleep(0.05)
+
+
+async def test_cooperative():
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+
+
+def test_sync_between():
+    time.sleep(0.2)
+"""
+
+
+@allure.epic("async_api_client")
+@allure.feature("Event loop lag")
+class TestLoopLag:
+    @allure.title("Блокировка цикла приписывается метке, стек указывает на блокирующий вызов")
+    async def test_monitor_captures_block(self):
+        async with LoopLagMonitor(interval=0.005, threshold=0.04, capture_stacks=True) as monitor:
+            monitor.label = "blocking"
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)
+            await asyncio.sleep(0.02)
+            monitor.label = "cooperative"
+            await asyncio.sleep(0.1)
+
+        assert list(monitor.by_label) == ["blocking"]
+        block = monitor.blocks[0]
+        assert 0.08 <= block.seconds < 0.2
+        assert "time.sleep(0.1)" in block.stack
+        assert monitor.lag.count > 10
+        assert "blocking" in format_lag_report(monitor)
+
+    @allure.title("Плагин --loop-lag-debug выводит тесты, блокировавшие цикл, и стек")
+    def test_plugin_reports_offenders(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        pytester.makeini(
+            "[pytest]\nasyncio_mode = auto\n"
+            "asyncio_default_fixture_loop_scope = session\nasyncio_default_test_loop_scope = session\n"
+        )
+        pytester.makepyfile(test_inner=INNER_TEST)
+
+        result = pytester.runpytest_subprocess("-p", "utils.loop_lag", "-p", "no:cacheprovider", "--loop-lag-debug")
+        result.assert_outcomes(passed=3)
+        output = result.stdout.str()
+        summary = output[output.index("event loop lag"):]
+        assert "blocks >= 50ms: 1" in summary
+        assert "test_inner.py::test_blocks_loop" in summary
+        assert "blocking_work" in summary
+        # Цикл, остановленный между тестами и на время синхронного теста, — не блокировка
+        assert "test_sync_between" not in summary and "test_cooperative" not in summary
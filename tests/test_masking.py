@@ -0,0 +1,29 @@
+import json
+
+import allure
+
+from src.async_api_client.helpers.functions import mask_body, mask_json_bytes
+
+
+@allure.epic("async_api_client")
+@allure.feature("Masking")
+class TestMaskJsonBytes:
+    @allure.title("Вложенные объекты и массивы чувствительных ключей маскируются целиком")
+    def test_nested_values(self):
+        payload = {
+            "token": {"value": "SECRET", "inner": [{"password": "x"}]},
+            "password": ["p1", "p2"],
+            "title": "ok",
+            "meta": {"secret": "s", "tags": ["a", "b]"]},
+        }
+        masked = mask_json_bytes(json.dumps(payload).encode())
+
+        assert "SECRET" not in masked and "p1" not in masked and "p2" not in masked
+        assert json.loads(masked) == mask_body(payload)
+
+    @allure.title("Обрезанное тело не раскрывает начало вложенного секрета")
+    def test_truncated_nested_value(self):
+        masked = mask_json_bytes(b'{"title": "ok", "token": {"value": "SECRET", "n": 1}}', limit=36)
+
+        assert "SECRET"[:3] not in masked
+        assert masked.startswith('{"title": "ok", "token": "***"')
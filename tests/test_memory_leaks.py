@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import allure
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INNER_TEST = """
+_retained = []
+
+
+def test_warmup():
+    import json  # noqa: F401
+
+
+def test_leaks():
+    _retained.extend(bytearray(1024) for _ in range(2048))
+
+
+def test_clean():
+    garbage = [bytearray(1024) for _ in range(2048)]
+    del garbage
+"""
+
+
+@allure.epic("utils")
+@allure.feature("Memory growth")
+class TestMemoryLeaks:
+    @allure.title("Тест, удерживающий память, помечается, места выделения сохраняются")
+    def test_leaking_test_is_flagged(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        pytester.makepyfile(test_inner=INNER_TEST)
+
+        result = pytester.runpytest_subprocess(
+            "-p", "utils.memory_leaks", "-p", "no:cacheprovider",
+            "--mem-track", "--mem-threshold-kb", "1024", "--mem-dump",
+        )
+        result.assert_outcomes(passed=3, warnings=1)
+        output = result.stdout.str()
+        summary = output[output.index("memory growth"):]
+        assert "1 of 3 tests grew by >= 1024 KiB" in summary
+        assert "test_inner.py::test_leaks  LEAK?" in summary
+        assert "test_clean  LEAK?" not in summary
+        assert "growth by module: test_inner" in summary
+
+        dump = (pytester.path / ".memory" / "test_inner.py_test_leaks.txt").read_text()
+        assert "test_inner.py" in dump and "_retained.extend" in dump
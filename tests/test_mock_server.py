@@ -0,0 +1,58 @@
+import allure
+import pytest
+
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.exceptions import StatusAssertionError
+from src.async_api_client.models.posts import PostCreate
+from src.async_api_client.testing import Latency, LocalMockServer, MockAPI, MockServerConfig
+
+
+@allure.epic("async_api_client")
+@allure.feature("Mock server")
+class TestMockServer:
+    @allure.title("Сценарии JSONPlaceholder проходят на mock-сервере")
+    async def test_jsonplaceholder_flows(self, mock_api_client, mock_api):
+        posts = await mock_api_client.posts.list()
+        by_user = await mock_api_client.posts.list(user_id=5)
+        await mock_api_client.posts.get(1)
+        await mock_api_client.posts.get(9999, expected_status=404)
+        created = await mock_api_client.posts.create(PostCreate(title="t", body="b", userId=1))
+        comments = await mock_api_client.posts.comments(1)
+        paged = [post.id async for post in mock_api_client.posts.iterate(page_size=30)]
+
+        assert len(posts.json()) == 100
+        assert {p["userId"] for p in by_user.json()} == {5} and len(by_user.json()) == 10
+        assert created.json()["id"] == 101
+        assert paged == list(range(1, 101))
+        assert [c["postId"] for c in comments.json()] == [1] * 5
+        assert mock_api.requests["GET /posts/1"] == 1
+
+    @allure.title("Доля ошибок и задержка задаются маркером mock_api")
+    @pytest.mark.mock_api(error_rate=1.0, error_status=503, latency=Latency("fixed", 0.01))
+    async def test_error_rate_from_marker(self, mock_api_client):
+        with pytest.raises(StatusAssertionError) as exc_info:
+            await mock_api_client.posts.get(1)
+        assert exc_info.value.actual == 503
+
+    @allure.title("Тот же mock поднимается на localhost")
+    async def test_localhost_server(self):
+        with LocalMockServer(MockAPI(MockServerConfig(body_size=2048))) as server:
+            async with AsyncAPIClient(server.config()) as client:
+                response = await client.posts.get(3)
+        assert len(response.json()["body"]) == 2048
+
+    @allure.title("Нечисловые query-параметры — 400, страница и размер не меньше 1")
+    def test_query_parameters_are_validated(self, mock_api):
+        def get(path: str, **query: str):
+            response, _ = mock_api.handle("GET", path, {name: [value] for name, value in query.items()}, b"")
+            return response
+
+        assert get("/posts", userId="x").status == 400
+        assert get("/posts", _page="first").status == 400
+        assert get("/posts", _limit="1e3").status == 400
+        assert get("/comments", postId="abc").status == 400
+
+        first = get("/posts", _page="1", _limit="5").body
+        assert get("/posts", _page="0", _limit="5").body == first
+        assert get("/posts", _page="-3", _limit="5").body == first
+        assert [post["id"] for post in get("/posts", _page="1", _limit="0").body] == [1]
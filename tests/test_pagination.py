@@ -0,0 +1,122 @@
+from contextlib import aclosing
+
+import allure
+import httpx
+import pytest
+
+from src.async_api_client.client import AsyncAPIClient
+from src.async_api_client.config import APIConfig
+from src.async_api_client.exceptions import ResponseValidationError
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.models.posts import Post
+from src.async_api_client.pagination import CursorPagination, LinkHeaderPagination, OffsetPagination
+
+CONFIG = APIConfig(host="api.test")
+POSTS = [{"id": i, "userId": 1, "title": "t", "body": "b"} for i in range(1, 96)]
+
+
+class PostsServer:
+    """JSONPlaceholder-подобный /posts с _page/_limit, cursor и Link-заголовком; считает запросы."""
+
+    def __init__(self):
+        self.requests: list[httpx.URL] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url)
+        params = request.url.params
+
+        if "cursor" in params or request.url.path == "/feed":
+            start = int(params.get("cursor", 0))
+            chunk = POSTS[start:start + 30]
+            next_cursor = start + 30 if start + 30 < len(POSTS) else None
+            return httpx.Response(200, json={"items": chunk, "next_cursor": next_cursor})
+
+        page, limit = int(params.get("_page", 1)), int(params.get("_limit", 10))
+        chunk = POSTS[(page - 1) * limit:page * limit]
+        headers = {"X-Total-Count": str(len(POSTS))}
+        if page * limit < len(POSTS):
+            headers["Link"] = f'<https://api.test/posts?_page={page + 1}&_limit={limit}>; rel="next"'
+        return httpx.Response(200, json=chunk, headers=headers)
+
+
+def make_client(server: PostsServer) -> AsyncAPIClient:
+    session = httpx.AsyncClient(base_url=CONFIG.base_url, transport=httpx.MockTransport(server))
+    return AsyncAPIClient(CONFIG, http_client=HttpxAsyncClient(CONFIG, session=session))
+
+
+@allure.epic("async_api_client")
+@allure.feature("Pagination")
+class TestPagination:
+    @allure.title("Offset-пагинация с prefetch отдаёт все элементы по порядку без лишних запросов")
+    async def test_offset_prefetch_collects_everything(self):
+        server = PostsServer()
+        async with make_client(server) as client:
+            posts = [post async for post in client.posts.iterate(page_size=10, prefetch=3)]
+
+        assert [post.id for post in posts] == list(range(1, 96))
+        assert all(isinstance(post, Post) for post in posts)
+        # 95 элементов по 10 — ровно 10 страниц, X-Total-Count не даёт запросить 11-ю
+        assert len(server.requests) == 10
+
+    @allure.title("break останавливает обход и не порождает новых запросов")
+    async def test_break_stops_requests(self):
+        server = PostsServer()
+        async with make_client(server) as client:
+            async with aclosing(client.posts.iterate(page_size=10, prefetch=2)) as posts:
+                async for post in posts:
+                    if post.id == 15:
+                        break
+            requested = len(server.requests)
+
+        # Страницы 1-2 нужны, ещё максимум prefetch страниц были в полёте
+        assert requested <= 2 + 2
+
+    @allure.title("Курсорная пагинация идёт по next_cursor из тела")
+    async def test_cursor_pagination(self):
+        server = PostsServer()
+        async with make_client(server) as client:
+            strategy = CursorPagination(items_field="items", next_cursor_field="next_cursor")
+            ids = [item["id"] async for item in client.posts.paginate("/feed", strategy)]
+
+        assert ids == list(range(1, 96))
+        assert len(server.requests) == 4
+
+    @allure.title("Link-пагинация идёт по rel=next")
+    async def test_link_header_pagination(self):
+        server = PostsServer()
+        async with make_client(server) as client:
+            items = [
+                item async for item in client.posts.paginate(
+                    "/posts", LinkHeaderPagination(), params={"_limit": 25}, item_model=Post,
+                )
+            ]
+
+        assert len(items) == 95
+        assert len(server.requests) == 4
+
+    @allure.title("max_pages ограничивает число запросов")
+    async def test_max_pages(self):
+        server = PostsServer()
+        async with make_client(server) as client:
+            strategy = OffsetPagination(limit=10, page_param="_page", limit_param="_limit")
+            items = [item async for item in client.posts.paginate("/posts", strategy, prefetch=5, max_pages=3)]
+
+        assert len(items) == 30
+        assert len(server.requests) == 3
+
+    @allure.title("Несоответствие элемента модели — ResponseValidationError с номером и URL страницы")
+    async def test_item_validation_error(self):
+        server = PostsServer()
+        POSTS[24]["id"] = "not-a-number"
+        try:
+            async with make_client(server) as client:
+                received = []
+                with pytest.raises(ResponseValidationError, match=r"Page 3 of /posts \(.*_page=3") as exc_info:
+                    async for post in client.posts.iterate(page_size=10):
+                        received.append(post)
+        finally:
+            POSTS[24]["id"] = 25
+
+        assert len(received) == 20
+        assert "Post" in str(exc_info.value)
+
@@ -0,0 +1,118 @@
+import json
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.async_api_client.metrics import RequestMetrics
+from utils.perf_baseline import Baseline
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INNER_TEST = """
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+
+
+async def fetch_posts():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 1}))
+    async with httpx.AsyncClient(base_url="https://api.test", transport=transport) as session:
+        client = HttpxAsyncClient(APIConfig(host="api.test"), session=session, validate_response=False)
+        for post_id in range(1, 11):
+            await client.get(f"/posts/{post_id}")
+
+
+@pytest.mark.performance
+def test_fetch():
+    asyncio.run(fetch_posts())
+    time.sleep(float(os.environ.get("PERF_SLEEP", "0.01")))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_fetch_many(n):
+    asyncio.run(fetch_posts())
+"""
+
+
+def _run(latency_ms: float) -> dict:
+    metrics = RequestMetrics()
+    for _ in range(10):
+        metrics.record("GET", "/posts/1", latency_ms / 1000)
+    return {"tests": {"t": {"wall_ms": 100.0, "endpoints": metrics.to_dict()}}}
+
+
+@pytest.fixture
+def perf_pytester(pytester, monkeypatch):
+    """Вложенный pytest отдельным процессом (pytest-retry не переживает inline-запуск)."""
+
+    monkeypatch.setenv("PYTHONPATH", str(ROOT))
+    pytester.makepyfile(test_inner=INNER_TEST)
+
+    def run(*args: str):
+        return pytester.runpytest_subprocess("-p", "utils.perf_baseline", "-p", "no:cacheprovider", *args)
+
+    run.path = pytester.path
+    return run
+
+
+@allure.epic("utils")
+@allure.feature("Performance baseline")
+class TestPerfBaseline:
+    @allure.title("Прогон сохраняется в базу с гистограммами endpoint'ов по шаблонам путей")
+    def test_save_records_endpoints(self, perf_pytester):
+        perf_pytester("--perf-save", "base", "-k", "not many").assert_outcomes(passed=1)
+
+        run = json.loads((perf_pytester.path / ".perf" / "base.json").read_text())["runs"][0]
+        result = run["tests"]["test_inner.py::test_fetch"]
+        assert result["requests"] == 10
+        assert list(result["endpoints"]) == ["GET /posts/{id}"]
+        assert result["wall_ms"] >= 10
+
+    @allure.title("Замедление сверх порога — регрессия: предупреждение, с --perf-fail — падение теста")
+    def test_regression_is_reported(self, perf_pytester, monkeypatch):
+        perf_pytester("--perf-save", "base", "-k", "not many").assert_outcomes(passed=1)
+        perf_pytester("--perf-compare", "base", "-k", "not many").assert_outcomes(passed=1)
+
+        monkeypatch.setenv("PERF_SLEEP", "0.1")
+        warned = perf_pytester("--perf-compare", "base", "-k", "not many")
+        warned.assert_outcomes(passed=1, warnings=1)
+        failed = perf_pytester("--perf-compare", "base", "--perf-fail", "-k", "not many")
+        failed.assert_outcomes(failed=1)
+        assert "REGRESSION" in failed.stdout.str()
+        assert "1 regressions" in failed.stdout.str()
+
+    @allure.title("Под xdist результаты всех воркеров сохраняет и сравнивает контроллер")
+    def test_xdist_workers_report_to_controller(self, perf_pytester):
+        saved = perf_pytester("--perf-save", "base", "-n", "2")
+        saved.assert_outcomes(passed=4)
+        assert "saved 4 tests" in saved.stdout.str()
+
+        runs = json.loads((perf_pytester.path / ".perf" / "base.json").read_text())["runs"]
+        assert len(runs) == 1 and len(runs[0]["tests"]) == 4
+
+        compared = perf_pytester("--perf-compare", "base", "-n", "2")
+        compared.assert_outcomes(passed=4)
+        assert "compared 4 tests with 'base'" in compared.stdout.str()
+
+    @allure.title("Перцентили endpoint'ов сравниваются с разбросом по прогонам базы")
+    def test_endpoint_percentiles_use_run_spread(self):
+        # База шумная: p50 гуляет 20–60 мс, медиана 40
+        baseline = Baseline([_run(20), _run(40), _run(60)])
+        assert len(baseline.endpoints["t"]["GET /posts/{id} p50"]) == 3
+
+        def regressions(latency_ms: float) -> list[str]:
+            rows = baseline.compare("t", _run(latency_ms)["tests"]["t"], threshold=0.2, min_delta_ms=5)
+            return [row.metric for row in rows if row.regression]
+
+        # +30% и +12 мс — в пределах разброса базы, не регрессия
+        assert regressions(52) == []
+        assert regressions(200) == ["GET /posts/{id} p50", "GET /posts/{id} p95"]
+
@@ -0,0 +1,65 @@
+import pstats
+import re
+from pathlib import Path
+
+import allure
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INNER_TEST = """
+import httpx
+
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.models.posts import Post
+
+
+async def test_fetch_posts():
+    body = [{"id": i, "userId": 1, "title": "t", "body": "b" * 200} for i in range(200)]
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    async with httpx.AsyncClient(base_url="https://api.test", transport=transport) as session:
+        client = HttpxAsyncClient(APIConfig(host="api.test"), session=session)
+        for _ in range(30):
+            await client.get("/posts", response_model=Post)
+"""
+
+
+@pytest.fixture
+def profiled_pytester(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(ROOT))
+    pytester.makeini("[pytest]\nasyncio_mode = auto\n")
+    pytester.makepyfile(test_inner=INNER_TEST)
+
+    def run(*args: str):
+        return pytester.runpytest_subprocess("-p", "utils.profiling", "-p", "no:cacheprovider", "--profile-client", *args)
+
+    run.path = pytester.path
+    return run
+
+
+@allure.epic("utils")
+@allure.feature("Client profiling")
+class TestProfileClient:
+    @allure.title("cProfile: pstats на тест и разбивка времени по группам кадров")
+    def test_cprofile(self, profiled_pytester):
+        result = profiled_pytester()
+        result.assert_outcomes(passed=1)
+
+        stats = pstats.Stats(str(profiled_pytester.path / ".profile" / "test_inner.py_test_fetch_posts.pstats"))
+        assert any(key[0].endswith("http_client.py") and key[2] == "request" for key in stats.stats)
+        summary = result.stdout.str().split("client profile")[1]
+        assert "1 tests (cprofile)" in summary and "test_inner.py::test_fetch_posts" in summary
+        client, pydantic = re.search(r"client (\d+)% .* pydantic (\d+)%", summary).groups()
+        assert int(client) > 0 and int(pydantic) > 0
+
+    @allure.title("Сэмплирующий режим пишет collapsed-стеки для flamegraph")
+    def test_sampling(self, profiled_pytester):
+        profiled_pytester("--profile-mode", "sample").assert_outcomes(passed=1)
+
+        lines = (profiled_pytester.path / ".profile" / "test_inner.py_test_fetch_posts.collapsed").read_text().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0 and stack
+        assert any("test_fetch_posts (test_inner.py:" in line for line in lines)
@@ -0,0 +1,118 @@
+import json
+
+import allure
+import httpx
+import pytest
+
+from src.async_api_client import request_log
+from src.async_api_client.config import APIConfig
+from src.async_api_client.http_client import HttpxAsyncClient
+from src.async_api_client.replay import build_request, iter_log, replay, target_path
+from src.async_api_client.request_log_query import log_files
+from src.async_api_client.testing import MOCK_CONFIG, MockAPI
+
+
+def _record(index: int, ts: float, **fields) -> dict:
+    return {
+        "ts": ts, "worker": "main", "test": None, "trace": f"t{index}", "method": "GET",
+        "path": "/posts/{id}", "url": f"/posts/{index}", "status": 200, "ms": 5.0, **fields,
+    }
+
+
+@pytest.fixture
+async def replay_target():
+    """Чистый MockAPI и клиент к нему — «другой стенд» для воспроизведения."""
+
+    api = MockAPI()
+    client = HttpxAsyncClient(MOCK_CONFIG, transport=httpx.ASGITransport(app=api))
+    yield api, client
+    await client.aclose()
+
+
+@allure.epic("async_api_client")
+@allure.feature("Traffic replay")
+class TestReplay:
+    @allure.title("Записанный журнал воспроизводится с теми же запросами, телами и статусами")
+    async def test_replay_captured_log(self, mock_api_client, replay_target, tmp_path):
+        sink = request_log.JSONLSink(tmp_path, run="captured")
+        request_log.add_sink(sink)
+        request_log.capture_bodies(True)
+        try:
+            for post_id in (1, 2, 3):
+                await mock_api_client.posts.get(post_id)
+            await mock_api_client.posts.create({"title": "t", "body": "b", "userId": 1, "password": "s3cret"})
+            await mock_api_client.posts.list(user_id=1)
+        finally:
+            request_log.remove_sink(sink)
+            request_log.capture_bodies(False)
+            sink.close()
+
+        records = list(iter_log(log_files(tmp_path / "captured")))
+        create = next(record for record in records if record["method"] == "POST")
+        assert json.loads(create["body"])["password"] == "***"
+        assert next(record for record in records if record["method"] == "GET" and record["path"] == "/posts")["query"] == "userId=1"
+
+        api, client = replay_target
+        report = await replay(client, records, concurrency=2, secrets={"password": "new-secret"})
+
+        assert len(report.results) == 5 and report.mismatches == []
+        assert api.requests["GET /posts/2"] == 1 and api.requests["POST /posts"] == 1
+        assert "GET /posts/{id}" in report.summary()
+
+    @allure.title("Режим timed сохраняет интервалы с учётом ускорения, расхождения статусов попадают в отчёт")
+    async def test_timed_replay_and_mismatches(self, replay_target):
+        records = [
+            _record(1, 1000.0),
+            _record(2, 1000.2),
+            _record(3, 1000.4, status=None, error="ReadTimeout"),
+        ]
+        api, client = replay_target
+        report = await replay(client, records, mode="timed", speed=2)
+
+        # Исходный интервал 0.4 с при ускорении x2 — не меньше 0.2 с
+        assert 0.19 <= report.wall_seconds < 1.0
+        assert [result.record["trace"] for result in report.mismatches] == ["t3"]
+        assert "/posts/3: ReadTimeout -> 200" in report.summary()
+
+    @allure.title("Замаскированные поля тела подставляются из secrets")
+    def test_build_request_injects_secrets(self):
+        record = _record(
+            1, 0.0, method="POST", url="/login", query="next=%2F",
+            body='{"user":"qa","password":"***","nested":{"token":"***"}}', content_type="application/json",
+        )
+        kwargs = build_request(record, secrets={"password": "p", "token": "t"})
+
+        assert kwargs["path"] == "/login?next=%2F"
+        assert json.loads(kwargs["content"]) == {"user": "qa", "password": "p", "nested": {"token": "t"}}
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+
+    @allure.title("Замаскированные поля формы подставляются из secrets")
+    def test_build_request_injects_form_secrets(self):
+        record = _record(
+            1, 0.0, method="POST", url="/login",
+            body="username=u&password=***", content_type="application/x-www-form-urlencoded",
+        )
+        kwargs = build_request(record, secrets={"password": "p&q"})
+
+        assert kwargs["content"] == b"username=u&password=p%26q"
+
+    @allure.title("Префикс путей журнала заменяется путём base_url цели, путь вне префикса — ошибка")
+    async def test_source_prefix(self):
+        assert target_path("/v1/posts/1", "/v2", "/v1") == "/v2/posts/1"
+        assert target_path("/v2/posts/1", "/v2/") == "/v2/posts/1"
+        assert target_path("/posts/1", "/") == "/posts/1"
+        with pytest.raises(ValueError, match="outside prefix '/v2'"):
+            target_path("/v1/posts/1", "/v2")
+
+        seen = []
+        transport = httpx.MockTransport(lambda request: seen.append(request.url) or httpx.Response(200))
+        client = HttpxAsyncClient(APIConfig(host="api.test", prefix_path="v2"), transport=transport)
+        try:
+            records = [_record(1, 0.0, url="/v1/posts/1", query="full=1")]
+            report = await replay(client, records, source_prefix="/v1")
+        finally:
+            await client.aclose()
+
+        assert [str(url) for url in seen] == ["https://api.test/v2/posts/1?full=1"]
+        assert report.results[0].status == 200
+
@@ -0,0 +1,144 @@
+import json
+import os
+from pathlib import Path
+
+import allure
+import httpx
+
+from src.async_api_client import request_log
+from src.async_api_client.request_log_query import (
+    RunIndex, load_index, log_files, main, record_filter, scan_slowest,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+INNER_TEST = """
+import pytest
+
+from src.async_api_client import request_log
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_call(index):
+    request_log.record_failure(f"t{index}", "GET", f"/posts/{index}?full=1", 10.0 * index, TimeoutError())
+"""
+
+
+def _record(index: int, ms: float, **fields) -> dict:
+    return {
+        "ts": 1760812303.0 + index, "worker": "main", "test": "tests/test_x.py::test_a", "trace": f"t{index}",
+        "method": "GET", "path": "/posts/{id}", "url": f"/posts/{index}", "status": 200, "ms": ms,
+        **fields,
+    }
+
+
+class ListSink:
+    def __init__(self):
+        self.records: list[dict] = []
+
+    def write(self, record: dict) -> None:
+        self.records.append(record)
+
+    def close(self) -> None:
+        pass
+
+
+@allure.epic("async_api_client")
+@allure.feature("Request log")
+class TestRequestLog:
+    @allure.title("Запросы клиента пишутся в JSONL с ротацией и сжатием")
+    async def test_client_requests_are_logged(self, mock_api_client, tmp_path, request):
+        sink = request_log.JSONLSink(tmp_path, run="run-1", max_bytes=1500, compress=True)
+        request_log.add_sink(sink)
+        request_log.set_test(request.node.nodeid)
+        try:
+            for post_id in range(1, 16):
+                await mock_api_client.posts.get(post_id)
+        finally:
+            request_log.remove_sink(sink)
+            request_log.set_test(None)
+            sink.close()
+
+        files = log_files(tmp_path / "run-1")
+        assert len(files) > 1 and all(path.name.endswith(".jsonl.gz") for path in files)
+
+        index = RunIndex(files)
+        assert index.count == 15
+        assert index.matching(path="/posts/3") == ["GET /posts/{id}"]
+        slowest = index.slowest(5, path="/posts/{id}")
+        scanned = scan_slowest(files, record_filter(path="/posts/{id}"), 5)
+        assert [record["ms"] for record in slowest] == [record["ms"] for record in scanned]
+
+        record = slowest[0]
+        assert record["run"] == "run-1" and record["status"] == 200
+        assert record["test"] == request.node.nodeid
+        assert record["worker"] == os.environ.get("PYTEST_XDIST_WORKER", "main")
+        assert record["resp_bytes"] > 0 and record["redirects"] == 0
+
+    @allure.title("Тела форм и JSON пишутся с замаскированными секретами, прочие тела — не пишутся")
+    def test_bodies_are_masked(self):
+        requests = [
+            httpx.Request("POST", "https://api.test/login", data={"username": "u", "password": "hunter2"}),
+            httpx.Request("POST", "https://api.test/posts", json={"title": "t", "auth": {"token": "SECRET"}}),
+            httpx.Request("POST", "https://api.test/raw", content=b"password=hunter2",
+                          headers={"Content-Type": "text/plain"}),
+        ]
+        sink = ListSink()
+        request_log.add_sink(sink)
+        request_log.capture_bodies(True)
+        try:
+            for index, request in enumerate(requests):
+                request_log.record_response(f"t{index}", httpx.Response(200, request=request), 1.0)
+        finally:
+            request_log.capture_bodies(False)
+            request_log.remove_sink(sink)
+
+        form, nested, raw = sink.records
+        assert form["body"] == "username=u&password=***"
+        assert json.loads(nested["body"]) == {"title": "t", "auth": {"token": "***"}}
+        assert "body" not in raw and raw["content_type"] == "text/plain"
+        assert "hunter2" not in json.dumps(sink.records) and "SECRET" not in json.dumps(sink.records)
+
+    @allure.title("Индекс перестраивается после дозаписи, CLI отвечает по последнему прогону")
+    def test_index_and_cli(self, tmp_path, capsys):
+        older = tmp_path / "20261018-100000"
+        latest = tmp_path / "20261018-110000"
+        older.mkdir()
+        latest.mkdir()
+        (older / "requests-main-0001.jsonl").write_text(json.dumps(_record(0, 999.0)) + "\n")
+        path = latest / "requests-main-0001.jsonl"
+        path.write_text("".join(json.dumps(_record(index, float(index))) + "\n" for index in range(10)))
+
+        assert load_index(path)["endpoints"]["GET /posts/{id}"]["count"] == 10
+        with path.open("a") as fh:
+            fh.write(json.dumps(_record(10, 500.0, status=None, error="ReadTimeout")) + "\n")
+        entry = load_index(path)["endpoints"]["GET /posts/{id}"]
+        assert entry["count"] == 11 and entry["errors"] == 1
+
+        main(["--dir", str(tmp_path), "slowest", "--path", "/posts/{id}", "-n", "2"])
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert "500.0ms" in lines[0] and "ReadTimeout" in lines[0] and "9.0ms" in lines[1]
+
+        main(["--dir", str(tmp_path), "find", "--status", "error"])
+        assert json.loads(capsys.readouterr().out)["trace"] == "t10"
+
+    @allure.title("Воркеры xdist пишут свои файлы одного прогона с node id тестов")
+    def test_plugin_with_xdist(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        monkeypatch.setenv(request_log.RUN_ENV, "xdist-run")
+        pytester.makepyfile(test_inner=INNER_TEST)
+
+        result = pytester.runpytest_subprocess(
+            "-p", "utils.request_log", "-p", "no:cacheprovider", "-n", "2", "--request-log", "log",
+        )
+        result.assert_outcomes(passed=4)
+        assert "request log" in result.stdout.str()
+
+        files = log_files(pytester.path / "log" / "xdist-run")
+        assert {path.name for path in files} <= {"requests-gw0-0001.jsonl", "requests-gw1-0001.jsonl"}
+        records = [json.loads(line) for path in files for line in path.read_text().splitlines()]
+        assert len(records) == 4
+        assert {record["path"] for record in records} == {"/posts/{id}"}
+        assert all(record["test"].startswith("test_inner.py::test_call[") for record in records)
+        assert all(record["error"] == "TimeoutError" and record["status"] is None for record in records)
@@ -0,0 +1,63 @@
+import asyncio
+
+import allure
+import pytest
+
+from src.async_api_client.asserts import assert_p50_below, assert_p95_below, assert_p99_below
+from src.async_api_client.testing import Latency
+from src.async_api_client.timing import measure
+from utils.assertions import AssertionAggregator
+
+
+@allure.epic("async_api_client")
+@allure.feature("Latency SLO")
+class TestMeasure:
+    @allure.title("measure() собирает распределение с прогревом и конкурентностью")
+    @pytest.mark.mock_api(latency=Latency("fixed", 0.01))
+    async def test_distribution(self, mock_api_client, mock_api):
+        stats = await measure(lambda: mock_api_client.posts.get(1), calls=40, concurrency=8, warmup=3, name="get post")
+
+        assert mock_api.requests["GET /posts/1"] == 43
+        assert len(stats.samples_ms) == 40
+        assert 10 <= stats.p50_ms <= stats.p95_ms <= stats.p99_ms <= stats.max_ms
+        # 8 параллельных вызовов по ~10 мс — заметно больше 100 вызовов/с
+        assert stats.throughput > 200
+        assert_p50_below(stats, ms=1000)
+
+    @allure.title("Нарушения нескольких SLO копятся в AssertionAggregator")
+    @pytest.mark.mock_api(latency=Latency("fixed", 0.005))
+    async def test_soft_slo(self, mock_api_client):
+        stats = await measure(lambda: mock_api_client.posts.get(1), calls=10, warmup=0, name="get post")
+
+        with pytest.raises(AssertionError) as exc_info:
+            with AssertionAggregator() as aggregator:
+                assert_p95_below(stats, ms=1, soft=aggregator)
+                assert_p99_below(stats, ms=2, soft=aggregator)
+                assert_p50_below(stats, ms=1000, soft=aggregator)
+
+        message = str(exc_info.value)
+        assert "get post: p95" in message and "get post: p99" in message
+        assert "get post: p50" not in message
+
+        with pytest.raises(AssertionError, match="p95"):
+            assert_p95_below(stats, ms=1)
+
+    @allure.title("Исключение вызова останавливает остальные вызовы замера")
+    async def test_error_cancels_other_workers(self):
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            failing = calls == 10
+            await asyncio.sleep(0.001)
+            if failing:
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await measure(call, calls=100, concurrency=4, warmup=0)
+        stopped_at = calls
+        await asyncio.sleep(0.05)
+
+        assert calls == stopped_at < 100
+
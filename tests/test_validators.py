@@ -0,0 +1,98 @@
+import allure
+import httpx
+import pytest
+
+from src.async_api_client.asserts import get_validation_sample
+from src.async_api_client.config import ValidationSampling
+from src.async_api_client.constants import DEFAULT_ERROR_MODELS
+from src.async_api_client.exceptions import RequestValidationError, ResponseValidationError
+from src.async_api_client.models.posts import Post, PostCreate
+from src.async_api_client.validators import prepare_payload, sample_indices, validate_body
+
+
+def make_posts(count: int) -> list[dict]:
+    return [
+        {"id": i, "userId": 1, "title": f"title {i}", "body": "body"}
+        for i in range(count)
+    ]
+
+
+def make_response(body) -> httpx.Response:
+    return httpx.Response(200, json=body, request=httpx.Request("GET", "https://api.test/posts"))
+
+
+@allure.epic("async_api_client")
+@allure.feature("Validators")
+class TestSampleValidation:
+    @allure.title("Выборка детерминирована: head + tail + seeded random")
+    def test_sample_indices_are_deterministic(self):
+        sampling = ValidationSampling(head=3, tail=2, random=4, seed=42)
+
+        indices = sample_indices(1000, sampling)
+
+        assert indices == sample_indices(1000, sampling)
+        assert indices[:3] == [0, 1, 2]
+        assert indices[-2:] == [998, 999]
+        assert len(indices) == 9
+        assert indices == sorted(set(indices))
+
+    @allure.title("Маленькая коллекция проверяется целиком")
+    def test_small_collection_is_fully_checked(self):
+        response = make_response(make_posts(5))
+
+        validate_body(response, Post, DEFAULT_ERROR_MODELS, ValidationSampling(head=2, tail=2, random=2))
+
+        report = get_validation_sample(response)
+        assert report.is_full
+        assert report.indices == (0, 1, 2, 3, 4)
+
+    @allure.title("Ошибка в проверенном элементе называет его индекс и seed")
+    def test_failure_reports_checked_index(self):
+        posts = make_posts(100)
+        posts[98]["userId"] = "not-an-int"
+        response = make_response(posts)
+
+        with pytest.raises(ResponseValidationError, match=r"items \[98\].*seed=7"):
+            validate_body(response, Post, DEFAULT_ERROR_MODELS, ValidationSampling(head=5, tail=5, random=5, seed=7))
+
+    @allure.title("Непроверенный элемент не валит выборочную валидацию")
+    def test_unsampled_item_is_skipped(self):
+        posts = make_posts(100)
+        sampling = ValidationSampling(head=5, tail=5, random=5, seed=7)
+        skipped = next(i for i in range(100) if i not in sample_indices(100, sampling))
+        posts[skipped]["userId"] = "not-an-int"
+
+        validate_body(make_response(posts), Post, DEFAULT_ERROR_MODELS, sampling)
+
+    @allure.title("Без sampling массив валидируется поэлементно целиком")
+    def test_full_mode_validates_every_item(self):
+        posts = make_posts(100)
+        posts[50]["title"] = None
+
+        with pytest.raises(ResponseValidationError):
+            validate_body(make_response(posts), Post, DEFAULT_ERROR_MODELS)
+
+
+@allure.epic("async_api_client")
+@allure.feature("Validators")
+class TestPreparePayload:
+    @allure.title("Pydantic-модель сериализуется сразу в JSON-байты")
+    def test_model_is_dumped_to_bytes(self):
+        kwargs = prepare_payload({"json": PostCreate(title="t", body="b", userId=1)}, None, validate=False)
+
+        assert "json" not in kwargs
+        assert kwargs["content"] == b'{"title":"t","body":"b","userId":1}'
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    @allure.title("Список сырых dict валидируется через request_model поэлементно")
+    def test_dict_list_is_validated_and_dumped(self):
+        kwargs = prepare_payload(
+            {"json": [{"title": "t", "body": "b", "userId": 1}], "headers": {"content-type": "application/json; v=2"}},
+            PostCreate,
+            validate=True,
+        )
+        assert kwargs["content"] == b'[{"title":"t","body":"b","userId":1}]'
+        assert kwargs["headers"] == {"content-type": "application/json; v=2"}
+
+        with pytest.raises(RequestValidationError):
+            prepare_payload({"json": [{"title": "", "body": "b", "userId": 1}]}, PostCreate, validate=True)
@@ -0,0 +1,132 @@
+"""
+Слияние логов воркеров pytest-xdist в одну хронологию прогона.
+
+Каждый воркер пишет свой файл (utils.logger: tests_cycle-gw0.log, ...), и
+каждый файл уже упорядочен по времени. Слияние — k-way (heapq.merge) по
+времени записи: в памяти одна запись на файл, файлы читаются потоково,
+поэтому подходит и для многогигабайтных логов (.gz читается без распаковки на диск).
+
+Запись — строка с меткой времени в начале ("2026-10-18 23:12:03.412 ...") вместе
+со следующими строками без метки (traceback, многострочные тела). В результат
+после времени добавляется источник: "2026-10-18 23:12:03.412 [gw1] [INFO] ...".
+Записи с одинаковым временем идут в порядке файлов.
+
+Файлы дописываются между прогонами и ротируются по суткам, поэтому слияние
+ограничивается прогоном (since): берутся файлы, изменённые после его начала,
+и записи не раньше этого момента — старые прогоны, ротированные копии и файлы
+воркеров, которых в этом прогоне не было, в хронологию не попадают.
+
+    python -m utils.log_merge                                  # logs/tests_cycle*.log → logs/tests_cycle-merged.log
+    python -m utils.log_merge logs/tests_cycle-gw*.log -o timeline.log
+    python -m utils.log_merge --name load_runner --no-label -o -   # в stdout
+    python -m utils.log_merge --since "2026-10-18 23:00:00"      # только записи с этого момента
+"""
+
+import argparse
+import gzip
+import heapq
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from utils.logger import DEFAULT_LOGS_DIR
+
+_TIMESTAMP = re.compile(rb"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d{1,6})?")
+_WORKER = re.compile(r"-(gw\d+)\.log")
+
+Entry = tuple[bytes, bytes]  # (метка времени, запись целиком с переводами строк)
+
+
+def since_key(moment: float) -> bytes:
+    """Момент time.time() в формате меток лога (локальное время, до секунды)."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(moment)).encode()
+
+
+def source_label(path: Path) -> str:
+    """tests_cycle-gw3.log(.2026-10-17)(.gz) → gw3; файл без воркера — main."""
+    match = _WORKER.search(path.name)
+    return match.group(1) if match else "main"
+
+
+def iter_entries(path: Path, label: Optional[str] = None) -> Iterator[Entry]:
+    """Записи файла; строки до первой метки времени получают пустой ключ (идут первыми)."""
+
+    opener = gzip.open if path.suffix == ".gz" else open
+    tag = f" [{label}]".encode() if label else b""
+    key = b""
+    lines: list[bytes] = []
+    with opener(path, "rb") as fh:
+        for line in fh:
+            match = _TIMESTAMP.match(line)
+            if match is None:
+                lines.append(line if line.endswith(b"\n") else line + b"\n")
+                continue
+            if lines:
+                yield key, b"".join(lines)
+            key = match.group().replace(b",", b".").replace(b"T", b" ")
+            end = match.end()
+            lines = [line[:end] + tag + (line[end:] if line.endswith(b"\n") else line[end:] + b"\n")]
+    if lines:
+        yield key, b"".join(lines)
+
+
+def merge_logs(paths: Iterable[Path], output: BinaryIO, label: bool = True, since: Optional[float] = None) -> int:
+    """
+    Слить файлы в output по времени записи; возвращает число записей.
+
+    :param since: time.time() начала прогона — более ранние записи пропускаются
+    """
+
+    streams = [iter_entries(path, source_label(path) if label else None) for path in paths]
+    start = since_key(since) if since is not None else b""
+    count = 0
+    for key, entry in heapq.merge(*streams, key=lambda item: item[0]):
+        if key < start:
+            continue
+        output.write(entry)
+        count += 1
+    return count
+
+
+def find_logs(logs_dir: Path, name: str, since: Optional[float] = None) -> list[Path]:
+    """
+    Файлы процесса-контроллера и воркеров: <name>.log, <name>-gwN.log и их ротации.
+
+    :param since: только файлы, изменённые не раньше этого момента (time.time())
+    """
+    candidates = [*logs_dir.glob(f"{name}.log*"), *logs_dir.glob(f"{name}-gw*.log*")]
+    return sorted(
+        path for path in candidates
+        if not path.name.startswith(f"{name}-merged") and (since is None or path.stat().st_mtime >= since)
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", type=Path, help="файлы; по умолчанию — --name в --logs-dir")
+    parser.add_argument("--logs-dir", type=Path, default=DEFAULT_LOGS_DIR)
+    parser.add_argument("--name", default="tests_cycle", help="базовое имя лога (log_file в configure_logging)")
+    parser.add_argument("-o", "--output", default=None, help="файл результата или - (stdout)")
+    parser.add_argument("--no-label", action="store_true", help="не добавлять источник [gwN] к записям")
+    parser.add_argument("--since", default=None, help='только записи с момента "YYYY-MM-DD HH:MM:SS"')
+    args = parser.parse_args(argv)
+
+    since = datetime.fromisoformat(args.since).timestamp() if args.since else None
+    paths = args.paths or find_logs(args.logs_dir, args.name, since=since)
+    if not paths:
+        parser.error(f"no {args.name} logs in {args.logs_dir}")
+
+    if args.output == "-":
+        merge_logs(paths, sys.stdout.buffer, label=not args.no_label, since=since)
+        return
+    output = Path(args.output) if args.output else args.logs_dir / f"{args.name}-merged.log"
+    with output.open("wb") as fh:
+        count = merge_logs(paths, fh, label=not args.no_label, since=since)
+    print(f"{count} records from {len(paths)} files -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,25 +10,124 @@
     from utils.logger import get_logger
     log = get_logger(__name__)
     log.info("hello")
+
+Режим очереди (queue_mode="drop" | "block"): логгеры пишут запись в ограниченную
+очередь, а форматирование и запись в stdout/файл выполняет фоновый поток
+(QueueListener) — вызов логгера на event loop не ждёт диска. При переполнении
+"drop" отбрасывает запись (счётчик — dropped_records()), "block" ждёт места.
+В конце процесса (или shutdown_logging()) очередь дописывается до конца.
+
+Под pytest-xdist каждый воркер пишет в свой файл: tests_cycle-gw0.log,
+tests_cycle-gw1.log, ... (контроллер — в tests_cycle.log). Общая хронология
+прогона — utils.log_merge (k-way слияние по времени записи).
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_LOGS_DIR = PROJECT_ROOT / "logs"
 
-MANAGED_LOGGERS = ("async_api_client", "tests", "app", "httpx", "httpcore")
+MANAGED_LOGGERS = ("async_api_client", "load_runner", "tests", "app", "httpx", "httpcore")
 
-_DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+# Миллисекунды — чтобы записи воркеров xdist можно было упорядочить при слиянии
+_DEFAULT_FORMAT = "%(asctime)s.%(msecs)03d [%(levelname)s] %(name)s: %(message)s"
 _DEFAULT_DATEFMT = "%Y-%m-%d %H:%M:%S"
 
 LogLevel = Union[int, str]
+QueueMode = Literal["off", "drop", "block"]
 
 _configured: bool = False
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["BoundedQueueHandler"] = None
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler с ограниченной очередью и политикой переполнения.
+
+    В вызывающем потоке только подставляются аргументы сообщения (getMessage) —
+    форматирование времени, исключений и запись делает слушатель.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block: bool):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """Маркер остановки ждёт места в очереди (в полной очереди put_nowait упал бы)."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def _start_queue(handlers: list[logging.Handler], queue_size: int, block: bool) -> list[logging.Handler]:
+    global _listener, _queue_handler
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = BoundedQueueHandler(log_queue, block=block)
+    _listener = _DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return [_queue_handler]
+
+
+def worker_log_name(log_file: str) -> str:
+    """Имя файла лога процесса: с суффиксом воркера под pytest-xdist (tests_cycle-gw0)."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"{log_file}-{worker}" if worker else log_file
+
+
+def dropped_records() -> int:
+    """Сколько записей отброшено переполненной очередью (queue_mode="drop")."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """
+    Остановить фоновую запись, дописав очередь; логгеры возвращаются к прямой
+    записи в те же обработчики. Без режима очереди — ничего не делает.
+    """
+
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    listener, handler = _listener, _queue_handler
+    _listener = _queue_handler = None
+
+    # Сначала новые записи — напрямую, затем слушатель дописывает очередь
+    for name in MANAGED_LOGGERS:
+        target = logging.getLogger(name)
+        if handler in target.handlers:
+            target.removeHandler(handler)
+            for direct in listener.handlers:
+                target.addHandler(direct)
+    listener.stop()
+    if handler.dropped:
+        logging.getLogger("app").warning("logging queue overflow: %d records dropped", handler.dropped)
 
 
 def configure_logging(
@@ -40,6 +139,9 @@ def configure_logging(
         datefmt: str = _DEFAULT_DATEFMT,
         backup_count: int = 7,
         force: bool = False,
+        queue_mode: QueueMode = "off",
+        queue_size: int = 10_000,
+        per_worker: bool = True,
 ) -> None:
     """
     Настроить корневое логирование один раз за процесс.
@@ -52,10 +154,17 @@ def configure_logging(
     :param datefmt: формат даты
     :param backup_count: сколько суточных файлов хранить (TimedRotatingFileHandler)
     :param force: переконфигурировать, даже если уже настроено
+    :param queue_mode: "off" — запись в вызывающем потоке; "drop" / "block" — через
+                       очередь и фоновый поток, при переполнении отбросить / ждать
+    :param queue_size: ёмкость очереди в записях
+    :param per_worker: под pytest-xdist писать в отдельный файл воркера (worker_log_name)
     """
     global _configured
     if _configured and not force:
         return
+    if queue_mode not in ("off", "drop", "block"):
+        raise ValueError(f"queue_mode must be 'off', 'drop' or 'block', got {queue_mode!r}")
+    shutdown_logging()
 
     formatter = logging.Formatter(fmt, datefmt=datefmt)
     handlers: list[logging.Handler] = []
@@ -69,7 +178,7 @@ def configure_logging(
         logs_dir = Path(logs_dir)
         try:
             logs_dir.mkdir(parents=True, exist_ok=True)
-            file_path = logs_dir / f"{log_file}.log"
+            file_path = logs_dir / f"{worker_log_name(log_file) if per_worker else log_file}.log"
             file_handler = TimedRotatingFileHandler(
                 filename=file_path,
                 when="midnight",
@@ -86,6 +195,9 @@ def configure_logging(
                 file=sys.stderr,
             )
 
+    if queue_mode != "off" and handlers:
+        handlers = _start_queue(handlers, queue_size, block=queue_mode == "block")
+
     for name in MANAGED_LOGGERS:
         target = logging.getLogger(name)
         target.setLevel(level)
@@ -99,6 +211,9 @@ def configure_logging(
     _configured = True
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     if not _configured:
         configure_logging()
@@ -0,0 +1,100 @@
+"""
+Pytest-плагин: монитор задержки общего event loop (testing.LoopLagMonitor).
+
+Тесты и фикстуры делят session-цикл, поэтому синхронная работа одного теста
+(логирование, вложения Allure, валидация) задерживает чужие запросы. С --loop-lag
+монитор работает всю сессию, блокировки цикла приписываются тесту, в фазе
+которого случились, а в конце выводятся тесты с наибольшим временем блокировок:
+
+    pytest --loop-lag                              # порог --loop-lag-threshold-ms (50)
+    pytest --loop-lag-debug                        # то же + стек блокирующего вызова
+
+Монитор доступен фикстурой loop_lag_monitor (None, если выключен).
+"""
+
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+from src.async_api_client.testing.loop_lag import LoopLagMonitor, NO_LABEL, format_lag_report
+
+_MONITOR_KEY = pytest.StashKey[Optional[LoopLagMonitor]]()
+_CURRENT_KEY = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("loop-lag", "event loop lag monitor")
+    group.addoption("--loop-lag", action="store_true", help="monitor event loop lag during the session")
+    group.addoption("--loop-lag-debug", action="store_true", help="--loop-lag + stacks of blocking calls")
+    group.addoption("--loop-lag-threshold-ms", type=float, default=50.0, help="lag reported as a block")
+    group.addoption("--loop-lag-interval-ms", type=float, default=10.0, help="sampling period")
+    group.addoption("--loop-lag-top", type=int, default=10, help="tests shown in the summary")
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("loop_lag") or config.getoption("loop_lag_debug"))
+
+
+def pytest_configure(config):
+    config.stash[_MONITOR_KEY] = None
+    config.stash[_CURRENT_KEY] = NO_LABEL
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session", autouse=True)
+async def loop_lag_monitor(request) -> Optional[LoopLagMonitor]:
+    config = request.config
+    if not _enabled(config):
+        yield None
+        return
+
+    monitor = LoopLagMonitor(
+        interval=config.getoption("loop_lag_interval_ms") / 1000,
+        threshold=config.getoption("loop_lag_threshold_ms") / 1000,
+        capture_stacks=config.getoption("loop_lag_debug"),
+    )
+    monitor.label = config.stash[_CURRENT_KEY]
+    monitor.start()
+    config.stash[_MONITOR_KEY] = monitor
+    yield monitor
+    await monitor.stop()
+
+
+def _phase(item):
+    """Приписать блокировки фазы тесту. Между фазами цикл стоит — этот интервал не считается."""
+
+    item.config.stash[_CURRENT_KEY] = item.nodeid
+    monitor = item.config.stash[_MONITOR_KEY]
+    if monitor is not None:
+        monitor.skip_sample()
+        monitor.label = item.nodeid
+    yield
+    item.config.stash[_CURRENT_KEY] = NO_LABEL
+    # Монитор мог появиться в этой фазе (setup первого теста)
+    monitor = item.config.stash[_MONITOR_KEY]
+    if monitor is not None:
+        monitor.skip_sample()
+        monitor.label = NO_LABEL
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield from _phase(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield from _phase(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    yield from _phase(item)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    monitor = config.stash.get(_MONITOR_KEY, None)
+    if monitor is None:
+        return
+    terminalreporter.write_sep("-", "event loop lag")
+    terminalreporter.write_line(format_lag_report(monitor, top=config.getoption("loop_lag_top")))
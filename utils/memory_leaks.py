@@ -0,0 +1,231 @@
+"""
+Pytest-плагин: рост памяти между тестами и поиск утечек (tracemalloc).
+
+Сессионные объекты (http_session, логгеры, кэши) живут весь прогон, и на долгих
+прогонах RSS растёт. С --mem-track после каждого теста (после teardown и
+gc.collect()) снимается снимок tracemalloc и сравнивается с предыдущим:
+  • прирост памяти теста (tracemalloc и RSS);
+  • прирост по модулям, в которых выделена память (httpx, src.async_api_client.redirects, ...);
+  • тест с приростом от --mem-threshold-kb помечается предупреждением;
+  • с --mem-dump для такого теста пишутся top мест выделения (со стеком
+    --mem-frames) — в .memory/<тест>.txt и во вложение Allure.
+
+    pytest --mem-track                                   # отчёт в конце прогона
+    pytest --mem-track --mem-threshold-kb 256 --mem-dump --mem-frames 15
+
+Первые --mem-warmup тестов не помечаются: импорты и прогрев кэшей — не утечка.
+tracemalloc замедляет выделение памяти в разы — режим для диагностики, не для CI.
+"""
+
+import gc
+import linecache
+import re
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import allure
+import psutil
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_TRACKER_KEY = pytest.StashKey[Optional["MemoryTracker"]]()
+
+# Свои выделения плагина: снимки, форматирование стеков (linecache кэширует исходники)
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("mem", "memory growth tracking")
+    group.addoption("--mem-track", action="store_true", help="snapshot memory (tracemalloc) after each test")
+    group.addoption("--mem-threshold-kb", type=float, default=512.0, help="per-test growth flagged as a leak")
+    group.addoption("--mem-warmup", type=int, default=1, help="first tests never flagged")
+    group.addoption("--mem-dump", action="store_true", help="dump top allocation sites of flagged tests")
+    group.addoption("--mem-frames", type=int, default=10, help="traceback depth stored by tracemalloc")
+    group.addoption("--mem-top", type=int, default=10, help="rows in reports and dumps")
+    group.addoption("--mem-dir", default=".memory", help="directory for --mem-dump files")
+
+
+def module_of(filename: str) -> str:
+    """Файл → имя модуля: src/async_api_client/redirects.py → src.async_api_client.redirects, httpx/_models.py → httpx."""
+
+    path = Path(filename)
+    try:
+        relative = path.relative_to(PROJECT_ROOT)
+    except ValueError:
+        parts = path.parts
+        for marker in ("site-packages", "dist-packages"):
+            if marker in parts and parts.index(marker) + 1 < len(parts):
+                return parts[parts.index(marker) + 1].removesuffix(".py")
+        return path.stem
+    return ".".join(relative.with_suffix("").parts)
+
+
+def growth_by_module(new: tracemalloc.Snapshot, old: tracemalloc.Snapshot) -> Counter:
+    """Прирост байт по модулям (только положительный итог модуля)."""
+
+    growth: Counter = Counter()
+    for diff in new.compare_to(old, "filename"):
+        growth[module_of(diff.traceback[0].filename)] += diff.size_diff
+    return Counter({module: size for module, size in growth.items() if size > 0})
+
+
+@dataclass(frozen=True)
+class MemoryDelta:
+    nodeid: str
+    traced_delta: int
+    rss_delta: int
+    modules: tuple[tuple[str, int], ...]
+    flagged: bool
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:+.1f} KiB"
+
+
+class MemoryTracker:
+    """Снимки между тестами; хранит только предыдущий и первый снимок."""
+
+    def __init__(self, threshold: int, warmup: int, top: int):
+        self.threshold = threshold
+        self.warmup = warmup
+        self.top = top
+        self.results: list[MemoryDelta] = []
+        self._process = psutil.Process()
+        self._first: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._previous_traced = 0
+        self._previous_rss = 0
+        self._first_traced = 0
+        self._first_rss = 0
+
+    def _measure(self) -> tuple[tracemalloc.Snapshot, int, int]:
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        traced = sum(stat.size for stat in snapshot.statistics("filename"))
+        return snapshot, traced, self._process.memory_info().rss
+
+    def start(self) -> None:
+        self._first, self._first_traced, self._first_rss = self._measure()
+        self._previous, self._previous_traced, self._previous_rss = self._first, self._first_traced, self._first_rss
+
+    def after_test(self, nodeid: str) -> tuple[MemoryDelta, tracemalloc.Snapshot, tracemalloc.Snapshot]:
+        snapshot, traced, rss = self._measure()
+        delta = traced - self._previous_traced
+        modules = growth_by_module(snapshot, self._previous).most_common(self.top)
+        result = MemoryDelta(
+            nodeid=nodeid,
+            traced_delta=delta,
+            rss_delta=rss - self._previous_rss,
+            modules=tuple(modules),
+            flagged=len(self.results) >= self.warmup and delta >= self.threshold,
+        )
+        self.results.append(result)
+        previous = self._previous
+        self._previous, self._previous_traced, self._previous_rss = snapshot, traced, rss
+        return result, snapshot, previous
+
+    def session_growth(self) -> tuple[int, int, list[tuple[str, int]]]:
+        """Рост за сессию: tracemalloc, RSS и модули (последний снимок против первого)."""
+
+        if self._first is None or self._previous is None:
+            return 0, 0, []
+        modules = growth_by_module(self._previous, self._first).most_common(self.top)
+        return self._previous_traced - self._first_traced, self._previous_rss - self._first_rss, modules
+
+
+def format_allocation_sites(new: tracemalloc.Snapshot, old: tracemalloc.Snapshot, top: int) -> str:
+    """Места выделения с наибольшим приростом — со стеком."""
+
+    lines = []
+    for index, diff in enumerate(new.compare_to(old, "traceback")[:top], 1):
+        if diff.size_diff <= 0:
+            break
+        lines.append(f"#{index}: {_kb(diff.size_diff)} in {diff.count_diff:+d} blocks (now {diff.size / 1024:.1f} KiB)")
+        lines.extend("    " + line for line in diff.traceback.format(most_recent_first=True))
+    return "\n".join(lines)
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("mem_track", False))
+
+
+def pytest_configure(config):
+    config.stash[_TRACKER_KEY] = None
+    if not _enabled(config):
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(config.getoption("mem_frames"))
+    config.stash[_TRACKER_KEY] = MemoryTracker(
+        threshold=int(config.getoption("mem_threshold_kb") * 1024),
+        warmup=config.getoption("mem_warmup"),
+        top=config.getoption("mem_top"),
+    )
+
+
+def pytest_unconfigure(config):
+    if config.stash.get(_TRACKER_KEY, None) is not None:
+        tracemalloc.stop()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtestloop(session):
+    tracker = session.config.stash[_TRACKER_KEY]
+    if tracker is not None:
+        tracker.start()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    config = item.config
+    tracker = config.stash[_TRACKER_KEY]
+    if tracker is None:
+        return
+
+    result, snapshot, previous = tracker.after_test(item.nodeid)
+    if not result.flagged:
+        return
+    modules = ", ".join(f"{module} {_kb(size)}" for module, size in result.modules[:3])
+    item.warn(pytest.PytestWarning(
+        f"memory grew by {_kb(result.traced_delta)} (RSS {_kb(result.rss_delta)}) during the test: {modules}"
+    ))
+    if config.getoption("mem_dump"):
+        sites = format_allocation_sites(snapshot, previous, tracker.top)
+        directory = Path(config.getoption("mem_dir"))
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / (re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_") + ".txt")
+        path.write_text(f"{item.nodeid}: {_kb(result.traced_delta)}\n\n{sites}\n", encoding="utf-8")
+        allure.attach(sites, name="Memory growth: allocation sites", attachment_type=allure.attachment_type.TEXT)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    tracker = config.stash.get(_TRACKER_KEY, None)
+    if tracker is None or not tracker.results:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.write_sep("-", "memory growth")
+    traced, rss, modules = tracker.session_growth()
+    flagged = [result for result in tracker.results if result.flagged]
+    write(
+        f"session: tracemalloc {_kb(traced)}, RSS {_kb(rss)}; "
+        f"{len(flagged)} of {len(tracker.results)} tests grew by >= {tracker.threshold / 1024:g} KiB"
+    )
+    if modules:
+        write("growth by module: " + ", ".join(f"{module} {_kb(size)}" for module, size in modules))
+    for result in sorted(tracker.results, key=lambda r: r.traced_delta, reverse=True)[:tracker.top]:
+        if result.traced_delta <= 0:
+            break
+        mark = "  LEAK?" if result.flagged else ""
+        write(f"{_kb(result.traced_delta):>16} (RSS {_kb(result.rss_delta):>14})  {result.nodeid}{mark}")
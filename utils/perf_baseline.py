@@ -0,0 +1,298 @@
+"""
+Pytest-плагин: базовая линия производительности и поиск регрессий.
+
+Для тестов с маркером performance (или всех — --perf-all) записываются:
+  • время фазы call теста;
+  • число запросов и гистограммы задержек по endpoint'ам ("GET /posts/{id}")
+    из HttpxAsyncClient (metrics.collect_requests).
+
+Прогон сохраняется в хранилище (.perf/<имя>.json, последние --perf-keep прогонов)
+и сравнивается с выбранной базой:
+
+    pytest -m performance --perf-save main                 # записать базу (несколько раз — больше выборка)
+    pytest -m performance --perf-compare main              # сравнить, регрессии — предупреждения
+    pytest -m performance --perf-compare main --perf-fail  # регрессии роняют тест
+
+Регрессия — значение хуже медианы базы одновременно:
+  • на --perf-threshold (относительно, по умолчанию 20%);
+  • на --perf-min-delta-ms (абсолютно — шум коротких тестов);
+  • на 3 робастных σ (1.4826·MAD) разброса базы, если в ней не меньше 3 прогонов.
+Для endpoint'ов сравниваются p50 и p95 с их значениями в каждом прогоне базы (прогоны
+от 5 ответов) — по тем же правилам, что и время теста, включая робастный разброс.
+
+Таблица сравнения теста прикладывается к Allure, сводка — в конце вывода pytest.
+
+Под pytest-xdist воркеры измеряют и сравнивают свои тесты, а результаты отдают
+контроллеру (workeroutput): сохраняет прогон и печатает сводку только он.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import allure
+import pytest
+
+from src.async_api_client.metrics import RequestMetrics, collect_requests
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+MIN_ENDPOINT_SAMPLES = 5
+_RESULTS_KEY = pytest.StashKey[dict]()
+_COMPARISONS_KEY = pytest.StashKey[list]()
+_BASELINE_KEY = pytest.StashKey[Optional["Baseline"]]()
+_SAVED_KEY = pytest.StashKey[Path]()
+_TABLE_KEY = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance baseline")
+    group.addoption("--perf-store", default=".perf", help="directory with saved performance runs")
+    group.addoption("--perf-save", metavar="NAME", default=None, help="save this run into baseline NAME")
+    group.addoption("--perf-compare", metavar="NAME", default=None, help="compare with baseline NAME")
+    group.addoption("--perf-fail", action="store_true", help="fail tests with regressions (default: warn)")
+    group.addoption("--perf-threshold", type=float, default=0.2, help="relative regression threshold")
+    group.addoption("--perf-min-delta-ms", type=float, default=5.0, help="ignore smaller absolute slowdowns")
+    group.addoption("--perf-keep", type=int, default=5, help="runs kept per baseline")
+    group.addoption("--perf-all", action="store_true", help="record every test, not only @performance")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Одна метрика теста против базы."""
+
+    test: str
+    metric: str
+    baseline_ms: float
+    current_ms: float
+    regression: bool
+
+    @property
+    def change(self) -> float:
+        return self.current_ms / self.baseline_ms - 1 if self.baseline_ms else 0.0
+
+
+class BaselineStore:
+    """Хранилище прогонов: <dir>/<name>.json = {"name", "runs": [...]}, новые в конце."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def load(self, name: str) -> list[dict[str, Any]]:
+        path = self.path(name)
+        if not path.exists():
+            return []
+        return json.loads(path.read_text(encoding="utf-8"))["runs"]
+
+    def save(self, name: str, run: dict[str, Any], keep: int) -> Path:
+        runs = [*self.load(name), run][-keep:]
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"name": name, "runs": runs}, ensure_ascii=False) + "\n", encoding="utf-8")
+        return path
+
+
+ENDPOINT_PERCENTILES = (50, 95)
+
+
+class Baseline:
+    """Выборки базы по тестам: времена прогонов и перцентили endpoint'ов в каждом прогоне, мс."""
+
+    def __init__(self, runs: list[dict[str, Any]]):
+        self.runs = len(runs)
+        self.wall: dict[str, list[float]] = {}
+        # test → "GET /posts/{id} p95" → значения по прогонам
+        self.endpoints: dict[str, dict[str, list[float]]] = {}
+        for run in runs:
+            for test, result in run["tests"].items():
+                self.wall.setdefault(test, []).append(result["wall_ms"])
+                samples = self.endpoints.setdefault(test, {})
+                for endpoint, histogram in RequestMetrics.from_dict(result["endpoints"]).endpoints.items():
+                    if histogram.count < MIN_ENDPOINT_SAMPLES:
+                        continue
+                    for q in ENDPOINT_PERCENTILES:
+                        samples.setdefault(f"{endpoint} p{q}", []).append(histogram.percentile(q) * 1000)
+
+    def compare(
+            self, test: str, result: dict[str, Any], threshold: float, min_delta_ms: float,
+    ) -> list[Comparison]:
+        rows = []
+        samples = self.wall.get(test)
+        if samples:
+            rows.append(_compare(test, "wall", samples, result["wall_ms"], threshold, min_delta_ms))
+
+        baseline = self.endpoints.get(test, {})
+        current = RequestMetrics.from_dict(result["endpoints"])
+        for endpoint, histogram in sorted(current.endpoints.items()):
+            if histogram.count < MIN_ENDPOINT_SAMPLES:
+                continue
+            for q in ENDPOINT_PERCENTILES:
+                metric = f"{endpoint} p{q}"
+                if metric in baseline:
+                    rows.append(_compare(
+                        test, metric, baseline[metric], histogram.percentile(q) * 1000, threshold, min_delta_ms,
+                    ))
+        return rows
+
+
+def _compare(
+        test: str, metric: str, samples: list[float], current: float, threshold: float, min_delta_ms: float,
+) -> Comparison:
+    median = statistics.median(samples)
+    regression = current > median * (1 + threshold) and current - median > min_delta_ms
+    if regression and len(samples) >= 3:
+        mad = statistics.median(abs(s - median) for s in samples)
+        regression = current - median > 3 * 1.4826 * mad
+    return Comparison(test, metric, round(median, 3), round(current, 3), regression)
+
+
+def format_comparisons(rows: list[Comparison]) -> str:
+    lines = [f"{'metric':<44} {'baseline, ms':>13} {'now, ms':>10} {'change':>8}"]
+    for row in rows:
+        mark = "  REGRESSION" if row.regression else ""
+        lines.append(
+            f"{row.metric:<44} {row.baseline_ms:>13.2f} {row.current_ms:>10.2f} {row.change:>+8.1%}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("perf_save") or config.getoption("perf_compare"))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "performance: Performance tests")
+    config.stash[_RESULTS_KEY] = {}
+    config.stash[_COMPARISONS_KEY] = []
+    config.stash[_BASELINE_KEY] = None
+    name = config.getoption("perf_compare", None)
+    if name:
+        store = BaselineStore(Path(config.getoption("perf_store")))
+        config.stash[_BASELINE_KEY] = Baseline(store.load(name))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    config = item.config
+    if not _enabled(config) or not (config.getoption("perf_all") or item.get_closest_marker("performance")):
+        yield
+        return
+
+    with collect_requests() as requests:
+        start = time.perf_counter()
+        outcome = yield
+        wall_ms = (time.perf_counter() - start) * 1000
+    if outcome.excinfo is not None:
+        return
+
+    result = {"wall_ms": round(wall_ms, 3), "requests": requests.count, "endpoints": requests.to_dict()}
+    config.stash[_RESULTS_KEY][item.nodeid] = result
+
+    baseline = config.stash[_BASELINE_KEY]
+    if baseline is None:
+        return
+    rows = baseline.compare(
+        item.nodeid, result, config.getoption("perf_threshold"), config.getoption("perf_min_delta_ms"),
+    )
+    if not rows:
+        return
+    table = format_comparisons(rows)
+    allure.attach(table, name="Performance vs baseline", attachment_type=allure.attachment_type.TEXT)
+
+    config.stash[_COMPARISONS_KEY].extend(rows)
+    if any(row.regression for row in rows):
+        item.stash[_TABLE_KEY] = table
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    table = item.stash.get(_TABLE_KEY, None)
+    if call.when != "call" or table is None or not report.passed:
+        return
+    if item.config.getoption("perf_fail"):
+        report.outcome = "failed"
+        report.longrepr = f"Performance regression against baseline:\n{table}"
+    else:
+        item.warn(pytest.PytestWarning(f"performance regression against baseline:\n{table}"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Контроллер xdist: результаты и сравнения завершившегося воркера."""
+
+    output = getattr(node, "workeroutput", {}).get("perf")
+    if not output:
+        return
+    config = node.config
+    config.stash[_RESULTS_KEY].update(output["results"])
+    config.stash[_COMPARISONS_KEY].extend(Comparison(**row) for row in output["comparisons"])
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    results = config.stash.get(_RESULTS_KEY, {})
+    if hasattr(config, "workerinput"):
+        # Воркер xdist не пишет в хранилище: иначе каждый перезапишет .perf/<name>.json своей частью
+        if _enabled(config):
+            config.workeroutput["perf"] = {
+                "results": results,
+                "comparisons": [asdict(row) for row in config.stash.get(_COMPARISONS_KEY, [])],
+            }
+        return
+    name = config.getoption("perf_save", None)
+    if not name or not results:
+        return
+    run = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+        },
+        "tests": results,
+    }
+    store = BaselineStore(Path(config.getoption("perf_store")))
+    config.stash[_SAVED_KEY] = store.save(name, run, config.getoption("perf_keep"))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _enabled(config):
+        return
+    results = config.stash.get(_RESULTS_KEY, {})
+    terminalreporter.write_sep("-", "performance baseline")
+    baseline = config.stash.get(_BASELINE_KEY, None)
+    if baseline is not None:
+        comparisons = config.stash.get(_COMPARISONS_KEY, [])
+        regressions = [row for row in comparisons if row.regression]
+        terminalreporter.write_line(
+            f"compared {len(results)} tests with '{config.getoption('perf_compare')}' "
+            f"({baseline.runs} runs): {len(regressions)} regressions"
+        )
+        # С -v — таблицы всех тестов, иначе только тестов с регрессиями
+        shown = comparisons if config.option.verbose > 0 else regressions
+        for test in dict.fromkeys(row.test for row in shown):
+            terminalreporter.write_line(test)
+            terminalreporter.write_line(format_comparisons([row for row in comparisons if row.test == test]))
+    saved = config.stash.get(_SAVED_KEY, None)
+    if saved is not None:
+        terminalreporter.write_line(f"saved {len(results)} tests to {saved}")
+
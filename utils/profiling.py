@@ -0,0 +1,252 @@
+"""
+Pytest-плагин: профиль CPU каждого теста — сколько времени ушло на собственный код.
+
+С --profile-client фаза call каждого выбранного теста профилируется, а время
+раскладывается по группам кадров:
+  • client   — src/async_api_client;   • utils   — utils/ проекта;
+  • pydantic — pydantic и pydantic_core; • httpx   — httpx/httpcore/h11/anyio;
+  • io wait  — ожидание сокетов в selectors/epoll (время сервера и сети);
+  • other    — всё остальное (asyncio, allure, stdlib, mock-сервер, сам тест).
+
+Режимы:
+  • cprofile (по умолчанию) — детерминированный cProfile: точные вызовы и
+    собственное время, но замедляет Python-код в 1.5-2 раза. Пишется
+    <test>.pstats (snakeviz, gprof2dot, flameprof);
+  • sample — поток снимает стек теста раз в --profile-interval-ms (пока тест
+    занимает CPU — не чаще sys.getswitchinterval(), 5 мс); накладные расходы
+    малы, пишется <test>.collapsed (flamegraph.pl, speedscope).
+
+    pytest tests/test_posts.py --profile-client
+    pytest -k bulk --profile-client --profile-mode sample --profile-top 30
+
+Таблица горячих функций client/utils/pydantic и разбивка по группам
+прикладываются к тесту в Allure, файлы — в --profile-dir (.profile/).
+"""
+
+import cProfile
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+import allure
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HOT_GROUPS = ("client", "utils", "pydantic")
+GROUPS = (*HOT_GROUPS, "httpx", "io wait", "other")
+
+_CLIENT_DIR = str(PROJECT_ROOT / "src" / "async_api_client")
+_TESTING_DIR = str(PROJECT_ROOT / "src" / "async_api_client" / "testing")
+_UTILS_DIR = str(PROJECT_ROOT / "utils")
+_HTTPX_PACKAGES = ("httpx", "httpcore", "h11", "anyio")
+# Кадры pytest/pluggy над тестом — в flamegraph только шум
+_RUNNER_PACKAGES = ("_pytest", "pluggy", "pytest_asyncio")
+
+_PROFILES_KEY = pytest.StashKey[list]()
+
+FrameKey = tuple[str, int, str]  # файл, строка, функция
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profile-client", "per-test CPU profile")
+    group.addoption("--profile-client", action="store_true", help="profile the call phase of each test")
+    group.addoption("--profile-mode", choices=("cprofile", "sample"), default="cprofile", help="profiler")
+    group.addoption("--profile-dir", default=".profile", help="directory for .pstats / .collapsed files")
+    group.addoption("--profile-top", type=int, default=15, help="hotspots in the Allure table")
+    group.addoption("--profile-interval-ms", type=float, default=1.0, help="sampling period for --profile-mode sample")
+
+
+def _package(filename: str) -> Optional[str]:
+    parts = Path(filename).parts
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            index = parts.index(marker)
+            return parts[index + 1] if index + 1 < len(parts) else None
+    return None
+
+
+def classify(filename: str, function: str) -> str:
+    """Группа кадра (см. GROUPS)."""
+
+    if filename.startswith(_CLIENT_DIR):
+        # testing/ — mock-сервер и транспорты, это «сервер», а не клиент
+        return "other" if filename.startswith(_TESTING_DIR) else "client"
+    if filename.startswith(_UTILS_DIR):
+        return "utils"
+    package = _package(filename)
+    if package in ("pydantic", "pydantic_core"):
+        return "pydantic"
+    if package in _HTTPX_PACKAGES:
+        return "httpx"
+    # Встроенные функции cProfile записывает с файлом "~": <method 'poll' of 'select.epoll' objects>
+    if filename.endswith("selectors.py") or (filename == "~" and ("select." in function or "poll" in function)):
+        return "io wait"
+    return "other"
+
+
+def short_location(key: FrameKey) -> str:
+    filename, line, function = key
+    if filename == "~":
+        return function
+    path = Path(filename)
+    try:
+        shown = str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        package = _package(filename)
+        shown = str(Path(*path.parts[path.parts.index(package):])) if package else path.name
+    return f"{function} ({shown}:{line})"
+
+
+def _breakdown(own: dict[FrameKey, float]) -> dict[str, float]:
+    total = sum(own.values()) or 1.0
+    groups = Counter()
+    for key, value in own.items():
+        groups[classify(key[0], key[2])] += value
+    return {group: groups[group] / total for group in GROUPS}
+
+
+def format_breakdown(shares: dict[str, float]) -> str:
+    return " | ".join(f"{group} {share:.0%}" for group, share in shares.items())
+
+
+def format_hotspots(rows: Iterable[tuple[str, str, float, float, Optional[int]]], unit: str) -> str:
+    """Строки: группа, функция, собственное, накопленное, вызовы (None — неизвестно)."""
+
+    lines = [f"{'group':<9} {'own, ' + unit:>10} {'total, ' + unit:>12} {'calls':>8}  function"]
+    for group, location, own, total, calls in rows:
+        lines.append(f"{group:<9} {own:>10.2f} {total:>12.2f} {calls if calls is not None else '-':>8}  {location}")
+    return "\n".join(lines)
+
+
+class StackSampler:
+    """Сэмплирующий профилировщик одного потока: раз в interval снимает его стек."""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Counter[tuple[FrameKey, ...]] = Counter()
+        self._thread_id = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if _package(code.co_filename) not in _RUNNER_PACKAGES:
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Формат flamegraph.pl / speedscope: "внешний;...;внутренний N"."""
+        return "".join(
+            ";".join(short_location(key).replace(";", ",") for key in stack) + f" {count}\n"
+            for stack, count in self.stacks.most_common()
+        )
+
+    def hotspots(self, top: int, wall_ms: float) -> tuple[str, dict[str, float]]:
+        samples = sum(self.stacks.values()) or 1
+        ms_per_sample = wall_ms / samples
+        own: Counter[FrameKey] = Counter()
+        total: Counter[FrameKey] = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for key in set(stack):
+                total[key] += count
+        rows = [
+            (classify(key[0], key[2]), short_location(key), count * ms_per_sample, total[key] * ms_per_sample, None)
+            for key, count in own.most_common()
+            if classify(key[0], key[2]) in HOT_GROUPS
+        ][:top]
+        return format_hotspots(rows, "ms"), _breakdown(dict(own))
+
+
+def _cprofile_hotspots(profiler: cProfile.Profile, top: int) -> tuple[str, dict[str, float]]:
+    stats = pstats.Stats(profiler).stats
+    own = {key: tt for key, (cc, nc, tt, ct, callers) in stats.items()}
+    rows = [
+        (classify(key[0], key[2]), short_location(key), tt * 1000, ct * 1000, nc)
+        for key, (cc, nc, tt, ct, callers) in sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+        if classify(key[0], key[2]) in HOT_GROUPS
+    ][:top]
+    return format_hotspots(rows, "ms"), _breakdown(own)
+
+
+def _file_stem(nodeid: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+
+
+def pytest_configure(config):
+    config.stash[_PROFILES_KEY] = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    config = item.config
+    if not config.getoption("profile_client"):
+        yield
+        return
+
+    mode = config.getoption("profile_mode")
+    directory = Path(config.getoption("profile_dir"))
+    directory.mkdir(parents=True, exist_ok=True)
+    top = config.getoption("profile_top")
+
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        yield
+        profiler.disable()
+        path = directory / f"{_file_stem(item.nodeid)}.pstats"
+        profiler.dump_stats(path)
+        table, shares = _cprofile_hotspots(profiler, top)
+    else:
+        sampler = StackSampler(config.getoption("profile_interval_ms") / 1000)
+        sampler.start()
+        yield
+        sampler.stop()
+        path = directory / f"{_file_stem(item.nodeid)}.collapsed"
+        path.write_text(sampler.collapsed(), encoding="utf-8")
+        table, shares = sampler.hotspots(top, (time.perf_counter() - start) * 1000)
+
+    wall_ms = (time.perf_counter() - start) * 1000
+    allure.attach(
+        f"{mode}, {wall_ms:.1f} ms: {format_breakdown(shares)}\n\n{table}\n\n{path}",
+        name="CPU profile",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+    config.stash[_PROFILES_KEY].append((item.nodeid, wall_ms, shares))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    profiles = config.stash.get(_PROFILES_KEY, [])
+    if not profiles:
+        return
+    terminalreporter.write_sep("-", "client profile")
+    terminalreporter.write_line(
+        f"{len(profiles)} tests ({config.getoption('profile_mode')}) -> {config.getoption('profile_dir')}/"
+    )
+    for nodeid, wall_ms, shares in profiles:
+        terminalreporter.write_line(f"{wall_ms:9.1f}ms  {format_breakdown(shares)}  {nodeid}")
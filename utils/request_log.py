@@ -0,0 +1,85 @@
+"""
+Pytest-плагин: структурированный журнал запросов прогона (src.async_api_client.request_log).
+
+С --request-log каждый запрос клиента пишется одной JSON-строкой с trace id,
+тестом, методом, шаблоном пути, статусом, временем и размерами — в
+logs/requests/<прогон>/requests-<воркер>-<NNNN>.jsonl. Воркеры pytest-xdist
+пишут каждый в свой файл одного прогона (id прогона передаётся через окружение).
+
+    pytest --request-log
+    pytest -n 4 --request-log --request-log-max-mb 16 --request-log-compress
+    pytest --request-log --request-log-bodies          # + тела запросов для replay
+
+Запросы к журналу — python -m src.async_api_client.request_log_query.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.async_api_client import request_log
+
+_SINK_KEY = pytest.StashKey[Optional[request_log.JSONLSink]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("request-log", "structured request log")
+    group.addoption(
+        "--request-log", nargs="?", const="logs/requests", default=None, metavar="DIR",
+        help="write one JSON line per request (default dir: logs/requests)",
+    )
+    group.addoption("--request-log-max-mb", type=float, default=64.0, help="rotate files at this size")
+    group.addoption("--request-log-compress", action="store_true", help="gzip rotated files")
+    group.addoption("--request-log-bodies", action="store_true", help="also log request bodies (for replay)")
+
+
+def pytest_configure(config):
+    config.stash[_SINK_KEY] = None
+    directory = config.getoption("request_log", None)
+    if directory is None:
+        return
+    # Контроллер xdist задаёт id прогона до запуска воркеров — они наследуют окружение
+    os.environ.setdefault(request_log.RUN_ENV, request_log.run_id())
+    controller = not hasattr(config, "workerinput") and config.getoption("dist", "no") != "no"
+    if not controller:
+        sink = request_log.JSONLSink(
+            Path(directory),
+            max_bytes=int(config.getoption("request_log_max_mb") * 1024 * 1024),
+            compress=config.getoption("request_log_compress"),
+        )
+        request_log.add_sink(sink)
+        request_log.capture_bodies(config.getoption("request_log_bodies"))
+        config.stash[_SINK_KEY] = sink
+
+
+def pytest_unconfigure(config):
+    sink = config.stash.get(_SINK_KEY, None)
+    if sink is not None:
+        request_log.remove_sink(sink)
+        request_log.capture_bodies(False)
+        sink.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if item.config.stash[_SINK_KEY] is None:
+        yield
+        return
+    request_log.set_test(item.nodeid)
+    try:
+        yield
+    finally:
+        request_log.set_test(None)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    directory = config.getoption("request_log", None)
+    if directory is None:
+        return
+    run = os.environ.get(request_log.RUN_ENV)
+    terminalreporter.write_sep("-", "request log")
+    terminalreporter.write_line(
+        f"{Path(directory) / run}/  (python -m src.async_api_client.request_log_query --dir {directory} summary)"
+    )